@@ -0,0 +1,110 @@
+from collections import deque
+
+from aoc.testing import parametrize
+
+
+class Automaton:
+    # Aho-Corasick over a vocabulary of words, each with a value, compiled to a DFA: transitions[state] maps a
+    # character to the next state with the failure links already followed, and a character that's in no word
+    # goes back to the root. matches[state] is the (length, value) of the longest word ending there, or None.
+    __slots__ = ('transitions', 'matches', 'longest')
+
+    def __init__(self, vocabulary: dict[str, object]):
+        if not vocabulary or '' in vocabulary:
+            raise ValueError('An automaton needs at least one word, and no empty ones')
+        self.transitions: list[dict[str, int]] = [{}]
+        self.matches: list[tuple[int, object] | None] = [None]
+        self.longest = max(map(len, vocabulary))
+        for word, value in vocabulary.items():
+            state = 0
+            for char in word:
+                if char not in self.transitions[state]:
+                    self.transitions[state][char] = len(self.transitions)
+                    self.transitions.append({})
+                    self.matches.append(None)
+                state = self.transitions[state][char]
+            self.matches[state] = (len(word), value)
+        # breadth first, so a state's failure state (always shallower) already has all its moves when it's needed
+        failures = [0] * len(self.transitions)
+        queue = deque(self.transitions[0].values())
+        while queue:
+            state = queue.popleft()
+            failure = failures[state]
+            # a word ending here is longer than any ending at the failure state, which is a suffix of it
+            self.matches[state] = self.matches[state] or self.matches[failure]
+            for char, child in self.transitions[state].items():
+                failures[child] = self.transitions[failure].get(char, 0)
+                queue.append(child)
+            for char, target in self.transitions[failure].items():
+                self.transitions[state].setdefault(char, target)
+
+    def first(self, text: str):
+        # the value of the word that starts first in text, the longest if several start there, or None. A match
+        # ending later could still start earlier, so the scan carries on until no word could
+        transitions, matches, longest = self.transitions, self.matches, self.longest
+        state = 0
+        best_start = best_length = None
+        best = None
+        for i, char in enumerate(text):
+            state = transitions[state].get(char, 0)
+            match = matches[state]
+            if match is not None:
+                length, value = match
+                start = i - length + 1
+                if best_start is None or start < best_start or (start == best_start and length > best_length):
+                    best_start, best_length, best = start, length, value
+            if best_start is not None and i - longest + 1 >= best_start:
+                break
+        return best
+
+
+class Scanner:
+    # finds the first and the last word of a vocabulary in a text, each in one pass from its own end
+    __slots__ = ('forward', 'reverse')
+
+    def __init__(self, vocabulary: dict[str, object]):
+        self.forward = Automaton(vocabulary)
+        self.reverse = Automaton({word[::-1]: value for word, value in vocabulary.items()})
+
+    def first(self, text: str):
+        return self.forward.first(text)
+
+    def last(self, text: str):
+        return self.reverse.first(text[::-1])
+
+
+@parametrize('vocabulary, text, first, last', [
+    ({'he': 1, 'she': 2, 'his': 3, 'hers': 4}, 'ushers', 2, 4),
+    ({'one': 1, 'two': 2, 'eight': 8, '1': 1}, 'xtwone1eightwo', 2, 2),
+    ({'ein': 1, 'eins': 11, 'sechs': 6}, 'einsechs', 11, 6),
+    ({'abcd': 1, 'bc': 2}, 'xabcdx', 1, 1),
+    ({'abcd': 1, 'bc': 2}, 'xabcx', 2, 2),
+    ({'aa': 1, 'a': 2}, 'baab', 1, 1),
+    ({'one': 1}, 'nothing here', None, None),
+])
+def test_scanner(vocabulary, text, first, last):
+    scanner = Scanner(vocabulary)
+    assert (scanner.first(text), scanner.last(text)) == (first, last)
+
+
+def test_scanner_matches_a_brute_force_search():
+    import random
+    rng = random.Random(0)
+    for _ in range(300):
+        words = {''.join(rng.choices('abc', k=rng.randint(1, 4))) for _ in range(rng.randint(1, 6))}
+        vocabulary = {word: i for i, word in enumerate(sorted(words))}
+        text = ''.join(rng.choices('abcd', k=rng.randint(0, 15)))
+        found = [(i, -len(word), value) for word, value in vocabulary.items()
+                 for i in range(len(text)) if text.startswith(word, i)]
+        expected_first = min(found)[2] if found else None
+        found = [(-(i + len(word)), -len(word), value) for word, value in vocabulary.items()
+                 for i in range(len(text)) if text.startswith(word, i)]
+        expected_last = min(found)[2] if found else None
+        scanner = Scanner(vocabulary)
+        assert (scanner.first(text), scanner.last(text)) == (expected_first, expected_last), (vocabulary, text)
+
+
+def test_empty_vocabulary():
+    import pytest
+    with pytest.raises(ValueError):
+        Automaton({})
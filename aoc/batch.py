@@ -0,0 +1,152 @@
+import argparse
+import csv
+import glob
+import json
+import os
+import sys
+from dataclasses import asdict, dataclass
+from functools import partial
+from pathlib import Path
+from typing import Iterator
+
+from aoc import memo
+from aoc.days import DAYS, read_source
+from aoc.runner import solve_source
+
+FIELDS = ['file', 'day', 'part', 'answer', 'parse_seconds', 'solve_seconds', 'error']
+
+
+@dataclass
+class BatchRow:
+    file: str
+    day: int
+    part: int | None
+    answer: object = None
+    parse_seconds: float = None
+    solve_seconds: float = None
+    error: str = None
+
+
+def find_inputs(patterns: list[str]) -> list[Path]:
+    # each pattern is a file, a directory (every file in it) or a glob
+    paths = []
+    for pattern in patterns:
+        path = Path(pattern)
+        if path.is_dir():
+            paths += sorted(p for p in path.iterdir() if p.is_file())
+        elif path.is_file():
+            paths.append(path)
+        else:
+            paths += sorted(Path(p) for p in glob.glob(pattern, recursive=True) if Path(p).is_file())
+    return paths
+
+def test_find_inputs(tmp_path):
+    for name in ['b.txt', 'a.txt', 'c.csv']:
+        (tmp_path / name).write_text('')
+    (tmp_path / 'nested').mkdir()
+    assert find_inputs([str(tmp_path)]) == [tmp_path / 'a.txt', tmp_path / 'b.txt', tmp_path / 'c.csv']
+    assert find_inputs([str(tmp_path / '*.txt'), str(tmp_path / 'c.csv')]) == [
+        tmp_path / 'a.txt', tmp_path / 'b.txt', tmp_path / 'c.csv']
+
+
+def solve_file(day: int, parts: tuple[int, ...], path: Path) -> list[BatchRow]:
+    # one bad input shouldn't sink the rest of the batch, so failures become rows
+    try:
+        result = solve_source(day, read_source(path), parts)
+    except Exception as e:
+        return [BatchRow(str(path), day, None, error=f'{type(e).__name__}: {e}')]
+    finally:
+        # memoised results for this input are only taking up memory while the worker waits for its next one
+        memo.clear('input', DAYS[day].modules)
+    return [BatchRow(str(path), day, part.part, part.answer, result.parse_seconds, part.seconds)
+            for part in result.parts]
+
+
+def solve_batch(day: int, parts: tuple[int, ...], paths: list[Path], jobs: int, chunksize: int) -> Iterator[BatchRow]:
+    # yields rows in input order as the chunks complete
+    solve = partial(solve_file, day, parts)
+    if jobs == 1:
+        for path in paths:
+            yield from solve(path)
+        return
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        for rows in pool.map(solve, paths, chunksize=chunksize):
+            yield from rows
+
+def test_solve_batch(tmp_path):
+    (tmp_path / 'real.txt').write_text(DAYS[6].read_source())
+    (tmp_path / 'broken.txt').write_text('Time: 7\n')
+    paths = find_inputs([str(tmp_path)])
+    rows = list(solve_batch(6, (1, 2), paths, jobs=2, chunksize=1))
+    assert [(Path(row.file).name, row.part, row.answer) for row in rows] == [
+        ('broken.txt', None, None), ('real.txt', 1, 4568778), ('real.txt', 2, 28973936)]
+    assert rows[0].error
+    assert rows[1].solve_seconds is not None
+
+
+def test_solve_batch_ignores_a_trailing_newline(tmp_path):
+    # as puzzle downloads do. Part 2 of days 14 and 16 takes seconds, so only their part 1 is checked
+    for number, day in DAYS.items():
+        (tmp_path / f'day{number:02}.txt').write_text(day.read_source() + '\n')
+        parts = (1,) if number in (14, 16) else (1, 2)
+        rows = list(solve_batch(number, parts, [tmp_path / f'day{number:02}.txt'], jobs=1, chunksize=1))
+        expected = solve_source(number, day.read_grids() if day.grid else day.read_source(), parts)
+        assert [(row.part, row.answer, row.error) for row in rows] == [
+            (part.part, part.answer, None) for part in expected.parts], number
+
+
+def write_rows(rows: Iterator[BatchRow], out, format: str) -> int:
+    count = 0
+    writer = csv.DictWriter(out, FIELDS) if format == 'csv' else None
+    if writer:
+        writer.writeheader()
+    for row in rows:
+        if writer:
+            writer.writerow(asdict(row))
+        else:
+            out.write(json.dumps(asdict(row)) + '\n')
+        count += 1
+    return count
+
+def test_write_rows():
+    import io
+    rows = [BatchRow('a.txt', 6, 1, 288, 0.5, 0.25), BatchRow('b.txt', 6, None, error='ValueError: bad')]
+    out = io.StringIO()
+    assert write_rows(iter(rows), out, 'csv') == 2
+    assert out.getvalue().splitlines() == [
+        'file,day,part,answer,parse_seconds,solve_seconds,error',
+        'a.txt,6,1,288,0.5,0.25,',
+        'b.txt,6,,,,,ValueError: bad',
+    ]
+    out = io.StringIO()
+    write_rows(iter(rows[:1]), out, 'jsonl')
+    assert json.loads(out.getvalue())['answer'] == 288
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description='Solve one day for many input files across a process pool')
+    parser.add_argument('day', type=int, choices=sorted(DAYS))
+    parser.add_argument('inputs', nargs='+', help='input files, directories or glob patterns')
+    parser.add_argument('--part', type=int, choices=[1, 2], help='only solve this part (default: both)')
+    parser.add_argument('-o', '--output', type=Path, help='results file, .csv or .jsonl (default: csv to stdout)')
+    parser.add_argument('--format', choices=['csv', 'jsonl'], help='output format (default: from the extension)')
+    parser.add_argument('-j', '--jobs', type=int, default=None, help='worker processes (default: one per core)')
+    parser.add_argument('--chunksize', type=int, default=16, help='inputs handed to a worker at a time')
+    args = parser.parse_args(argv)
+
+    paths = find_inputs(args.inputs)
+    if not paths:
+        parser.error('no input files matched')
+    parts = (args.part,) if args.part else (1, 2)
+    format = args.format or ('jsonl' if args.output and args.output.suffix == '.jsonl' else 'csv')
+    rows = solve_batch(args.day, parts, paths, args.jobs or os.cpu_count() or 1, args.chunksize)
+    if args.output:
+        with open(args.output, 'w', newline='') as out:
+            count = write_rows(rows, out, format)
+        print(f'Wrote {count} results for {len(paths)} inputs to {args.output}')
+    else:
+        write_rows(rows, sys.stdout, format)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,223 @@
+import argparse
+import importlib
+import json
+import math
+import statistics
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from aoc import memo
+from aoc.days import DAYS, ROOT, parse_day_selector
+from aoc.generators import GENERATORS, generate
+from aoc.runner import host_info
+from aoc.testing import parametrize
+
+BASELINE_PATH = ROOT / 'bench_baseline.json'
+
+
+@dataclass
+class Timing:
+    name: str
+    samples_ns: list[int]
+
+    @property
+    def median_ns(self) -> int:
+        return int(statistics.median(self.samples_ns))
+
+    @property
+    def p95_ns(self) -> int:
+        return percentile(self.samples_ns, 95)
+
+    def to_json(self) -> dict:
+        return {'median_ns': self.median_ns, 'p95_ns': self.p95_ns, 'samples': len(self.samples_ns)}
+
+
+def percentile(samples: list[int], pct: float) -> int:
+    # nearest-rank, so the result is always one of the samples
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+@parametrize('samples, pct, expected', [
+    ([5], 95, 5),
+    ([3, 1, 2], 50, 2),
+    (list(range(1, 101)), 95, 95),
+    (list(range(1, 21)), 95, 19),
+])
+def test_percentile(samples, pct, expected):
+    assert percentile(samples, pct) == expected
+
+
+def clear_caches(module_names: tuple[str, ...]) -> None:
+    # memoised helpers would otherwise make every repetition after the first look free
+    for module_name in module_names:
+        importlib.import_module(module_name)  # registers its caches
+    memo.clear('process', module_names)
+
+
+def time_ns(func, *args) -> (int, object):
+    start = time.perf_counter_ns()
+    result = func(*args)
+    return time.perf_counter_ns() - start, result
+
+
+def bench_day(number: int, repeat: int, warmup: int, size: int = None, seed: int = 0) -> list[Timing]:
+    # without a size the checked-in input is used, otherwise a generated one of that size
+    day = DAYS[number]
+    solvers = day.solvers()
+    if size is None:
+        source = day.read_source()
+        prefix = f'day{number:02}'
+    else:
+        source = generate(number, size, seed)
+        solvers = [solver for solver in solvers if solver.part in GENERATORS[number].parts]
+        prefix = f'day{number:02}@{size}'
+    parsers = list(dict.fromkeys(solver.parse for solver in solvers))
+    timings = {f'{prefix}.parse': []}
+    timings.update({f'{prefix}.part{solver.part}': [] for solver in solvers})
+    # work can move between parsing and solving, e.g. number extraction moving into parse(), so the
+    # parse plus solves of each repetition is timed as a whole too
+    timings[f'{prefix}.total'] = []
+    for iteration in range(warmup + repeat):
+        clear_caches(day.modules)
+        parse_ns = 0
+        models = {}
+        for parse in parsers:
+            elapsed, models[parse] = time_ns(parse, source)
+            parse_ns += elapsed
+        samples = {f'{prefix}.parse': parse_ns}
+        for solver in solvers:
+            elapsed, _ = time_ns(solver.solve, models[solver.parse])
+            samples[f'{prefix}.part{solver.part}'] = elapsed
+        samples[f'{prefix}.total'] = sum(samples.values())
+        if iteration >= warmup:
+            for name, elapsed in samples.items():
+                timings[name].append(elapsed)
+    return [Timing(name, samples_ns) for name, samples_ns in timings.items()]
+
+
+def run_benchmarks(days: list[int], repeat: int, warmup: int, sizes: list[int] = None, seed: int = 0) -> list[Timing]:
+    timings = []
+    for day in days:
+        for size in sizes or [None]:
+            day_timings = bench_day(day, repeat, warmup, size, seed)
+            for timing in day_timings:
+                print(f'{timing.name:<18} median {format_ns(timing.median_ns):>10}  p95 {format_ns(timing.p95_ns):>10}')
+            timings += day_timings
+    return timings
+
+
+def format_ns(ns: int) -> str:
+    if ns >= 1_000_000_000:
+        return f'{ns / 1_000_000_000:.2f}s'
+    if ns >= 1_000_000:
+        return f'{ns / 1_000_000:.2f}ms'
+    return f'{ns / 1_000:.1f}us'
+
+@parametrize('ns, expected', [
+    (1_500, '1.5us'),
+    (2_340_000, '2.34ms'),
+    (6_100_000_000, '6.10s'),
+])
+def test_format_ns(ns, expected):
+    assert format_ns(ns) == expected
+
+
+def to_baseline(timings: list[Timing], repeat: int, warmup: int) -> dict:
+    return {
+        'meta': {
+            **host_info(),
+            'repeat': repeat,
+            'warmup': warmup,
+        },
+        'timings': {timing.name: timing.to_json() for timing in timings},
+    }
+
+
+def find_regressions(timings: list[Timing], baseline: dict, threshold: float) -> list[(str, int, int)]:
+    regressions = []
+    for timing in timings:
+        previous = baseline['timings'].get(timing.name)
+        if previous is None:
+            continue
+        if timing.median_ns > previous['median_ns'] * (1 + threshold):
+            regressions.append((timing.name, previous['median_ns'], timing.median_ns))
+    return regressions
+
+def find_improvements(timings: list[Timing], baseline: dict, threshold: float) -> list[(str, int, int)]:
+    improvements = []
+    for timing in timings:
+        previous = baseline['timings'].get(timing.name)
+        if previous is None:
+            continue
+        if timing.median_ns < previous['median_ns'] * (1 - threshold):
+            improvements.append((timing.name, previous['median_ns'], timing.median_ns))
+    return improvements
+
+def test_find_regressions():
+    baseline = {'timings': {
+        'day01.part1': {'median_ns': 1000},
+        'day01.part2': {'median_ns': 1000},
+    }}
+    timings = [
+        Timing('day01.part1', [1050, 1100, 1090]),
+        Timing('day01.part2', [1300, 1200, 1250]),
+        Timing('day02.part1', [9999]),
+    ]
+    assert find_regressions(timings, baseline, 0.1) == [('day01.part2', 1000, 1250)]
+    assert find_improvements([Timing('day01.part1', [800]), *timings[1:]], baseline, 0.1) == [('day01.part1', 1000, 800)]
+
+
+def test_bench_day():
+    timings = bench_day(6, repeat=3, warmup=1)
+    assert [timing.name for timing in timings] == ['day06.parse', 'day06.part1', 'day06.part2', 'day06.total']
+    assert all(len(timing.samples_ns) == 3 for timing in timings)
+    assert timings[3].samples_ns[0] == sum(timing.samples_ns[0] for timing in timings[:3])
+
+
+def test_bench_day_generated():
+    timings = bench_day(6, repeat=1, warmup=0, size=8)
+    assert [timing.name for timing in timings] == ['day06@8.parse', 'day06@8.part1', 'day06@8.total']
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description='Benchmark the parse and solve phases of each day')
+    parser.add_argument('--days', help='days to benchmark, e.g. 12,14,16-21 (default: all)')
+    parser.add_argument('--repeat', type=int, default=5, help='timed repetitions per day')
+    parser.add_argument('--warmup', type=int, default=1, help='untimed repetitions before timing')
+    parser.add_argument('--sizes', help='benchmark generated inputs of these sizes instead, e.g. 100,200,400')
+    parser.add_argument('--seed', type=int, default=0, help='seed for generated inputs')
+    parser.add_argument('--save', nargs='?', const=BASELINE_PATH, type=Path, metavar='PATH',
+                        help=f'write the timings as a baseline (default: {BASELINE_PATH.name})')
+    parser.add_argument('--compare', nargs='?', const=BASELINE_PATH, type=Path, metavar='PATH',
+                        help=f'compare against a saved baseline (default: {BASELINE_PATH.name})')
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help='fractional slowdown of the median that counts as a regression')
+    args = parser.parse_args(argv)
+
+    days = parse_day_selector(args.days)
+    sizes = [int(x) for x in args.sizes.split(',')] if args.sizes else None
+    timings = run_benchmarks(days, args.repeat, args.warmup, sizes, args.seed)
+
+    regressions = []
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = find_regressions(timings, baseline, args.threshold)
+        for name, before, after in find_improvements(timings, baseline, args.threshold):
+            print(f'FASTER {name}: median {format_ns(before)} -> {format_ns(after)} '
+                  f'({(after / before - 1) * 100:.0f}%)')
+        for name, before, after in regressions:
+            print(f'REGRESSION {name}: median {format_ns(before)} -> {format_ns(after)} '
+                  f'(+{(after / before - 1) * 100:.0f}%)')
+        if not regressions:
+            print(f'No regressions beyond {args.threshold:.0%} against {args.compare}')
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump(to_baseline(timings, args.repeat, args.warmup), f, indent=2)
+    return 1 if regressions else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,118 @@
+import ast
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+
+from aoc.days import DAYS, ROOT
+
+CACHE_DIR = ROOT / '.cache' / 'results'
+MAX_CACHE_BYTES = 4 * 1024 ** 2
+
+
+def module_path(name: str) -> Path | None:
+    # our packages are plain directories under ROOT, so a module of ours is a file there and anything else isn't
+    path = ROOT.joinpath(*name.split('.')).with_suffix('.py')
+    return path if path.is_file() else None
+
+
+def imported_paths(path: Path) -> set[Path]:
+    # every module of ours the file imports, at the top or inside a function, read from its syntax tree so that
+    # fingerprinting a day never imports it
+    names = set()
+    for node in ast.walk(ast.parse(path.read_bytes(), str(path))):
+        if isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module:
+            names.add(node.module)
+            names.update(f'{node.module}.{alias.name}' for alias in node.names)  # from day13 import day13
+    return {file for file in map(module_path, names) if file is not None}
+
+
+def source_files(day: int) -> list[Path]:
+    # the day's modules plus anything of ours they import, however indirectly (day14's aoc.grid brings aoc.gridfile)
+    files = set()
+    pending = [module_path(name) for name in DAYS[day].modules]
+    while pending:
+        path = pending.pop()
+        if path in files:
+            continue
+        files.add(path)
+        pending.extend(imported_paths(path))
+    return sorted(files)
+
+def test_source_files():
+    day14 = source_files(14)
+    assert ROOT / 'aoc' / 'grid.py' in day14 and ROOT / 'day14' / 'day14.py' in day14
+    assert ROOT / 'aoc' / 'gridfile.py' in day14  # through aoc.grid
+    assert not any(path.is_relative_to(ROOT / 'day06') for path in day14)
+    assert ROOT / 'day06' / 'day06.py' in source_files(6)
+
+
+def test_source_files_imports_nothing():
+    import subprocess
+    script = ('import sys; from aoc.cache import source_files; source_files(14); '
+              'print(any(name.startswith("day") for name in sys.modules))')
+    assert subprocess.run([sys.executable, '-c', script], cwd=ROOT, capture_output=True, text=True).stdout == 'False\n'
+
+
+def fingerprint(day: int, parts: tuple[int, ...] = (1, 2)) -> str:
+    digest = hashlib.sha256(f'day{day:02} parts {parts} python {sys.version_info[:2]}\n'.encode())
+    digest.update(DAYS[day].input_path.read_bytes())
+    for path in source_files(day):
+        digest.update(path.relative_to(ROOT).as_posix().encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+class ResultCache:
+    # answers keyed by a hash of the input and the solution source, evicting least recently used entries
+    def __init__(self, directory: Path = CACHE_DIR, max_bytes: int = MAX_CACHE_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def path(self, key: str) -> Path:
+        return self.directory / f'{key}.json'
+
+    def get(self, key: str) -> dict | None:
+        path = self.path(key)
+        try:
+            entry = json.loads(path.read_text())
+        except (OSError, ValueError):
+            return None
+        os.utime(path)  # the modification time doubles as the last use for eviction
+        return entry
+
+    def put(self, key: str, entry: dict) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        temporary = self.path(key).with_suffix('.tmp')
+        temporary.write_text(json.dumps(entry))
+        temporary.replace(self.path(key))
+        self.evict()
+
+    def evict(self) -> None:
+        entries = sorted((path.stat().st_mtime_ns, path) for path in self.directory.glob('*.json'))
+        total = sum(path.stat().st_size for _, path in entries)
+        for _, path in entries:
+            if total <= self.max_bytes:
+                break
+            total -= path.stat().st_size
+            path.unlink()
+
+def test_result_cache(tmp_path):
+    cache = ResultCache(tmp_path, max_bytes=100)
+    assert cache.get('a') is None
+    cache.put('a', {'answer': 'x' * 30})
+    cache.put('b', {'answer': 'y' * 30})
+    os.utime(cache.path('a'), ns=(1, 1))
+    os.utime(cache.path('b'), ns=(2, 2))
+    assert cache.get('a') == {'answer': 'x' * 30}  # a is now the most recently used
+    cache.put('c', {'answer': 'z' * 30})
+    assert cache.get('b') is None
+    assert cache.get('a') is not None and cache.get('c') is not None
+
+
+def test_fingerprint_changes_with_parts():
+    assert fingerprint(6) == fingerprint(6)
+    assert fingerprint(6) != fingerprint(6, (1,))
@@ -0,0 +1,50 @@
+import argparse
+import json
+import os
+import socket
+import sys
+from pathlib import Path
+
+# kept free of the solution imports, so asking the daemon costs little more than starting Python
+SOCKET_PATH = Path(os.environ.get('TMPDIR', '/tmp')) / f'aoc2023-{os.getuid()}.sock'
+
+
+def ask(request: dict, path: Path = SOCKET_PATH) -> dict:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.connect(str(path))
+        connection.sendall(json.dumps(request).encode() + b'\n')
+        with connection.makefile('rb') as reply:
+            return json.loads(reply.readline())
+
+
+def format_seconds(seconds: float) -> str:
+    return f'{seconds * 1000:.1f}ms' if seconds < 1 else f'{seconds:.2f}s'
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description='Ask a running aoc.daemon for answers, like main.py but warm')
+    parser.add_argument('--days', help='days to run, e.g. 12,14,16-21 (default: every day the daemon loaded)')
+    parser.add_argument('--part', type=int, choices=[1, 2], help='only this part (default: both)')
+    parser.add_argument('--input', type=Path, help='solve this input file instead of the checked-in one (one day only)')
+    parser.add_argument('--socket', type=Path, default=SOCKET_PATH)
+    parser.add_argument('--shutdown', action='store_true', help='stop the daemon')
+    args = parser.parse_args(argv)
+
+    request = {'shutdown': True} if args.shutdown else {
+        'days': args.days,
+        'parts': [args.part] if args.part else None,
+        'input': str(args.input.resolve()) if args.input else None,  # the daemon has its own working directory
+    }
+    try:
+        reply = ask(request, args.socket)
+    except (FileNotFoundError, ConnectionRefusedError):
+        sys.exit(f'No daemon is listening on {args.socket}, start one with python -m aoc.daemon')
+    if 'error' in reply:
+        sys.exit(reply['error'])
+    for result in reply['results']:
+        parse = f', parse {format_seconds(result["parse_seconds"])}' if result['parse_seconds'] else ''
+        print(f'Day{result["day"]:02} part {result["part"]}: {result["answer"]}  '
+              f'({format_seconds(result["solve_seconds"])}{parse})')
+
+if __name__ == '__main__':
+    main()
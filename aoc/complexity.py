@@ -0,0 +1,149 @@
+import argparse
+import cProfile
+import math
+import pstats
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from aoc.bench import clear_caches
+from aoc.days import DAYS, ROOT, Solver, parse_day_selector
+from aoc.generators import GENERATORS, generate
+from aoc.testing import parametrize
+
+
+@dataclass
+class Scaling:
+    label: str
+    sizes: list[int] = field(default_factory=list)
+    seconds: list[float] = field(default_factory=list)
+    # cumulative seconds of each solution function at each size, keyed by function name
+    functions: dict[str, list[float]] = field(default_factory=dict)
+    error: str = None
+
+    @property
+    def exponent(self) -> float:
+        return fit_exponent(self.sizes, self.seconds)
+
+
+def fit_exponent(sizes: list[int], seconds: list[float]) -> float:
+    # least squares slope of log(time) against log(n)
+    if len(sizes) < 2:
+        return math.nan
+    xs = [math.log(n) for n in sizes]
+    ys = [math.log(max(t, 1e-9)) for t in seconds]
+    mean_x, mean_y = sum(xs) / len(xs), sum(ys) / len(ys)
+    variance = sum((x - mean_x) ** 2 for x in xs)
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / variance
+
+@parametrize('power', [1, 2, 3])
+def test_fit_exponent(power):
+    sizes = [10, 20, 40, 80]
+    seconds = [0.001 * n ** power for n in sizes]
+    assert math.isclose(fit_exponent(sizes, seconds), power)
+
+
+def test_fit_exponent_needs_two_points():
+    assert math.isnan(fit_exponent([10], [1.0]))
+
+
+def is_solution_code(filename: str) -> bool:
+    path = Path(filename)
+    return path.is_relative_to(ROOT) and not path.is_relative_to(ROOT / 'aoc')
+
+
+def profile_solve(solver: Solver, source: str) -> (float, dict[str, float]):
+    model = solver.parse(source)
+    profile = cProfile.Profile()
+    start_time = time.perf_counter()
+    profile.runcall(solver.solve, model)
+    elapsed = time.perf_counter() - start_time
+    functions = {}
+    for (filename, _, name), (_, _, _, cumulative, _) in pstats.Stats(profile).stats.items():
+        if is_solution_code(filename) and name != solver.solve.__name__:
+            functions[name] = functions.get(name, 0.0) + cumulative
+    return elapsed, functions
+
+
+def measure_scaling(day: int, solver: Solver, sizes: list[int], budget: float, seed: int = 0) -> Scaling:
+    scaling = Scaling(f'day{day:02}part{solver.part}')
+    for size in sizes:
+        clear_caches(DAYS[day].modules)
+        source = generate(day, size, seed)
+        try:
+            elapsed, functions = profile_solve(solver, source)
+        except Exception as e:
+            scaling.error = f'failed at n={size}: {type(e).__name__}: {e}'
+            break
+        for name in functions.keys() | scaling.functions.keys():
+            scaling.functions.setdefault(name, [0.0] * len(scaling.sizes)).append(functions.get(name, 0.0))
+        scaling.sizes.append(size)
+        scaling.seconds.append(elapsed)
+        # a bigger size would take at least twice as long again
+        if elapsed > budget:
+            break
+    return scaling
+
+def test_measure_scaling():
+    solver = DAYS[11].solvers()[0]
+    scaling = measure_scaling(11, solver, [10, 20, 40], budget=60)
+    assert scaling.sizes == [10, 20, 40]
+    assert 'sum_of_shortest_paths' in scaling.functions
+    assert len(scaling.functions['sum_of_shortest_paths']) == 3
+
+
+def hot_functions(scaling: Scaling, share: float = 0.05, limit: int = 4) -> list[(str, float, float)]:
+    # the functions taking the most time at the largest size, with their own exponent
+    total = scaling.seconds[-1]
+    hot = []
+    for name, seconds in scaling.functions.items():
+        if seconds[-1] >= share * total and all(s > 0 for s in seconds):
+            hot.append((name, fit_exponent(scaling.sizes, seconds), seconds[-1] / total))
+    return sorted(hot, key=lambda x: -x[2])[:limit]
+
+
+def report(scaling: Scaling) -> list[str]:
+    if len(scaling.sizes) < 2:
+        return [f'{scaling.label} not enough sizes to fit ({scaling.error or "over budget"})']
+    lines = [f'{scaling.label} solve ≈ O(n^{scaling.exponent:.1f})'
+             f'  (n={scaling.sizes[0]}..{scaling.sizes[-1]}, {scaling.seconds[-1]:.2f}s at the largest)']
+    for name, exponent, fraction in hot_functions(scaling):
+        lines.append(f'{scaling.label} {name} ≈ O(n^{exponent:.1f})  ({fraction:.0%} of the time)')
+    if scaling.error:
+        lines.append(f'{scaling.label} {scaling.error}')
+    return lines
+
+def test_report():
+    scaling = Scaling('day10part2', [10, 20], [0.01, 0.08], {
+        'area_enclosed_by_loop': [0.009, 0.072],
+        'take_step2': [0.0001, 0.0002],
+    })
+    assert report(scaling) == [
+        'day10part2 solve ≈ O(n^3.0)  (n=10..20, 0.08s at the largest)',
+        'day10part2 area_enclosed_by_loop ≈ O(n^3.0)  (90% of the time)',
+    ]
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description='Fit the scaling exponent of each solver on generated inputs of sizes n, 2n, 4n, ... '
+                    'where n is the size parameter of that day\'s generator (often a grid side or line count)')
+    parser.add_argument('--days', help='days to profile, e.g. 10,11 (default: all)')
+    parser.add_argument('--steps', type=int, default=4, help='number of sizes, each double the last')
+    parser.add_argument('--base', type=int, help='first size (default: each generator\'s base size)')
+    parser.add_argument('--budget', type=float, default=10.0,
+                        help='stop doubling once a single run takes longer than this many seconds')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    for day in parse_day_selector(args.days):
+        base = args.base or GENERATORS[day].base_size
+        sizes = [base * 2 ** step for step in range(args.steps)]
+        for solver in DAYS[day].solvers():
+            if solver.part not in GENERATORS[day].parts:
+                continue
+            for line in report(measure_scaling(day, solver, sizes, args.budget, args.seed)):
+                print(line)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,134 @@
+import argparse
+import json
+import socketserver
+import threading
+import time
+from pathlib import Path
+
+from aoc import memo
+from aoc.client import SOCKET_PATH
+from aoc.days import DAYS, parse_day_selector, read_source
+
+
+class WarmSolvers:
+    # every day's modules imported and its checked-in input parsed up front, so a request only pays for the solve
+    def __init__(self, days: list[int]):
+        self.solvers = {day: DAYS[day].solvers() for day in days}
+        self.models = {}  # keyed by (day, part), parts sharing a parser share the model
+        for day in days:
+            for (part, model, _) in self.parse(day, DAYS[day].input_path):
+                self.models[day, part] = model
+
+    def parse(self, day: int, path: Path, parts: list[int] | None = None) -> list[(int, object, float)]:
+        source = DAYS[day].read_grids() if DAYS[day].grid and path == DAYS[day].input_path else read_source(path)
+        models = {}
+        parsed = []
+        for solver in self.solvers[day]:
+            if parts and solver.part not in parts:
+                continue
+            parse = solver.parse if isinstance(source, str) else solver.parse_grids
+            parse_seconds = 0.0
+            if parse not in models:
+                start_time = time.perf_counter()
+                models[parse] = parse(source)
+                parse_seconds = time.perf_counter() - start_time
+            parsed.append((solver.part, models[parse], parse_seconds))
+        return parsed
+
+    def solve(self, day: int, parts: list[int] | None = None, input_path: str | None = None) -> list[dict]:
+        if day not in self.solvers:
+            raise ValueError(f'Day{day:02} isn\'t loaded')
+        if input_path:
+            parsed = self.parse(day, Path(input_path), parts)
+        else:
+            parsed = [(solver.part, self.models[day, solver.part], 0.0) for solver in self.solvers[day]
+                      if not parts or solver.part in parts]
+        solvers = {solver.part: solver for solver in self.solvers[day]}
+        memo.clear('input', DAYS[day].modules)  # nothing memoised for one request is trusted by the next
+        results = []
+        for part, model, parse_seconds in parsed:
+            start_time = time.perf_counter()
+            answer = solvers[part].solve(model)
+            results.append({'day': day, 'part': part, 'answer': answer,
+                            'parse_seconds': parse_seconds, 'solve_seconds': time.perf_counter() - start_time})
+        return results
+
+    def handle(self, request: dict) -> dict:
+        # {"days": "1-5", "parts": [2], "input": "/abs/path"} -> {"results": [...]} or {"error": "..."}
+        try:
+            days = parse_day_selector(request['days']) if request.get('days') else sorted(self.solvers)
+            if request.get('input') and len(days) != 1:
+                raise ValueError('An input file can only be given for a single day')
+            results = []
+            for day in days:
+                results += self.solve(day, request.get('parts'), request.get('input'))
+            return {'results': results}
+        except Exception as e:
+            return {'error': f'{type(e).__name__}: {e}'}
+
+def test_warm_solvers(tmp_path):
+    warm = WarmSolvers([6, 14])
+    assert [(r['part'], r['answer']) for r in warm.handle({'days': '6'})['results']] == [(1, 4568778), (2, 28973936)]
+    assert warm.handle({'days': '14', 'parts': [1]})['results'][0]['answer'] == 106990
+    (tmp_path / 'input.txt').write_text('Time:      7  15   30\nDistance:  9  40  200')
+    results = warm.handle({'days': '6', 'input': str(tmp_path / 'input.txt')})['results']
+    assert [r['answer'] for r in results] == [288, 71503]
+    assert [r['day'] for r in warm.handle({})['results']] == [6, 6, 14, 14]
+    assert 'error' in warm.handle({'days': '5'})
+    assert 'error' in warm.handle({'days': '6,14', 'input': str(tmp_path / 'input.txt')})
+
+
+class RequestHandler(socketserver.StreamRequestHandler):
+    # one JSON request per line, answered with one JSON line, until the client hangs up
+    def handle(self):
+        for line in self.rfile:
+            request = json.loads(line)
+            if request.get('shutdown'):
+                self.wfile.write(b'{"results": []}\n')
+                # shutdown() waits for serve_forever() to return, which is what's running this handler
+                threading.Thread(target=self.server.shutdown).start()
+                return
+            self.wfile.write(json.dumps(self.server.warm.handle(request)).encode() + b'\n')
+
+
+class Server(socketserver.UnixStreamServer):
+    def __init__(self, path: Path, warm: WarmSolvers):
+        self.warm = warm
+        super().__init__(str(path), RequestHandler)
+
+
+def test_server_round_trip(tmp_path):
+    from aoc.client import ask
+    path = tmp_path / 'daemon.sock'
+    with Server(path, WarmSolvers([6])) as server:
+        thread = threading.Thread(target=server.serve_forever, kwargs={'poll_interval': 0.01})
+        thread.start()
+        assert [r['answer'] for r in ask({'days': '6', 'parts': [2]}, path)['results']] == [28973936]
+        ask({'shutdown': True}, path)
+        thread.join(timeout=5)
+        assert not thread.is_alive()
+
+
+def serve(path: Path, days: list[int]) -> None:
+    if path.exists():
+        path.unlink()  # left behind by a daemon that didn't exit cleanly
+    start_time = time.perf_counter()
+    warm = WarmSolvers(days)
+    print(f'Loaded {len(days)} days in {time.perf_counter() - start_time:.2f}s, listening on {path}', flush=True)
+    with Server(path, warm) as server:
+        try:
+            server.serve_forever(poll_interval=0.1)
+        finally:
+            path.unlink(missing_ok=True)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description='Keep every day loaded and parsed, answering aoc.client over a Unix socket')
+    parser.add_argument('--days', help='days to load, e.g. 1-15 (default: all)')
+    parser.add_argument('--socket', type=Path, default=SOCKET_PATH)
+    args = parser.parse_args(argv)
+    serve(args.socket, parse_day_selector(args.days))
+
+if __name__ == '__main__':
+    main()
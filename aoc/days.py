@@ -0,0 +1,129 @@
+import importlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+
+ROOT = Path(__file__).parent.parent
+
+
+def read_source(path: Path) -> str:
+    # without the newline a downloaded input ends with: parse() splits on '\n' and would see an empty last line,
+    # and the grid cache drops it too
+    with open(path) as f:
+        return f.read().rstrip('\n')
+
+
+@dataclass(frozen=True)
+class Solver:
+    part: int
+    parse: Callable[[str], Any]
+    solve: Callable[[Any], Any]
+    parse_grids: Callable[[list], Any] = None  # builds the same model from memory mapped grids
+
+
+@dataclass(frozen=True)
+class Day:
+    number: int
+    modules: tuple[str, ...]
+    streaming: bool = False  # lines are solved independently, so solve_partN accepts any iterator of lines
+    grid: bool = False  # the input is one or more grids, loaded from a binary cache by parse_grids
+    memory_budget: int | None = None  # bytes, checked against the tracemalloc peak by main.py --memory
+
+    @property
+    def directory(self) -> Path:
+        return ROOT / f'day{self.number:02}'
+
+    @property
+    def input_path(self) -> Path:
+        return self.directory / 'Input.txt'
+
+    def read_source(self) -> str:
+        return read_source(self.input_path)
+
+    def read_grids(self) -> list:
+        from aoc.gridfile import load_grids
+        return load_grids(self.input_path)
+
+    def solvers(self) -> list[Solver]:
+        solvers = []
+        for module_name in self.modules:
+            module = importlib.import_module(module_name)
+            for part in (1, 2):
+                solve = getattr(module, f'solve_part{part}', None)
+                if solve is not None:
+                    solvers.append(Solver(part, module.parse, solve, getattr(module, 'parse_grids', None)))
+        return solvers
+
+
+DAYS: dict[int, Day] = {day.number: day for day in [
+    Day(1, ('day01.day01part1', 'day01.day01part2'), streaming=True),
+    Day(2, ('day02.day02part1', 'day02.day02part2'), streaming=True),
+    Day(3, ('day03.day03part1', 'day03.day03part2'), grid=True),
+    Day(4, ('day04.day04part1', 'day04.day04part2'), streaming=True),
+    Day(5, ('day05.day05part1', 'day05.day05part2')),
+    Day(6, ('day06.day06',)),
+    Day(7, ('day07.day07part1', 'day07.day07part2')),
+    Day(8, ('day08.day08part1', 'day08.day08part2')),
+    Day(9, ('day09.day09part1', 'day09.day09part2'), streaming=True),
+    Day(10, ('day10.day10part1', 'day10.day10part2'), grid=True),
+    Day(11, ('day11.day11',), grid=True, memory_budget=24 * 1024 ** 2),
+    Day(12, ('day12.day12',), streaming=True, memory_budget=1024 ** 2),
+    Day(13, ('day13.day13',), grid=True),
+    Day(14, ('day14.day14',), grid=True),
+    Day(15, ('day15.day15',)),
+    Day(16, ('day16.day16',), grid=True, memory_budget=24 * 1024 ** 2),
+    Day(18, ('day18.day18',)),
+    Day(19, ('day19.day19part1', 'day19.day19part2')),
+    Day(20, ('day20.day20',)),
+    Day(21, ('day21.day21part1',), grid=True),
+]}
+
+
+def parse_day_selector(selector: str | None) -> list[int]:
+    if not selector:
+        return sorted(DAYS)
+    days = set()
+    for item in selector.split(','):
+        item = item.strip()
+        if not item:
+            continue
+        if '-' in item:
+            first, last = (int(x) for x in item.split('-', 1))
+            if first > last:
+                raise ValueError(f'invalid day range: {item}')
+            # ranges may span days that have no solution (e.g. day17)
+            days.update(day for day in range(first, last + 1) if day in DAYS)
+        else:
+            day = int(item)
+            if day not in DAYS:
+                raise ValueError(f'no solution for day: {day}')
+            days.add(day)
+    return sorted(days)
+
+
+def test_parse_day_selector():
+    assert parse_day_selector('12,14,16-21') == [12, 14, 16, 18, 19, 20, 21]
+
+
+def test_parse_day_selector_all():
+    assert parse_day_selector(None) == sorted(DAYS)
+    assert parse_day_selector('') == sorted(DAYS)
+
+
+def test_parse_day_selector_unknown_day():
+    import pytest
+    with pytest.raises(ValueError):
+        parse_day_selector('17')
+
+
+def test_solvers_share_parse_between_parts():
+    solvers = DAYS[5].solvers()
+    assert [solver.part for solver in solvers] == [1, 2]
+    assert solvers[0].parse is solvers[1].parse
+
+
+def test_every_day_has_an_input_and_solvers():
+    for day in DAYS.values():
+        assert day.input_path.exists()
+        assert day.solvers()
@@ -0,0 +1,184 @@
+import argparse
+import copy
+import importlib
+import random
+import sys
+import time
+from dataclasses import dataclass, replace
+from typing import Callable
+
+from aoc import memo
+from aoc.generators import generate, generate_day12, random_grid
+from aoc.testing import parametrize
+
+
+@dataclass(frozen=True)
+class Pair:
+    # a slow path kept as the reference, and the fast path that replaced it in the solution, which must agree
+    name: str
+    module: str
+    reference: str
+    fast: str
+    cases: Callable[[random.Random, int], list[tuple]]  # argument tuples to call both with, for a size
+    sizes: tuple[int, ...]
+
+    def functions(self) -> (Callable, Callable):
+        module = importlib.import_module(self.module)
+        return getattr(module, self.reference), getattr(module, self.fast)
+
+
+@dataclass
+class Comparison:
+    name: str
+    size: int
+    cases: int
+    reference_ns: int
+    fast_ns: int
+
+    @property
+    def speedup(self) -> float:
+        return self.reference_ns / max(self.fast_ns, 1)
+
+    def __str__(self) -> str:
+        return (f'{self.name} n={self.size}: {self.cases} cases agree, reference {self.reference_ns / 1e6:.1f}ms, '
+                f'fast {self.fast_ns / 1e6:.1f}ms, {self.speedup:.1f}x')
+
+
+class Mismatch(AssertionError):
+    pass
+
+
+def random_hand(rng: random.Random) -> str:
+    # drawn from a few cards, so every rank turns up
+    cards = rng.sample('AKQJT98765432', rng.randint(1, 5))
+    return ''.join(rng.choices(cards, k=5))
+
+def calibration_cases(rng: random.Random, size: int) -> list[tuple]:
+    # size: number of lines of a generated day01 input
+    return [(line,) for line in generate(1, size, rng.randrange(1000)).split('\n')]
+
+
+def schematic_cases(rng: random.Random, size: int) -> list[tuple]:
+    # size: side of the schematic. A generated day03 one, and random ones dense with digits and with symbols on
+    # every edge, where numbers touch several symbols and each other
+    from aoc.grid import Grid
+    cases = [(Grid.from_text(generate(3, size, rng.randrange(1000))),)]
+    for _ in range(3):
+        cases.append((Grid.from_rows(random_grid(size, rng, {'.': 4, '1': 1, '2': 1, '7': 1, '*': 1, '#': 0.5})),))
+    return cases
+
+
+def hand_list_cases(rng: random.Random, size: int) -> list[tuple]:
+    # size: number of lines, with some hands dealt twice so the order of ties is checked too
+    hands = [random_hand(rng) for _ in range(size)]
+    hands += rng.choices(hands, k=size // 10)
+    return [([f'{hand} {rng.randint(1, 1000)}' for hand in hands],)]
+
+
+def region_cases(rng: random.Random, size: int) -> list[tuple]:
+    # size: side of the grid. Both regions either side of a generated day10 loop, and random regions, half of
+    # them walled in so they can't leak off the grid
+    from aoc.grid import Grid
+    from day10.day10part1 import parse
+    from day10.day10part2 import mark_regions
+    grid, start_char = parse(generate(10, size, rng.randrange(1000)))
+    cases = [(region,) for region in mark_regions(grid.copy(), start_char)]
+    for _ in range(4):
+        rows = random_grid(size, rng, {'.': 6, '#': 3, 'O': 1})
+        if rng.random() < 0.5:
+            rows = ['#' * size] + ['#' + row[1:-1] + '#' for row in rows[1:-1]] + ['#' * size]
+        cases.append((Grid.from_rows(rows),))
+    return cases
+
+
+def garden_cases(rng: random.Random, size: int) -> list[tuple]:
+    # size: side of the garden, with the elf spread over a few plots already
+    from aoc.grid import Grid
+    return [(Grid.from_rows(random_grid(size, rng, {'.': 8, '#': 2, 'O': 1, 'S': 0.1})),) for _ in range(3)]
+
+
+def spring_cases(rng: random.Random, size: int) -> list[tuple]:
+    # size: length of each row, as with the day12 generator, plus each row unfolded as in part 2
+    from day12.day12 import split_row, unfold_input
+    rows = [split_row(line) for line in generate_day12(size, rng, rows=10).split('\n')]
+    return rows + [unfold_input(*row) for row in rows]
+
+
+# one per fast path a solution has switched to
+PAIRS: dict[str, Pair] = {pair.name: pair for pair in [
+    Pair('day01.calc', 'day01.day01part2', 'calc', 'calc_scanned', calibration_cases, (100, 1000, 10000)),
+    Pair('day03.part_numbers', 'day03.day03part1', 'calc', 'calc_indexed', schematic_cases, (20, 70, 140)),
+    Pair('day03.gear_ratios', 'day03.day03part2', 'calc', 'calc_indexed', schematic_cases, (20, 70, 140)),
+    Pair('day07.sort_lines', 'day07.day07part1', 'sort_lines', 'sort_lines_by_key', hand_list_cases,
+         (100, 1000, 10000)),
+    Pair('day10.expand_and_count_region', 'day10.day10part2', 'expand_and_count_region', 'fill_and_count_region',
+         region_cases, (20, 40, 80)),
+    Pair('day12.recursive_count_arrangements', 'day12.day12', 'recursive_count_arrangements',
+         'table_count_arrangements', spring_cases, (10, 20, 40)),
+    Pair('day21.take_step', 'day21.day21part1', 'take_step', 'take_step_from_frontier', garden_cases,
+         (20, 50, 130)),
+]}
+
+
+def timed(pair: Pair, func: Callable, args: tuple) -> (int, object):
+    # each side gets its own copy of arguments it might write to, and starts with nothing memoised
+    args = copy.deepcopy(args)
+    memo.clear('input', [pair.module])
+    start = time.perf_counter_ns()
+    result = func(*args)
+    return time.perf_counter_ns() - start, result
+
+
+def compare(pair: Pair, size: int, seed: int = 0) -> Comparison:
+    reference, fast = pair.functions()
+    rng = random.Random(f'{pair.name}:{size}:{seed}')
+    cases = pair.cases(rng, size)
+    reference_ns = fast_ns = 0
+    for args in cases:
+        elapsed, expected = timed(pair, reference, args)
+        reference_ns += elapsed
+        elapsed, actual = timed(pair, fast, args)
+        fast_ns += elapsed
+        if actual != expected:
+            raise Mismatch(f'{pair.name} n={size}: {pair.fast}{args!r} returned {actual!r}, '
+                           f'but {pair.reference} returned {expected!r}')
+    return Comparison(pair.name, size, len(cases), reference_ns, fast_ns)
+
+
+@parametrize('name', sorted(PAIRS))
+def test_fast_paths_agree(name):
+    comparison = compare(PAIRS[name], PAIRS[name].sizes[0], seed=1)
+    assert comparison.cases > 0 and comparison.reference_ns > 0
+
+
+def test_mismatch_names_the_case():
+    import pytest
+    pair = Pair('abs', 'builtins', 'abs', 'abs', lambda rng, size: [(size,), (-size,)], (1,))
+    assert compare(pair, 1).cases == 2
+    with pytest.raises(Mismatch, match=r'int\(-1,\) returned -1, but abs returned 1'):
+        compare(replace(pair, fast='int'), 1)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description='Check each fast path against the reference it replaced on random inputs, and time both')
+    parser.add_argument('--pairs', help=f'comma separated pair names (default: all of {", ".join(PAIRS)})')
+    parser.add_argument('--sizes', help='comma separated sizes (default: each pair\'s own)')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    names = args.pairs.split(',') if args.pairs else list(PAIRS)
+    unknown = [name for name in names if name not in PAIRS]
+    if unknown:
+        parser.error(f'unknown pairs: {", ".join(unknown)}')
+    for name in names:
+        sizes = [int(size) for size in args.sizes.split(',')] if args.sizes else PAIRS[name].sizes
+        for size in sizes:
+            try:
+                print(compare(PAIRS[name], size, args.seed), flush=True)
+            except Mismatch as e:
+                print(f'MISMATCH {e}')
+                sys.exit(1)
+
+if __name__ == '__main__':
+    main()
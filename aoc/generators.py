@@ -0,0 +1,549 @@
+import argparse
+import random
+import string
+import sys
+from dataclasses import dataclass
+from typing import Callable
+
+from aoc.days import DAYS
+from aoc.testing import parametrize
+
+
+@dataclass(frozen=True)
+class Generator:
+    day: int
+    generate: Callable[..., str]
+    # parts that can be solved at any size, e.g. day20 part 2 needs a counter small enough to roll over
+    parts: tuple[int, ...] = (1, 2)
+    # a size that solves in a few milliseconds, as the starting point for scaling sweeps
+    base_size: int = 100
+
+
+def generate(day: int, size: int, seed: int = 0, **options) -> str:
+    # seeding with a string is stable across processes, unlike hash()
+    rng = random.Random(f'day{day:02}:{size}:{seed}')
+    return GENERATORS[day].generate(size, rng, **options)
+
+
+def random_name(rng: random.Random, taken: set[str], min_length: int = 2, max_length: int = 4) -> str:
+    while True:
+        name = ''.join(rng.choices(string.ascii_lowercase, k=rng.randint(min_length, max_length)))
+        if name not in taken:
+            taken.add(name)
+            return name
+
+
+def random_grid(size: int, rng: random.Random, weights: dict[str, float]) -> list[str]:
+    chars, char_weights = list(weights.keys()), list(weights.values())
+    return [''.join(rng.choices(chars, char_weights, k=size)) for _ in range(size)]
+
+
+def random_column_convex_shape(width: int, height: int, rng: random.Random) -> (list[int], list[int]):
+    # each column covers rows [top, bottom) and overlaps its neighbour, so the outline is a simple polygon
+    tops = [rng.randrange(0, height - 1)]
+    bottoms = [rng.randrange(tops[0] + 1, height + 1)]
+    for _ in range(width - 1):
+        top = rng.randrange(0, bottoms[-1])
+        bottom = rng.randrange(max(tops[-1], top) + 1, height + 1)
+        tops.append(top)
+        bottoms.append(bottom)
+    return tops, bottoms
+
+
+def outline(tops: list[int], bottoms: list[int]) -> list[(str, int)]:
+    # clockwise walk (rows grow downwards) starting at the top left corner, heading right
+    moves = []
+    width = len(tops)
+    for x in range(width):
+        moves.append(('R', 1))
+        if x + 1 < width:
+            moves.append(('D' if tops[x + 1] > tops[x] else 'U', abs(tops[x + 1] - tops[x])))
+    moves.append(('D', bottoms[-1] - tops[-1]))
+    for x in reversed(range(width)):
+        moves.append(('L', 1))
+        if x > 0:
+            moves.append(('D' if bottoms[x - 1] > bottoms[x] else 'U', abs(bottoms[x - 1] - bottoms[x])))
+    moves.append(('U', bottoms[0] - tops[0]))
+    merged = []
+    for direction, length in moves:
+        if length == 0:
+            continue
+        if merged and merged[-1][0] == direction:
+            merged[-1] = (direction, merged[-1][1] + length)
+        else:
+            merged.append((direction, length))
+    return merged
+
+def test_outline():
+    # a 2x2 square is a single rectangle
+    assert outline([0, 0], [2, 2]) == [('R', 2), ('D', 2), ('L', 2), ('U', 2)]
+    # an L shape
+    assert outline([0, 1], [2, 2]) == [('R', 1), ('D', 1), ('R', 1), ('D', 1), ('L', 2), ('U', 2)]
+
+
+def generate_day01(size: int, rng: random.Random) -> str:
+    # size: number of lines
+    words = ['one', 'two', 'three', 'four', 'five', 'six', 'seven', 'eight', 'nine']
+    lines = []
+    for _ in range(size):
+        pieces = []
+        for _ in range(rng.randint(2, 8)):
+            roll = rng.random()
+            if roll < 0.3:
+                pieces.append(rng.choice(string.digits[1:]))
+            elif roll < 0.5:
+                pieces.append(rng.choice(words))
+            else:
+                pieces.append(''.join(rng.choices(string.ascii_lowercase, k=rng.randint(1, 5))))
+        # part 1 needs at least one real digit on every line
+        pieces.insert(rng.randint(0, len(pieces)), rng.choice(string.digits[1:]))
+        lines.append(''.join(pieces))
+    return '\n'.join(lines)
+
+
+def generate_day02(size: int, rng: random.Random) -> str:
+    # size: number of games
+    lines = []
+    for game in range(1, size + 1):
+        subsets = []
+        for _ in range(rng.randint(1, 6)):
+            colours = rng.sample(['red', 'green', 'blue'], rng.randint(1, 3))
+            subsets.append(', '.join(f'{rng.randint(1, 20)} {colour}' for colour in colours))
+        lines.append(f'Game {game}: ' + '; '.join(subsets))
+    return '\n'.join(lines)
+
+
+def generate_day03(size: int, rng: random.Random) -> str:
+    # size: side of the square schematic
+    symbols = '*#+$/=%@&-'
+    rows = []
+    for i in range(size):
+        row = []
+        while len(row) < size:
+            roll = rng.random()
+            if roll < 0.08:
+                row.extend(str(rng.randint(1, 999)))
+                row.append('.')
+            # day03 looks one past the last row and column around symbols, so keep them off those edges
+            elif roll < 0.11 and i < size - 1 and len(row) < size - 1:
+                row.append(rng.choice(symbols))
+            else:
+                row.append('.')
+        row = row[:size]
+        if row[-1].isdigit():
+            # don't leave a truncated number behind
+            while row and row[-1].isdigit():
+                row.pop()
+            row.extend('.' * (size - len(row)))
+        rows.append(''.join(row))
+    return '\n'.join(rows)
+
+
+def generate_day04(size: int, rng: random.Random, winners: int = 10, ours: int = 25) -> str:
+    # size: number of cards
+    lines = []
+    for card in range(1, size + 1):
+        # a card can't win copies of cards past the end of the table
+        matches = rng.randint(0, min(winners, size - card, 5))
+        numbers = rng.sample(range(1, 100), winners + ours - matches)
+        winning = numbers[:winners]
+        our_numbers = winning[:matches] + numbers[winners:]
+        rng.shuffle(our_numbers)
+        lines.append(
+            f'Card {card:>4}: ' + ' '.join(f'{x:>2}' for x in winning)
+            + ' | ' + ' '.join(f'{x:>2}' for x in our_numbers)
+        )
+    return '\n'.join(lines)
+
+
+def generate_day05(size: int, rng: random.Random, seed_ranges: int = 10) -> str:
+    # size: number of ranges in each of the seven maps
+    limit = 2 ** 32
+    seeds = []
+    for _ in range(seed_ranges):
+        length = rng.randint(1, limit // (4 * seed_ranges))
+        seeds += [rng.randrange(0, limit - length), length]
+    sections = ['seeds: ' + ' '.join(str(x) for x in seeds)]
+    names = ['seed', 'soil', 'fertilizer', 'water', 'light', 'temperature', 'humidity', 'location']
+    for source_name, dest_name in zip(names, names[1:]):
+        # source ranges within a map never overlap
+        points = sorted(rng.sample(range(limit), 2 * size))
+        lines = []
+        for start, end in zip(points[::2], points[1::2]):
+            length = end - start + 1
+            lines.append(f'{rng.randrange(0, limit - length)} {start} {length}')
+        rng.shuffle(lines)
+        sections.append(f'{source_name}-to-{dest_name} map:\n' + '\n'.join(lines))
+    return '\n\n'.join(sections)
+
+
+def generate_day06(size: int, rng: random.Random) -> str:
+    # size: number of races
+    times = [rng.randint(10, 100) for _ in range(size)]
+    distances = [rng.randint(1, t * t // 4 - 1) for t in times]
+    return ('Time:     ' + ' '.join(f'{t:>4}' for t in times) + '\n'
+            + 'Distance: ' + ' '.join(f'{d:>4}' for d in distances))
+
+
+def generate_day07(size: int, rng: random.Random) -> str:
+    # size: number of hands
+    cards = 'AKQJT98765432'
+    return '\n'.join(f"{''.join(rng.choices(cards, k=5))} {rng.randint(1, 1000)}" for _ in range(size))
+
+
+def generate_day08(size: int, rng: random.Random, ghosts: int = 6) -> str:
+    # size: number of nodes. Each ghost walks its own loop, so the answer is the lcm of the loop lengths
+    names = [a + b + c for a in string.ascii_uppercase for b in string.ascii_uppercase
+             for c in string.ascii_uppercase[1:-1]]
+    ghosts = max(1, min(ghosts, size // 3))
+    inner = size - 2 * ghosts
+    if inner > len(names):
+        raise ValueError(f'day08 node names only allow {len(names) + 2 * ghosts} nodes')
+    inner_names = rng.sample(names, inner)
+    prefixes = ['AA'] + rng.sample([a + b for a in string.ascii_uppercase for b in string.ascii_uppercase
+                                    if a + b not in ('AA', 'ZZ')], ghosts - 1)
+    cuts = sorted(rng.sample(range(1, inner), ghosts - 1)) if ghosts > 1 else []
+    nodes = []
+    for prefix, start, end in zip(prefixes, [0] + cuts, cuts + [inner]):
+        loop = inner_names[start:end]
+        first, last = prefix + 'A', ('ZZ' if prefix == 'AA' else prefix) + 'Z'
+        path = [first] + loop + [last]
+        for name, next_name in zip(path, path[1:]):
+            nodes.append(f'{name} = ({next_name}, {next_name})')
+        nodes.append(f'{last} = ({loop[0]}, {loop[0]})')
+    rng.shuffle(nodes)
+    directions = ''.join(rng.choices('LR', k=rng.randint(200, 300)))
+    return directions + '\n\n' + '\n'.join(nodes)
+
+
+def generate_day09(size: int, rng: random.Random, length: int = 21) -> str:
+    # size: number of sequences, each a polynomial of degree at most 6
+    lines = []
+    for _ in range(size):
+        coefficients = [rng.randint(-5, 5) for _ in range(rng.randint(1, 7))]
+        values = [sum(c * x ** i for i, c in enumerate(coefficients)) for x in range(length)]
+        lines.append(' '.join(str(v) for v in values))
+    return '\n'.join(lines)
+
+
+def generate_day10(size: int, rng: random.Random) -> str:
+    # size: side of the square sketch. The loop follows the outline of a random shape, with junk pipe all around
+    width = height = size - 3
+    if width < 1:
+        raise ValueError('day10 needs a size of at least 4')
+    tops, bottoms = random_column_convex_shape(width, height, rng)
+    steps = {'R': (0, 1), 'L': (0, -1), 'D': (1, 0), 'U': (-1, 0)}
+    pipes = {
+        frozenset('UD'): '|', frozenset('LR'): '-', frozenset('UR'): 'L',
+        frozenset('UL'): 'J', frozenset('DL'): '7', frozenset('DR'): 'F',
+    }
+    opposite = {'R': 'L', 'L': 'R', 'U': 'D', 'D': 'U'}
+    path = []
+    for direction, length in outline(tops, bottoms):
+        path += [direction] * length
+    rows = [list(row) for row in random_grid(size, rng, {'.': 6, '|': 1, '-': 1, 'L': 1, 'J': 1, '7': 1, 'F': 1})]
+    position = (tops[0] + 1, 1)
+    loop = []
+    for arriving, leaving in zip(path[-1:] + path[:-1], path):
+        i, j = position
+        rows[i][j] = pipes[frozenset([opposite[arriving], leaving])]
+        loop.append(position)
+        position = (i + steps[leaving][0], j + steps[leaving][1])
+    i, j = rng.choice(loop)
+    rows[i][j] = 'S'
+    on_loop = set(loop)
+    # only the two loop pipes may connect to S
+    for x, y in [(i - 1, j), (i + 1, j), (i, j - 1), (i, j + 1)]:
+        if (x, y) not in on_loop:
+            rows[x][y] = '.'
+    return '\n'.join(''.join(row) for row in rows)
+
+
+def generate_day11(size: int, rng: random.Random) -> str:
+    # size: side of the square image
+    rows = [list(row) for row in random_grid(size, rng, {'.': 49, '#': 1})]
+    for i in rng.sample(range(size), size // 20):
+        rows[i] = ['.'] * size
+    for j in rng.sample(range(size), size // 20):
+        for row in rows:
+            row[j] = '.'
+    if not any('#' in row for row in rows):
+        rows[0][0] = '#'
+    return '\n'.join(''.join(row) for row in rows)
+
+
+def generate_day12(size: int, rng: random.Random, rows: int = 100, groups: int = None) -> str:
+    # size: length of each row of springs, e.g. 200 with the default of 30 groups
+    groups = groups or max(1, size * 3 // 20)
+    if 2 * groups - 1 > size:
+        raise ValueError(f'{groups} groups of damaged springs do not fit in {size}')
+    lines = []
+    for _ in range(rows):
+        sizes = [1] * groups
+        for _ in range(rng.randint(0, size - (2 * groups - 1))):
+            sizes[rng.randrange(groups)] += 1
+        gaps = [0] + [1] * (groups - 1) + [0]
+        for _ in range(size - sum(sizes) - (groups - 1)):
+            gaps[rng.randrange(groups + 1)] += 1
+        springs = '.' * gaps[0] + ''.join('#' * s + '.' * g for s, g in zip(sizes, gaps[1:]))
+        masked = ''.join('?' if rng.random() < 0.4 else c for c in springs)
+        lines.append(masked + ' ' + ','.join(str(s) for s in sizes))
+    return '\n'.join(lines)
+
+
+def is_valid_day13_pattern(pattern: list[str]) -> bool:
+    from day13.day13 import find_mirror_with_transpose
+    from aoc.grid import Grid
+    try:
+        find_mirror_with_transpose(Grid.from_rows(pattern), False)
+        find_mirror_with_transpose(Grid.from_rows(pattern), True)
+    except Exception:
+        return False
+    return True
+
+
+def random_day13_pattern(size: int, rng: random.Random) -> list[str]:
+    height = rng.randint(max(4, size - 2), size + 2)
+    width = rng.randint(max(4, size - 2), size + 2)
+    # rows reflect perfectly about a line near the top, for part 1
+    mirror = rng.randrange(0, (height - 2) // 2)
+    reflected = 2 * (mirror + 1)
+    # columns reflect about another line with exactly one smudge, for part 2,
+    # placed in a row the horizontal reflection doesn't reach
+    column_mirror = rng.randrange(0, width - 1)
+    half = [''.join(rng.choices('.#', k=width)) for _ in range(height - reflected + mirror + 1)]
+    rows = []
+    for row in half:
+        cells = list(row)
+        for j in range(column_mirror + 1):
+            k = 2 * column_mirror + 1 - j
+            if k < width:
+                cells[k] = cells[j]
+        rows.append(''.join(cells))
+    rows = rows[:mirror + 1][::-1] + rows
+    smudge_row = rng.randrange(reflected, height)
+    smudge_col = rng.randrange(0, min(column_mirror + 1, width - column_mirror - 1))
+    cells = list(rows[smudge_row])
+    cells[smudge_col] = '#' if cells[smudge_col] == '.' else '.'
+    rows[smudge_row] = ''.join(cells)
+    return rows
+
+
+def generate_day13(size: int, rng: random.Random, patterns: int = 50) -> str:
+    # size: rough side of each pattern
+    if size < 5:
+        raise ValueError('day13 needs a size of at least 5')
+    from aoc.grid import Grid
+    results = []
+    while len(results) < patterns:
+        pattern = random_day13_pattern(size, rng)
+        if rng.random() < 0.5:
+            pattern = Grid.from_rows(pattern).transposed().rows()
+        # random rows can line up into a second mirror, so check with the solver
+        if is_valid_day13_pattern(pattern):
+            results.append('\n'.join(pattern))
+    return '\n\n'.join(results)
+
+
+def generate_day14(size: int, rng: random.Random) -> str:
+    # size: side of the square platform
+    return '\n'.join(random_grid(size, rng, {'.': 13, 'O': 4, '#': 3}))
+
+
+def generate_day15(size: int, rng: random.Random) -> str:
+    # size: number of steps in the initialization sequence
+    taken = set()
+    labels = [random_name(rng, taken, 2, 6) for _ in range(max(1, size // 4))]
+    steps = []
+    for _ in range(size):
+        label = rng.choice(labels)
+        steps.append(f'{label}-' if rng.random() < 0.3 else f'{label}={rng.randint(1, 9)}')
+    return ','.join(steps)
+
+
+def generate_day16(size: int, rng: random.Random) -> str:
+    # size: side of the square contraption
+    return '\n'.join(random_grid(size, rng, {'.': 36, '/': 1, '\\': 1, '|': 1, '-': 1}))
+
+
+def generate_day18(size: int, rng: random.Random) -> str:
+    # size: number of columns in the random shape being dug, roughly a quarter of the number of steps.
+    # Part 2's plan in the colour codes is the same outline stretched by different amounts per row and column,
+    # which keeps it closed and non-intersecting
+    height = max(2, size)
+    tops, bottoms = random_column_convex_shape(size, height, rng)
+    moves = outline(tops, bottoms)
+    longest = max(length for _, length in moves)
+    # lengths are stretched in units so the hex distance stays within five digits
+    scale = max(1, 0xFFFFF // (longest * 2))
+    column_widths = [rng.randint(1, 10) for _ in range(size)]
+    row_heights = [rng.randint(1, 10) for _ in range(height)]
+    big_column_widths = [rng.randint(scale // 2 or 1, scale) for _ in range(size)]
+    big_row_heights = [rng.randint(scale // 2 or 1, scale) for _ in range(height)]
+    codes = {'R': 0, 'D': 1, 'L': 2, 'U': 3}
+    lines = []
+    x, y = 0, tops[0]
+    for direction, length in moves:
+        if direction == 'R':
+            span = range(x, x + length)
+            widths, big_widths, x = column_widths, big_column_widths, x + length
+        elif direction == 'L':
+            span = range(x - length, x)
+            widths, big_widths, x = column_widths, big_column_widths, x - length
+        elif direction == 'D':
+            span = range(y, y + length)
+            widths, big_widths, y = row_heights, big_row_heights, y + length
+        else:
+            span = range(y - length, y)
+            widths, big_widths, y = row_heights, big_row_heights, y - length
+        distance = sum(widths[i] for i in span)
+        big_distance = sum(big_widths[i] for i in span)
+        lines.append(f'{direction} {distance} (#{big_distance:05x}{codes[direction]})')
+    return '\n'.join(lines)
+
+
+def generate_day19(size: int, rng: random.Random, parts: int = None) -> str:
+    # size: number of workflows, arranged as a tree below 'in' like the real thing
+    taken = {'in'}
+    names = ['in'] + [random_name(rng, taken) for _ in range(size - 1)]
+    next_workflow = 1
+    workflows = []
+    for name in names:
+        rules = []
+        destinations = rng.randint(2, 4)
+        for rule in range(destinations):
+            if next_workflow < size:
+                destination = names[next_workflow]
+                next_workflow += 1
+            else:
+                destination = rng.choice('AR')
+            if rule == destinations - 1:
+                rules.append(destination)
+            else:
+                rules.append(f"{rng.choice('xmas')}{rng.choice('<>')}{rng.randint(1, 4000)}:{destination}")
+        workflows.append(f"{name}{{{','.join(rules)}}}")
+    rng.shuffle(workflows)
+    ratings = [
+        '{' + ','.join(f'{field}={rng.randint(1, 4000)}' for field in 'xmas') + '}'
+        for _ in range(parts or size)
+    ]
+    return '\n'.join(workflows) + '\n\n' + '\n'.join(ratings)
+
+
+def generate_day20(size: int, rng: random.Random) -> str:
+    # size: number of modules. Like the real thing, four flip-flop counters each reset by a conjunction
+    # feed an inverter into the conjunction in front of rx
+    inverters = ['mf', 'fz', 'fh', 'ss']
+    bits = max(2, (size - 10) // 4)
+    taken = set(inverters) | {'ql', 'rx', 'button', 'broadcaster'}
+    lines = []
+    firsts = []
+    for inverter in inverters:
+        flip_flops = [random_name(rng, taken, 3, 5) for _ in range(bits)]
+        hub = random_name(rng, taken, 3, 5)
+        target = [1] + [rng.randint(0, 1) for _ in range(bits - 2)] + [1]
+        for i, flip_flop in enumerate(flip_flops):
+            destinations = flip_flops[i + 1:i + 2] + ([hub] if target[i] else [])
+            lines.append(f"%{flip_flop} -> {', '.join(destinations)}")
+        resets = [flip_flops[0]] + [flip_flop for flip_flop, bit in zip(flip_flops, target) if not bit]
+        lines.append(f"&{hub} -> {', '.join(resets + [inverter])}")
+        lines.append(f'&{inverter} -> ql')
+        firsts.append(flip_flops[0])
+    lines.append('&ql -> rx')
+    rng.shuffle(lines)
+    return '\n'.join([f"broadcaster -> {', '.join(firsts)}"] + lines)
+
+
+def generate_day21(size: int, rng: random.Random) -> str:
+    # size: side of the square garden
+    rows = [list(row) for row in random_grid(size, rng, {'.': 9, '#': 1})]
+    rows[size // 2][size // 2] = 'S'
+    return '\n'.join(''.join(row) for row in rows)
+
+
+GENERATORS: dict[int, Generator] = {generator.day: generator for generator in [
+    Generator(1, generate_day01, base_size=1000),
+    Generator(2, generate_day02, base_size=1000),
+    Generator(3, generate_day03, base_size=40),
+    Generator(4, generate_day04, base_size=500),
+    Generator(5, generate_day05, base_size=50),
+    # part 2 joins every race into one, which overflows a float beyond a handful of races
+    Generator(6, generate_day06, parts=(1,), base_size=100),
+    Generator(7, generate_day07, base_size=500),
+    Generator(8, generate_day08, base_size=500),
+    Generator(9, generate_day09, base_size=200),
+    Generator(10, generate_day10, base_size=20),
+    Generator(11, generate_day11, base_size=20),
+    Generator(12, generate_day12, base_size=10),
+    Generator(13, generate_day13, base_size=8),
+    Generator(14, generate_day14, base_size=15),
+    Generator(15, generate_day15, base_size=1000),
+    Generator(16, generate_day16, base_size=10),
+    Generator(18, generate_day18, base_size=50),
+    Generator(19, generate_day19, base_size=100),
+    # part 2 waits for every counter to roll over, which takes 2**bits presses
+    Generator(20, generate_day20, parts=(1,), base_size=40),
+    Generator(21, generate_day21, parts=(1,), base_size=10),
+]}
+
+
+def test_every_day_has_a_generator():
+    assert sorted(GENERATORS) == sorted(DAYS)
+
+
+@parametrize('day', sorted(GENERATORS))
+def test_generated_input_is_solvable(day):
+    source = generate(day, 12, seed=1)
+    assert source == generate(day, 12, seed=1)
+    assert source != generate(day, 12, seed=2)
+    solvers = [solver for solver in DAYS[day].solvers() if solver.part in GENERATORS[day].parts]
+    for solver in solvers:
+        solver.solve(solver.parse(source))
+
+
+def test_generated_day10_loop_encloses_the_right_area():
+    from day10.day10part1 import parse
+    from day10.day10part2 import solve_part2
+    rng = random.Random(3)
+    width = height = 9
+    tops, bottoms = random_column_convex_shape(width, height, rng)
+    # count the lattice points strictly inside the outline (pick's theorem on the shape's squares)
+    area = sum(b - t for t, b in zip(tops, bottoms))
+    perimeter = sum(length for _, length in outline(tops, bottoms))
+    expected = area - perimeter // 2 + 1
+    assert solve_part2(parse(generate_day10(size=12, rng=random.Random(3)))) == expected
+
+
+def test_generated_day18_matches_shoelace():
+    from day18.day18 import calc_pit_capacity, calc_pit_capacity2
+    lines = generate(18, 20, seed=4).split('\n')
+    for plan, capacity in [
+        ([(line.split()[0], int(line.split()[1])) for line in lines], calc_pit_capacity),
+        ([('RDLU'[int(line[-2])], int(line[-7:-2], 16)) for line in lines], calc_pit_capacity2),
+    ]:
+        x = y = area = perimeter = 0
+        for direction, length in plan:
+            dx, dy = {'R': (1, 0), 'L': (-1, 0), 'D': (0, 1), 'U': (0, -1)}[direction]
+            area += x * (y + dy * length) - (x + dx * length) * y
+            x, y = x + dx * length, y + dy * length
+            perimeter += length
+        assert capacity(lines) == abs(area) // 2 + perimeter // 2 + 1
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description='Write a seeded synthetic puzzle input')
+    parser.add_argument('day', type=int, choices=sorted(GENERATORS))
+    parser.add_argument('size', type=int, help='the scaling dimension, see the generator for what it means')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('-o', '--output', help='file to write (default: stdout)')
+    args = parser.parse_args(argv)
+
+    source = generate(args.day, args.size, args.seed)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(source)
+    else:
+        sys.stdout.write(source)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+from array import array
+from typing import Iterable
+
+
+class Graph:
+    # a directed graph with node names interned to dense ids, 0 to len - 1, in the order they're first seen.
+    # Edges are stored CSR style: the edges out of node i are edge ids offsets[i] to offsets[i + 1] - 1, in the
+    # order they were given, and targets[edge] is where each one leads. Per-edge data (day19's rules, day20's
+    # last pulse) lives in lists indexed by edge id.
+    __slots__ = ('names', 'ids', 'offsets', 'targets')
+
+    def __init__(self, names: list[str], offsets: array, targets: array):
+        self.names = names
+        self.ids = {name: i for i, name in enumerate(names)}
+        self.offsets = offsets
+        self.targets = targets
+
+    @classmethod
+    def from_adjacency(cls, adjacency: dict[str, Iterable[str]]) -> 'Graph':
+        ids: dict[str, int] = {}
+        for name in adjacency:
+            ids.setdefault(name, len(ids))
+        successors = {ids[name]: [ids.setdefault(target, len(ids)) for target in targets]
+                      for name, targets in adjacency.items()}
+        offsets = array('l', [0])
+        targets = array('l')
+        for i in range(len(ids)):
+            targets.extend(successors.get(i, ()))
+            offsets.append(len(targets))
+        return cls(list(ids), offsets, targets)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def id(self, name: str) -> int:
+        return self.ids[name]
+
+    def edges(self, node: int) -> range:
+        return range(self.offsets[node], self.offsets[node + 1])
+
+    def successors(self, node: int) -> array:
+        return self.targets[self.offsets[node]:self.offsets[node + 1]]
+
+    def sources(self) -> array:
+        # the node each edge leaves from
+        result = array('l')
+        for node in range(len(self)):
+            result.extend([node] * (self.offsets[node + 1] - self.offsets[node]))
+        return result
+
+    def predecessors(self, node: int) -> list[int]:
+        return [source for source, target in zip(self.sources(), self.targets) if target == node]
+
+    def in_degrees(self) -> list[int]:
+        result = [0] * len(self)
+        for target in self.targets:
+            result[target] += 1
+        return result
+
+
+def test_from_adjacency_interns_in_order():
+    graph = Graph.from_adjacency({'a': ['b', 'c'], 'c': ['a', 'd'], 'b': []})
+    assert graph.names == ['a', 'c', 'b', 'd']
+    assert graph.id('d') == 3
+    assert list(graph.offsets) == [0, 2, 4, 4, 4]
+    assert [graph.names[i] for i in graph.successors(graph.id('c'))] == ['a', 'd']
+
+
+def test_edges_and_sources():
+    graph = Graph.from_adjacency({'a': ['b', 'c'], 'c': ['a', 'd'], 'b': []})
+    assert list(graph.edges(0)) == [0, 1]
+    assert list(graph.edges(3)) == []
+    assert list(graph.sources()) == [0, 0, 1, 1]
+    assert graph.predecessors(graph.id('a')) == [1]
+    assert graph.in_degrees() == [1, 1, 1, 1]
@@ -0,0 +1,210 @@
+from aoc.gridfile import GridBuffer
+from aoc.testing import parametrize
+
+SEPARATOR = ord('\n')
+CHARS = tuple(chr(b) for b in range(256))
+
+# (dy, dx) of the neighbours of a cell, orthogonal ones first in reading order
+ORTHOGONAL = ((-1, 0), (0, -1), (0, 1), (1, 0))
+DIAGONAL = ((-1, -1), (-1, 1), (1, -1), (1, 1))
+ALL_DIRECTIONS = ((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1))
+
+
+class Grid:
+    # cells of a character grid in one flat buffer, cell (y, x) at origin + y * row_step + x * col_step.
+    # Grids built here keep the '\n' after each row, so row_step (the stride) is width + 1 and a step off
+    # either side of a row lands on a separator. Transposed and rotated grids are views of the same cells.
+    __slots__ = ('cells', 'width', 'height', 'origin', 'row_step', 'col_step')
+
+    def __init__(self, cells, width: int, height: int, origin: int = 0, row_step: int = None, col_step: int = 1):
+        self.cells = cells
+        self.width = width
+        self.height = height
+        self.origin = origin
+        self.row_step = width + 1 if row_step is None else row_step
+        self.col_step = col_step
+
+    @classmethod
+    def from_rows(cls, rows: list[str]) -> 'Grid':
+        width = len(rows[0])
+        if any(len(row) != width for row in rows):
+            raise ValueError(f'Rows of a grid should all be {width} wide')
+        return cls(bytearray(''.join(row + '\n' for row in rows), 'latin-1'), width, len(rows))
+
+    @classmethod
+    def from_text(cls, text: str) -> 'Grid':
+        return cls.from_rows(text.split('\n'))
+
+    @classmethod
+    def from_buffer(cls, buffer: GridBuffer) -> 'Grid':
+        # shares the (read only, memory mapped) buffer; copy() it before writing
+        return cls(buffer.data, buffer.width, buffer.height, row_step=buffer.stride)
+
+    @classmethod
+    def filled(cls, width: int, height: int, char: str = '.') -> 'Grid':
+        return cls.from_rows([char * width] * height)
+
+    def index(self, y: int, x: int) -> int:
+        return self.origin + y * self.row_step + x * self.col_step
+
+    def position(self, index: int) -> (int, int):
+        # only for grids that aren't transposed or rotated, where rows run along the buffer
+        return divmod(index - self.origin, self.row_step)
+
+    def in_bounds(self, y: int, x: int) -> bool:
+        return 0 <= y < self.height and 0 <= x < self.width
+
+    def contains_index(self, index: int) -> bool:
+        # a flat index stepped to with offsets() is off the grid if it's outside the buffer or on a separator
+        return 0 <= index < len(self.cells) and self.cells[index] != SEPARATOR
+
+    def offsets(self, directions=ORTHOGONAL) -> list[int]:
+        return [dy * self.row_step + dx * self.col_step for dy, dx in directions]
+
+    def __getitem__(self, position: (int, int)) -> str:
+        y, x = position
+        return CHARS[self.cells[self.origin + y * self.row_step + x * self.col_step]]
+
+    def __setitem__(self, position: (int, int), char: str):
+        y, x = position
+        self.cells[self.origin + y * self.row_step + x * self.col_step] = ord(char)
+
+    def neighbours(self, y: int, x: int, directions=ORTHOGONAL) -> list[(int, int)]:
+        return [(y + dy, x + dx) for dy, dx in directions if 0 <= y + dy < self.height and 0 <= x + dx < self.width]
+
+    def _row_slice(self, y: int) -> slice:
+        start = self.origin + y * self.row_step
+        stop = start + self.width * self.col_step
+        return slice(start, stop if stop >= 0 else None, self.col_step)
+
+    def row(self, y: int) -> str:
+        # bytes() as a memoryview slice (from_buffer) can't be decoded directly
+        return str(bytes(self.cells[self._row_slice(y)]), 'latin-1')
+
+    def set_row(self, y: int, row: str):
+        self.cells[self._row_slice(y)] = row.encode('latin-1')
+
+    def rows(self) -> list[str]:
+        return [self.row(y) for y in range(self.height)]
+
+    def __str__(self) -> str:
+        return '\n'.join(self.rows())
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, Grid) and self.rows() == other.rows()
+
+    def copy(self) -> 'Grid':
+        # a writable grid in reading order, whatever view this is
+        return Grid.from_rows(self.rows())
+
+    def transposed(self) -> 'Grid':
+        return Grid(self.cells, self.height, self.width, self.origin, self.col_step, self.row_step)
+
+    def rotated_clockwise(self) -> 'Grid':
+        # new (y, x) is old (height - 1 - x, y)
+        origin = self.origin + (self.height - 1) * self.row_step
+        return Grid(self.cells, self.height, self.width, origin, self.col_step, -self.row_step)
+
+    def rotated_anticlockwise(self) -> 'Grid':
+        # new (y, x) is old (x, width - 1 - y)
+        origin = self.origin + (self.width - 1) * self.col_step
+        return Grid(self.cells, self.height, self.width, origin, -self.col_step, self.row_step)
+
+    def find(self, char: str) -> (int, int):
+        for y in range(self.height):
+            x = self.row(y).find(char)
+            if x != -1:
+                return y, x
+        raise ValueError(f'{char!r} is not in the grid')
+
+    def count(self, char: str) -> int:
+        return sum(self.row(y).count(char) for y in range(self.height))
+
+    def numpy(self):
+        # a (height, width) uint8 array sharing the cells, for when NumPy is installed
+        import numpy as np
+        from numpy.lib.stride_tricks import as_strided
+        cells = np.frombuffer(self.cells, dtype=np.uint8)
+        return as_strided(cells[self.origin:], shape=(self.height, self.width), strides=(self.row_step, self.col_step))
+
+
+test_rows = [
+    'ABC',
+    'DEF',
+]
+
+def test_from_rows():
+    grid = Grid.from_rows(test_rows)
+    assert (grid.width, grid.height, grid.row_step) == (3, 2, 4)
+    assert grid[1, 2] == 'F'
+    assert grid.rows() == test_rows
+    assert str(grid) == 'ABC\nDEF'
+    assert Grid.from_text('ABC\nDEF') == grid
+
+
+def test_from_buffer():
+    from aoc.gridfile import decode, encode
+    grid = Grid.from_buffer(decode(encode(b'ABC\nDEF'))[0])
+    assert grid == Grid.from_rows(test_rows)
+    assert grid.find('E') == (1, 1)
+    assert grid.rotated_clockwise().rows() == ['DA', 'EB', 'FC']
+    copy = grid.copy()
+    copy[0, 0] = 'Z'
+    assert copy.rows() == ['ZBC', 'DEF']
+
+
+@parametrize('view, expected', [
+    ('transposed', ['AD', 'BE', 'CF']),
+    ('rotated_clockwise', ['DA', 'EB', 'FC']),
+    ('rotated_anticlockwise', ['CF', 'BE', 'AD']),
+])
+def test_views(view, expected):
+    grid = Grid.from_rows(test_rows)
+    actual = getattr(grid, view)()
+    assert actual.rows() == expected
+    assert [actual[y, x] for y in range(actual.height) for x in range(actual.width)] == list(''.join(expected))
+
+
+def test_views_share_cells():
+    grid = Grid.from_rows(test_rows)
+    rotated = grid.rotated_clockwise()
+    rotated[0, 0] = 'd'
+    rotated.set_row(2, 'fc')
+    assert grid.rows() == ['ABc', 'dEf']
+    assert rotated.rotated_clockwise().rotated_clockwise().rotated_clockwise() == grid
+    assert grid.rotated_anticlockwise().rotated_clockwise() == grid
+    assert grid.transposed().transposed() == grid
+
+
+def test_neighbours():
+    grid = Grid.filled(3, 3)
+    assert grid.neighbours(0, 0) == [(0, 1), (1, 0)]
+    assert grid.neighbours(1, 1) == [(0, 1), (1, 0), (1, 2), (2, 1)]
+    assert grid.neighbours(2, 2, ALL_DIRECTIONS) == [(1, 1), (1, 2), (2, 1)]
+
+
+def test_offsets_step_onto_separators():
+    grid = Grid.from_rows(test_rows)
+    up, left, right, down = grid.offsets()
+    assert grid.contains_index(grid.index(0, 1) + right)
+    assert not grid.contains_index(grid.index(0, 2) + right)
+    assert not grid.contains_index(grid.index(1, 0) + left)
+    assert not grid.contains_index(grid.index(0, 0) + up)
+    assert not grid.contains_index(grid.index(1, 1) + down)
+    assert grid.position(grid.index(1, 2)) == (1, 2)
+
+
+def test_find_and_count():
+    grid = Grid.from_rows(['.#.', '#S#'])
+    assert grid.find('S') == (1, 1)
+    assert grid.count('#') == 3
+    assert grid.rotated_clockwise().find('S') == (1, 0)
+
+
+def test_numpy_view():
+    import pytest
+    pytest.importorskip('numpy')
+    grid = Grid.from_rows(test_rows)
+    assert grid.rotated_clockwise().numpy().tobytes() == b'DAEBFC'
+    grid.numpy()[0, 0] = ord('Z')
+    assert grid[0, 0] == 'Z'
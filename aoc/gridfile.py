@@ -0,0 +1,130 @@
+import hashlib
+import mmap
+import os
+import struct
+from dataclasses import dataclass
+from pathlib import Path
+
+from aoc.testing import parametrize
+
+# magic, version, number of grids, then the size, modification time and sha256 of the text they were parsed from
+HEADER = struct.Struct('<4sHHQQ32s')
+# width, height, stride and offset of one grid's cells from the start of the file
+ENTRY = struct.Struct('<IIIQ')
+MAGIC = b'AOCG'
+VERSION = 1
+
+
+@dataclass
+class GridBuffer:
+    # cells are stored row by row, stride bytes apart; the byte after each row is the '\n' it had in the text
+    width: int
+    height: int
+    stride: int
+    data: memoryview
+
+    def __getitem__(self, position: (int, int)) -> int:
+        y, x = position
+        return self.data[y * self.stride + x]
+
+    def row(self, y: int) -> memoryview:
+        return self.data[y * self.stride:y * self.stride + self.width]
+
+    def rows(self) -> list[str]:
+        return self.text().split('\n')
+
+    def text(self) -> str:
+        return str(self.data[:-1], 'ascii')
+
+
+def split_grids(text: bytes) -> list[list[bytes]]:
+    # grids are separated by blank lines, as in day13
+    return [block.split(b'\n') for block in text.strip(b'\n').split(b'\n\n')]
+
+
+def encode(text: bytes, size: int = 0, mtime_ns: int = 0) -> bytes:
+    grids = split_grids(text)
+    entries = []
+    offset = HEADER.size + ENTRY.size * len(grids)
+    for rows in grids:
+        width = len(rows[0])
+        if any(len(row) != width for row in rows):
+            raise ValueError(f'Rows of a grid should all be {width} wide')
+        entries.append(ENTRY.pack(width, len(rows), width + 1, offset))
+        offset += len(rows) * (width + 1)
+    header = HEADER.pack(MAGIC, VERSION, len(grids), size, mtime_ns, hashlib.sha256(text).digest())
+    return b''.join([header] + entries + [b''.join(row + b'\n' for row in rows) for rows in grids])
+
+
+def decode(buffer) -> list[GridBuffer]:
+    # views straight into the buffer, nothing is copied
+    view = memoryview(buffer)
+    count = HEADER.unpack_from(view)[2]
+    grids = []
+    for i in range(count):
+        width, height, stride, offset = ENTRY.unpack_from(view, HEADER.size + i * ENTRY.size)
+        grids.append(GridBuffer(width, height, stride, view[offset:offset + height * stride]))
+    return grids
+
+@parametrize('text', [b'#.\n.#', b'#.\n.#\n', b'#.#\n...\n\n##\n..\n##'])
+def test_encode_round_trip(text):
+    grids = decode(encode(text))
+    assert [grid.rows() for grid in grids] == [[row.decode() for row in rows] for rows in split_grids(text)]
+    assert bytes(grids[0].row(0)) == text.split(b'\n')[0]
+
+
+def test_grid_buffer_indexing():
+    grid = decode(encode(b'#..\n..#'))[0]
+    assert (grid.width, grid.height, grid.stride) == (3, 2, 4)
+    assert [grid[0, 0], grid[1, 2], grid[1, 0]] == [ord('#'), ord('#'), ord('.')]
+
+
+def test_encode_rejects_ragged_rows():
+    import pytest
+    with pytest.raises(ValueError):
+        encode(b'##\n#')
+
+
+def is_current(buffer, input_path: Path) -> bool:
+    if len(buffer) < HEADER.size:
+        return False
+    magic, version, _, size, mtime_ns, digest = HEADER.unpack_from(buffer)
+    if magic != MAGIC or version != VERSION:
+        return False
+    stat = input_path.stat()
+    if (stat.st_size, stat.st_mtime_ns) == (size, mtime_ns):
+        return True  # untouched since it was parsed, so there's no need to read and hash it
+    return digest == hashlib.sha256(input_path.read_bytes()).digest()
+
+
+def load_grids(input_path: Path) -> list[GridBuffer]:
+    # parses the text once into input_path.grid beside it, and memory maps that on later loads
+    # until the text changes
+    grid_path = input_path.with_suffix('.grid')
+    try:
+        with open(grid_path, 'rb') as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if is_current(buffer, input_path):
+            return decode(buffer)
+        buffer.close()
+    except (OSError, ValueError):  # missing, or empty and so unmappable
+        pass
+    stat = input_path.stat()
+    encoded = encode(input_path.read_bytes(), stat.st_size, stat.st_mtime_ns)
+    temporary = grid_path.with_suffix(f'.{os.getpid()}.tmp')
+    temporary.write_bytes(encoded)
+    temporary.replace(grid_path)
+    return decode(encoded)
+
+def test_load_grids(tmp_path):
+    input_path = tmp_path / 'Input.txt'
+    input_path.write_text('..#\n#..')
+    assert load_grids(input_path)[0].rows() == ['..#', '#..']
+    assert (tmp_path / 'Input.grid').exists()
+    cached = load_grids(input_path)
+    assert isinstance(cached[0].data.obj, mmap.mmap)
+    assert cached[0].rows() == ['..#', '#..']
+    input_path.write_text('###\n#..')
+    assert load_grids(input_path)[0].rows() == ['###', '#..']
+    os.utime(input_path, ns=(0, 0))  # touched but unchanged, the hash still matches
+    assert load_grids(input_path)[0].rows() == ['###', '#..']
@@ -0,0 +1,95 @@
+import argparse
+import subprocess
+import sys
+from dataclasses import dataclass
+from itertools import zip_longest
+
+from aoc.days import DAYS, ROOT
+
+# modules that should never be imported on the production path
+TEST_ONLY = ('pytest', '_pytest')
+
+
+@dataclass
+class ImportTime:
+    name: str
+    self_us: int
+    cumulative_us: int
+
+
+def parse_importtime(stderr: str) -> list[ImportTime]:
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line.removeprefix('import time:').split('|')
+        imports.append(ImportTime(name.strip(), int(self_us), int(cumulative_us)))
+    return imports
+
+def test_parse_importtime():
+    stderr = ('import time: self [us] | cumulative | imported package\n'
+              'import time:       120 |        120 |   _io\n'
+              'import time:      2501 |      51878 | main\n')
+    assert parse_importtime(stderr) == [ImportTime('_io', 120, 120), ImportTime('main', 2501, 51878)]
+
+
+def production_modules() -> list[str]:
+    return ['main'] + [module for day in DAYS.values() for module in day.modules]
+
+
+# what starting up cost before the runner loaded days on demand: every day module imported up front, each of them
+# importing pytest, against importing main alone, which imports a day's modules only when that day runs
+EAGER_STARTUP = TEST_ONLY[:1] + tuple(production_modules())
+LAZY_STARTUP = ('main',)
+
+
+def measure(modules: list[str]) -> list[ImportTime]:
+    code = '; '.join(f'import {module}' for module in modules)
+    process = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                             cwd=ROOT, capture_output=True, text=True, check=True)
+    return parse_importtime(process.stderr)
+
+
+def total_us(imports: list[ImportTime]) -> int:
+    # top level imports are not indented, and their cumulative times cover everything below them
+    return sum(i.cumulative_us for i in imports if not i.name.startswith(' '))
+
+
+def test_production_path_does_not_import_pytest():
+    names = {i.name.strip() for i in measure(production_modules())}
+    assert 'main' in names
+    assert not names & set(TEST_ONLY)
+
+
+def test_main_imports_no_day_module():
+    names = {i.name.strip() for i in measure(list(LAZY_STARTUP))}
+    assert 'main' in names
+    assert not names & {module for day in DAYS.values() for module in day.modules}
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description='Compare the start-up import cost of loading every day module (and pytest) up front against '
+                    'importing main.py alone, and check no day module pulls in pytest')
+    parser.add_argument('--top', type=int, default=10, help='number of heaviest imports to show')
+    args = parser.parse_args(argv)
+
+    eager, lazy = measure(list(EAGER_STARTUP)), measure(list(LAZY_STARTUP))
+    print(f'{"":24}{"eager":>10}{"lazy":>10}')
+    print(f'{"total import time":24}{total_us(eager) / 1000:8.1f}ms{total_us(lazy) / 1000:8.1f}ms')
+    print(f'{"modules imported":24}{len(eager):10}{len(lazy):10}')
+    print(f'Start-up is {total_us(eager) / max(total_us(lazy), 1):.1f}x faster importing main alone')
+    print('Heaviest imports by self time (eager | lazy):')
+    heaviest = [sorted(imports, key=lambda i: -i.self_us)[:args.top] for imports in (eager, lazy)]
+    for row in zip_longest(*heaviest):
+        cells = [f'{i.self_us / 1000:7.2f}ms  {i.name.strip():<28}' if i else ' ' * 39 for i in row]
+        print(('  ' + ' | '.join(cells)).rstrip())
+    # every day module without pytest itself, as the lazy path loads them on demand
+    imports = measure(production_modules())
+    leaked = sorted({i.name.strip() for i in imports} & set(TEST_ONLY))
+    if leaked:
+        print(f'Test-only modules imported: {", ".join(leaked)}')
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,207 @@
+import argparse
+import random
+import time
+from bisect import bisect_right
+from typing import Iterable
+
+from aoc.testing import parametrize
+
+
+def normalise(intervals: Iterable[tuple[int, int]]) -> list[(int, int)]:
+    # intervals sorted by start, merged where they overlap or touch
+    result = []
+    current_start = current_end = None
+    for start, end in intervals:
+        if start > end:
+            raise ValueError(f'Interval ({start}, {end}) ends before it starts')
+        if current_end is not None and start <= current_end + 1:
+            if end > current_end:
+                current_end = end
+        else:
+            if current_end is not None:
+                result.append((current_start, current_end))
+            current_start, current_end = start, end
+    if current_end is not None:
+        result.append((current_start, current_end))
+    return result
+
+
+class IntervalSet:
+    # a set of integers held as sorted, disjoint, non-touching closed intervals (start, end).
+    # Building one sorts; every operation between two sets is then one linear sweep over both.
+    __slots__ = ('intervals',)
+
+    def __init__(self, intervals: Iterable[tuple[int, int]] = ()):
+        self.intervals = normalise(sorted(intervals))
+
+    @classmethod
+    def _from_normalised(cls, intervals: list[(int, int)]) -> 'IntervalSet':
+        result = cls.__new__(cls)
+        result.intervals = intervals
+        return result
+
+    def __iter__(self):
+        return iter(self.intervals)
+
+    def __len__(self) -> int:
+        return len(self.intervals)
+
+    def __contains__(self, value: int) -> bool:
+        i = bisect_right(self.intervals, (value, float('inf'))) - 1
+        return i >= 0 and value <= self.intervals[i][1]
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, IntervalSet) and self.intervals == other.intervals
+
+    def __repr__(self) -> str:
+        return f'IntervalSet({self.intervals})'
+
+    def boundaries(self) -> list[int]:
+        # where membership flips: each start, and one past each end
+        return [point for start, end in self.intervals for point in (start, end + 1)]
+
+    def total_length(self) -> int:
+        return sum(end + 1 - start for start, end in self.intervals)
+
+    def union(self, other: 'IntervalSet') -> 'IntervalSet':
+        # sorted() spots the two runs and merges them in one pass
+        return IntervalSet._from_normalised(normalise(sorted(self.intervals + other.intervals)))
+
+    def intersection(self, other: 'IntervalSet') -> 'IntervalSet':
+        a, b = self.intervals, other.intervals
+        if not a or not b:
+            return IntervalSet()
+        result = []
+        i = j = 0
+        a_start, a_end = a[0]
+        b_start, b_end = b[0]
+        while True:
+            start = a_start if a_start > b_start else b_start
+            end = a_end if a_end < b_end else b_end
+            if start <= end:
+                result.append((start, end))
+            if a_end < b_end:
+                i += 1
+                if i == len(a):
+                    break
+                a_start, a_end = a[i]
+            else:
+                j += 1
+                if j == len(b):
+                    break
+                b_start, b_end = b[j]
+        return IntervalSet._from_normalised(result)
+
+    def difference(self, other: 'IntervalSet') -> 'IntervalSet':
+        b = other.intervals
+        result = []
+        j = 0
+        for start, end in self.intervals:
+            while j < len(b) and b[j][1] < start:
+                j += 1
+            # b[j] can reach past end, so it's looked at again for the next interval
+            k = j
+            while k < len(b):
+                b_start, b_end = b[k]
+                if b_start > end:
+                    break
+                if b_start > start:
+                    result.append((start, b_start - 1))
+                start = b_end + 1
+                if start > end:
+                    break
+                k += 1
+            if start <= end:
+                result.append((start, end))
+        return IntervalSet._from_normalised(result)
+
+    def symmetric_difference(self, other: 'IntervalSet') -> 'IntervalSet':
+        # membership flips wherever exactly one side flips; neither side repeats a boundary,
+        # and sorted() merges the two runs of them in one pass
+        a, b = self.boundaries(), other.boundaries()
+        both = set(a).intersection(b)
+        points = iter([point for point in sorted(a + b) if point not in both])
+        return IntervalSet._from_normalised([(start, stop - 1) for start, stop in zip(points, points)])
+
+    def split(self, breakpoints: Iterable[int]) -> list[(int, int)]:
+        # the intervals cut so that each breakpoint starts a new piece
+        points = sorted(set(breakpoints))
+        pieces = []
+        i = 0
+        for start, end in self.intervals:
+            while i < len(points) and points[i] <= start:
+                i += 1
+            while i < len(points) and points[i] <= end:
+                pieces.append((start, points[i] - 1))
+                start = points[i]
+                i += 1
+            pieces.append((start, end))
+        return pieces
+
+
+def test_normalise_merges_overlapping_and_touching():
+    assert IntervalSet([(5, 8), (0, 2), (3, 3), (7, 12), (20, 20)]).intervals == [(0, 3), (5, 12), (20, 20)]
+    assert IntervalSet([(0, 10), (2, 3)]).intervals == [(0, 10)]
+
+
+def test_rejects_backwards_interval():
+    import pytest
+    with pytest.raises(ValueError):
+        IntervalSet([(3, 2)])
+
+
+@parametrize('operation, expected', [
+    ('union', [(10, 55), (80, 90)]),
+    ('intersection', [(20, 30), (50, 53), (83, 85)]),
+    ('difference', [(10, 19), (54, 55), (86, 90)]),
+    ('symmetric_difference', [(10, 19), (31, 49), (54, 55), (80, 82), (86, 90)]),
+])
+def test_operations(operation, expected):
+    a, b = IntervalSet([(10, 30), (50, 55), (83, 90)]), IntervalSet([(20, 53), (80, 85)])
+    assert getattr(a, operation)(b).intervals == expected
+
+
+def test_operations_match_python_sets():
+    rng = random.Random(0)
+    for _ in range(50):
+        x, y = (IntervalSet((s, s + rng.randrange(6)) for s in rng.sample(range(100), 15)) for _ in range(2))
+        xs, ys = ({v for s, e in i for v in range(s, e + 1)} for i in (x, y))
+        for operation, expected in [('union', xs | ys), ('intersection', xs & ys),
+                                    ('difference', xs - ys), ('symmetric_difference', xs ^ ys)]:
+            actual = getattr(x, operation)(y)
+            assert {v for s, e in actual for v in range(s, e + 1)} == expected
+            assert actual == IntervalSet(actual.intervals)
+        assert x.total_length() == len(xs)
+        assert all((v in x) == (v in xs) for v in range(-1, 110))
+
+
+def test_split():
+    # a union of both sides, cut at each side's boundaries, as day05 used to combine ranges
+    a, b = IntervalSet([(10, 30), (50, 55), (83, 90)]), IntervalSet([(20, 53), (80, 85)])
+    breakpoints = [p for start, end in list(a) + list(b) for p in (start, end + 1)]
+    assert a.union(b).split(breakpoints) == [
+        (10, 19), (20, 30), (31, 49), (50, 53), (54, 55), (80, 82), (83, 85), (86, 90),
+    ]
+    assert IntervalSet([(10, 30)]).split([10, 31, 40]) == [(10, 30)]
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description='Time the IntervalSet operations on random sets')
+    parser.add_argument('--size', type=int, default=1_000_000, help='intervals in each set')
+    args = parser.parse_args(argv)
+    rng = random.Random(0)
+    span = args.size * 20
+    raw = [[(s, s + rng.randrange(12)) for s in rng.sample(range(span), args.size)] for _ in range(2)]
+    start_time = time.perf_counter()
+    x, y = (IntervalSet(intervals) for intervals in raw)
+    print(f'build x2: {time.perf_counter() - start_time:.2f}s ({len(x)} and {len(y)} intervals)')
+    for operation in ('union', 'intersection', 'difference', 'symmetric_difference', 'total_length'):
+        start_time = time.perf_counter()
+        getattr(x, operation)(*([] if operation == 'total_length' else [y]))
+        print(f'{operation}: {time.perf_counter() - start_time:.2f}s')
+    start_time = time.perf_counter()
+    x.split(range(0, span, 7))
+    print(f'split: {time.perf_counter() - start_time:.2f}s')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+import re
+from array import array
+
+from aoc.testing import parametrize
+
+# everything but digits and '-' becomes a space, so bytes.split() leaves just the numbers
+DIGITS = b'0123456789-'
+TABLE = bytes(c if c in DIGITS else ord(' ') for c in range(256))
+LINE_TABLE = bytes(c if c in DIGITS + b'\n' else ord(' ') for c in range(256))
+
+
+def clean(buffer: str | bytes, table: bytes) -> bytes:
+    data = buffer.encode() if isinstance(buffer, str) else bytes(buffer)
+    data = data.translate(table)
+    if b'-' in data:
+        # every '-' starts a number, or is left alone and dropped, as in '5-3' or 'seed-to-soil'
+        data = data.replace(b'-', b' -')
+    return data
+
+
+def to_array(tokens: list[bytes]) -> array:
+    if b'-' in tokens:
+        tokens = [token for token in tokens if token != b'-']
+    # int() takes the bytes as they are, and array() copies a list faster than it drains an iterator
+    return array('q', list(map(int, tokens)))
+
+
+def ints(buffer: str | bytes) -> array:
+    # every signed integer in the text or bytes (or a memoryview or mmap of them), in order. One translate()
+    # and split() over the whole buffer instead of a split, strip and int per field.
+    return to_array(clean(buffer, TABLE).split())
+
+@parametrize('buffer, expected', [
+    ('Card 1: 41 48 | 83  6', [1, 41, 48, 83, 6]),
+    ('0 -3 6\n-9 12', [0, -3, 6, -9, 12]),
+    (b'{x=787,m=-2655}', [787, -2655]),
+    (memoryview(b'seeds: 79 14'), [79, 14]),
+    ('seed-to-soil map:', []),
+    ('5-3 --4 7- -', [5, -3, -4, 7]),
+])
+def test_ints(buffer, expected):
+    assert ints(buffer).tolist() == expected
+
+
+def test_ints_matches_a_regex():
+    import random
+    rng = random.Random(0)
+    for _ in range(200):
+        text = ''.join(rng.choices('0123456789--  \nab:', k=40))
+        assert ints(text).tolist() == [int(x) for x in re.findall(r'-?[0-9]+', text)]
+
+
+def ints_by_line(buffer: str | bytes) -> list[array]:
+    # still one translate() over the whole buffer, keeping the newlines to split on
+    return [to_array(line.split()) for line in clean(buffer, LINE_TABLE).split(b'\n')]
+
+def test_ints_by_line():
+    assert [line.tolist() for line in ints_by_line('1 2 3\n-4\n\n5')] == [[1, 2, 3], [-4], [], [5]]
@@ -0,0 +1,93 @@
+import argparse
+import importlib
+import mmap
+import sys
+from pathlib import Path
+from typing import Iterator, TextIO
+
+from aoc.days import DAYS
+from aoc.testing import parametrize
+
+
+def read_lines(file: TextIO) -> Iterator[str]:
+    # one line at a time, without the newline; like str.splitlines() there is no empty line after a final '\n'
+    for line in file:
+        yield line[:-1] if line.endswith('\n') else line
+
+
+def mmap_lines(path: Path, encoding: str = 'utf-8') -> Iterator[str]:
+    with open(path, 'rb') as f:
+        if f.seek(0, 2) == 0:  # an empty file can't be mapped
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            start = 0
+            while start < len(buffer):
+                end = buffer.find(b'\n', start)
+                if end == -1:
+                    end = len(buffer)
+                yield buffer[start:end].decode(encoding)
+                start = end + 1
+
+
+def open_lines(path: str | Path, use_mmap: bool = False) -> Iterator[str]:
+    # lazily yields the lines of a file, or of stdin when the path is '-'
+    if str(path) == '-':
+        yield from read_lines(sys.stdin)
+    elif use_mmap:
+        yield from mmap_lines(Path(path))
+    else:
+        with open(path) as f:
+            yield from read_lines(f)
+
+@parametrize('content', ['', 'a', 'a\n', 'a\nbb\n\nc', 'a\nbb\n\nc\n', '\n\n'])
+@parametrize('use_mmap', [False, True])
+def test_open_lines(tmp_path, content, use_mmap):
+    path = tmp_path / 'input.txt'
+    path.write_bytes(content.encode())
+    assert list(open_lines(path, use_mmap)) == content.splitlines()
+
+
+def solve_streaming(day: int, part: int, lines: Iterator[str]):
+    # line independent days solve straight from an iterator, without parse() holding every line in memory
+    if not DAYS[day].streaming:
+        raise ValueError(f'Day{day:02} needs its whole input, it can\'t be streamed')
+    for module_name in DAYS[day].modules:
+        module = importlib.import_module(module_name)
+        solve = getattr(module, f'solve_part{part}', None)
+        if solve is not None:
+            # days whose parse() does more than split lines parse each line the same way with parse_line()
+            parse_line = getattr(module, 'parse_line', None)
+            return solve(map(parse_line, lines) if parse_line else lines)
+    raise ValueError(f'Day{day:02} has no part {part}')
+
+@parametrize('day, part, expected', [
+    (1, 1, 55386), (1, 2, 54824),
+    (2, 1, 2776), (2, 2, 68638),
+    (4, 1, 26218), (4, 2, 9997537),
+    (9, 1, 1887980197), (9, 2, 990),
+    (12, 1, 7307),
+])
+def test_solve_streaming(day, part, expected):
+    assert solve_streaming(day, part, open_lines(DAYS[day].input_path, use_mmap=True)) == expected
+
+
+def test_solve_streaming_rejects_whole_input_days():
+    import pytest
+    with pytest.raises(ValueError):
+        solve_streaming(10, 1, iter([]))
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description='Solve a line independent day by streaming its input, in constant memory')
+    parser.add_argument('day', type=int, choices=[day.number for day in DAYS.values() if day.streaming])
+    parser.add_argument('part', type=int, choices=[1, 2])
+    parser.add_argument('path', nargs='?', help='input file, - for stdin (default: the day\'s Input.txt)')
+    parser.add_argument('--mmap', action='store_true', help='read the file through a memory map')
+    args = parser.parse_args(argv)
+
+    path = args.path or DAYS[args.day].input_path
+    print(f'Day{args.day:02} part {args.part}: {solve_streaming(args.day, args.part, open_lines(path, args.mmap))}')
+
+if __name__ == '__main__':
+    main()
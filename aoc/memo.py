@@ -0,0 +1,137 @@
+import functools
+import os
+from dataclasses import dataclass
+from typing import Callable, Iterable
+
+# widest first: clearing a scope clears every narrower one too
+SCOPES = ('process', 'input')
+
+# AOC_MEMO_MAXSIZE='recursive_count_arrangements=4096,new_headings=0' overrides the maxsize a function was
+# registered with (0 for unbounded). Read at import, so process pool workers see it too.
+MAXSIZE_VARIABLE = 'AOC_MEMO_MAXSIZE'
+
+
+@dataclass
+class CacheStats:
+    name: str
+    scope: str
+    maxsize: int | None
+    hits: int = 0
+    misses: int = 0
+    peak_size: int = 0  # most entries held at once since the stats were reset
+
+    def __str__(self) -> str:
+        limit = 'unbounded' if self.maxsize is None else f'max {self.maxsize}'
+        return (f'{self.name} ({self.scope}, {limit}): {self.hits} hits, {self.misses} misses, '
+                f'{self.peak_size} entries at most')
+
+
+class Memo:
+    # a registered cache: the lru_cache wrapper the module calls, plus the counts from before it was last cleared
+    def __init__(self, func: Callable, scope: str, maxsize: int | None):
+        self.module = func.__module__
+        self.name = f'{func.__module__}.{func.__qualname__}'
+        self.scope = scope
+        self.maxsize = maxsize
+        self.wrapper = functools.lru_cache(maxsize)(func)
+        self.hits = self.misses = self.peak_size = 0
+
+    def clear(self) -> None:
+        info = self.wrapper.cache_info()
+        self.hits += info.hits
+        self.misses += info.misses
+        self.peak_size = max(self.peak_size, info.currsize)
+        self.wrapper.cache_clear()
+
+    def stats(self) -> CacheStats:
+        info = self.wrapper.cache_info()
+        return CacheStats(self.name, self.scope, self.maxsize, self.hits + info.hits, self.misses + info.misses,
+                          max(self.peak_size, info.currsize))
+
+    def reset_stats(self) -> None:
+        # counts start again from here, without dropping what's cached
+        info = self.wrapper.cache_info()
+        self.hits, self.misses, self.peak_size = -info.hits, -info.misses, info.currsize
+
+
+REGISTRY: dict[str, Memo] = {}
+
+
+def parse_maxsizes(setting: str) -> dict[str, int | None]:
+    maxsizes = {}
+    for item in setting.split(','):
+        if item.strip():
+            name, size = item.split('=')
+            maxsizes[name.strip()] = int(size) or None
+    return maxsizes
+
+def test_parse_maxsizes():
+    assert parse_maxsizes('') == {}
+    assert parse_maxsizes('a=10, b=0') == {'a': 10, 'b': None}
+
+
+def memoised(scope: str = 'input', maxsize: int | None = None):
+    # functools.lru_cache, registered so the runner can clear it at the end of its scope and report on it
+    if scope not in SCOPES:
+        raise ValueError(f'unknown cache scope: {scope}')
+    def decorate(func: Callable) -> Callable:
+        overrides = parse_maxsizes(os.environ.get(MAXSIZE_VARIABLE, ''))
+        memo = Memo(func, scope, overrides.get(func.__name__, maxsize))
+        REGISTRY[memo.name] = memo
+        return memo.wrapper
+    return decorate
+
+
+def select(modules: Iterable[str] | None = None, scope: str = 'process') -> list[Memo]:
+    # the caches registered by any of the modules (or all of them) that live no longer than scope
+    narrower = SCOPES[SCOPES.index(scope):]
+    return [memo for memo in REGISTRY.values()
+            if memo.scope in narrower and (modules is None or memo.module in modules)]
+
+
+def clear(scope: str = 'input', modules: Iterable[str] | None = None) -> None:
+    for memo in select(modules, scope):
+        memo.clear()
+
+
+def reset_stats(modules: Iterable[str] | None = None) -> None:
+    for memo in select(modules):
+        memo.reset_stats()
+
+
+def stats(modules: Iterable[str] | None = None) -> list[CacheStats]:
+    return [memo.stats() for memo in select(modules)]
+
+
+def test_scopes(monkeypatch):
+    monkeypatch.setattr('aoc.memo.REGISTRY', {})
+    monkeypatch.setenv(MAXSIZE_VARIABLE, 'half=2')
+
+    @memoised('input')
+    def double(x):
+        return 2 * x
+
+    @memoised('process', maxsize=10)
+    def half(x):
+        return x // 2
+
+    for x in [1, 2, 1, 3, 4, 5]:
+        double(x)
+        half(x)
+    clear('input')
+    assert (double.cache_info().currsize, half.cache_info().currsize) == (0, 2)
+    double(1)
+    by_name = {s.name.rsplit('.', 1)[1]: s for s in stats([__name__])}
+    assert (by_name['double'].hits, by_name['double'].misses, by_name['double'].peak_size) == (1, 6, 5)
+    assert (by_name['half'].maxsize, by_name['half'].hits, by_name['half'].peak_size) == (2, 1, 2)
+    assert str(by_name['double']).endswith('(input, unbounded): 1 hits, 6 misses, 5 entries at most')
+    reset_stats()
+    assert [(s.hits, s.misses, s.peak_size) for s in stats()] == [(0, 0, 1), (0, 0, 2)]
+    half(5)
+    assert half.cache_info().hits == 2 and stats()[1].hits == 1
+
+
+def test_unknown_scope():
+    import pytest
+    with pytest.raises(ValueError):
+        memoised('day')
@@ -0,0 +1,81 @@
+import resource
+import sys
+import tracemalloc
+from pathlib import Path
+
+STATUS_PATH = Path('/proc/self/status')
+CLEAR_REFS_PATH = Path('/proc/self/clear_refs')
+
+
+def rss_peak_bytes() -> int:
+    # VmHWM can be reset between phases, ru_maxrss only ever grows and is in kB on Linux but bytes on macOS
+    try:
+        for line in STATUS_PATH.read_text().splitlines():
+            if line.startswith('VmHWM:'):
+                return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss if sys.platform == 'darwin' else max_rss * 1024
+
+
+def reset_rss_peak() -> None:
+    # writing 5 to clear_refs resets VmHWM to the current RSS (Linux only)
+    try:
+        CLEAR_REFS_PATH.write_text('5')
+    except OSError:
+        pass
+
+
+class PeakMemory:
+    # tracks the tracemalloc peak and the RSS high-water mark of the block it wraps
+    def __init__(self):
+        self.traced_bytes = 0
+        self.rss_bytes = 0
+
+    def __enter__(self):
+        self.started_tracing = not tracemalloc.is_tracing()
+        if self.started_tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        self.traced_start = tracemalloc.get_traced_memory()[0]
+        reset_rss_peak()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.traced_bytes = tracemalloc.get_traced_memory()[1] - self.traced_start
+        self.rss_bytes = rss_peak_bytes()
+        if self.started_tracing:
+            tracemalloc.stop()
+
+def test_peak_memory():
+    with PeakMemory() as peak:
+        block = bytearray(10_000_000)
+        del block
+    assert 10_000_000 <= peak.traced_bytes < 11_000_000
+    assert peak.rss_bytes >= 10_000_000
+    assert not tracemalloc.is_tracing()
+
+
+def format_bytes(n: int) -> str:
+    if n >= 1024 ** 2:
+        return f'{n / 1024 ** 2:.1f}MiB'
+    return f'{n / 1024:.1f}KiB'
+
+def test_format_bytes():
+    assert format_bytes(1536) == '1.5KiB'
+    assert format_bytes(3 * 1024 ** 2) == '3.0MiB'
+
+
+def parse_budgets(specs: list[str]) -> dict[int, int]:
+    # 'DAY=MiB' pairs, e.g. ['11=64', '16=200']
+    budgets = {}
+    for spec in specs:
+        day, _, mib = spec.partition('=')
+        if not mib:
+            raise ValueError(f'Memory budget should look like DAY=MiB: {spec}')
+        budgets[int(day)] = int(float(mib) * 1024 ** 2)
+    return budgets
+
+def test_parse_budgets():
+    assert parse_budgets(['11=64', '16=0.5']) == {11: 64 * 1024 ** 2, 16: 512 * 1024}
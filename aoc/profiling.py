@@ -0,0 +1,97 @@
+import cProfile
+import pstats
+from pathlib import Path
+
+from aoc.days import ROOT
+
+PROFILE_DIR = ROOT / 'profiles'
+
+# pstats keys functions by (filename, line, name)
+Function = tuple[str, int, str]
+
+
+def label(function: Function) -> str:
+    filename, line, name = function
+    if filename == '~':  # builtins
+        return name
+    path = Path(filename)
+    if path.is_relative_to(ROOT):
+        filename = path.relative_to(ROOT).as_posix()
+    else:
+        filename = path.name
+    return f'{filename}:{line}({name})'
+
+def test_label():
+    assert label(('~', 0, '<built-in method builtins.len>')) == '<built-in method builtins.len>'
+    assert label((str(ROOT / 'day16' / 'day16.py'), 12, 'calc_new_positions')) == 'day16/day16.py:12(calc_new_positions)'
+    assert label(('/usr/lib/python3.11/functools.py', 1, 'wrapper')) == 'functools.py:1(wrapper)'
+
+
+def top_functions(stats: pstats.Stats, limit: int = 15) -> list[str]:
+    # hottest functions by their own time, the ones worth looking at first
+    rows = sorted(stats.stats.items(), key=lambda item: -item[1][2])[:limit]
+    lines = [f'{"ncalls":>10} {"tottime":>9} {"cumtime":>9}  function']
+    for function, (primitive_calls, calls, tottime, cumtime, _) in rows:
+        ncalls = str(calls) if calls == primitive_calls else f'{calls}/{primitive_calls}'
+        lines.append(f'{ncalls:>10} {tottime:9.3f} {cumtime:9.3f}  {label(function)}')
+    return lines
+
+
+def collapsed_stacks(stats: pstats.Stats) -> dict[str, int]:
+    # cProfile only records caller -> callee edges, so each stack's share is estimated by splitting a
+    # function's time across its callers in proportion to the time spent under each one (as flameprof does)
+    callees = {}
+    for function, (_, _, _, _, callers) in stats.stats.items():
+        for caller, (_, _, _, cumtime) in callers.items():
+            callees.setdefault(caller, []).append((function, cumtime))
+    roots = [function for function, entry in stats.stats.items() if not entry[4]]
+
+    stacks = {}
+
+    def walk(function: Function, stack: list[str], seconds: float):
+        _, _, tottime, cumtime, _ = stats.stats[function]
+        share = seconds / cumtime if cumtime else 0.0
+        stack.append(label(function))
+        key = ';'.join(stack)
+        stacks[key] = stacks.get(key, 0) + round(tottime * share * 1_000_000)
+        for callee, callee_seconds in callees.get(function, []):
+            if label(callee) not in stack:  # recursion is folded into the outermost frame
+                walk(callee, stack, callee_seconds * share)
+        stack.pop()
+
+    for root in roots:
+        walk(root, [], stats.stats[root][3])
+    return {stack: us for stack, us in stacks.items() if us > 0}
+
+
+def write_profile(profile: cProfile.Profile, name: str, out_dir: Path = PROFILE_DIR, limit: int = 15) -> list[str]:
+    # writes name.pstats and name.collapsed (microseconds per stack, for flamegraph.pl or speedscope),
+    # and returns the top functions table
+    out_dir.mkdir(parents=True, exist_ok=True)
+    profile.dump_stats(out_dir / f'{name}.pstats')
+    stats = pstats.Stats(profile)
+    with open(out_dir / f'{name}.collapsed', 'w') as file:
+        for stack, us in sorted(collapsed_stacks(stats).items()):
+            file.write(f'{stack} {us}\n')
+    return top_functions(stats, limit)
+
+
+def _leaf(n):
+    return sum(range(n))
+
+def _branch(n):
+    return _leaf(n) + _leaf(2 * n)
+
+def test_write_profile(tmp_path):
+    profile = cProfile.Profile()
+    profile.runcall(_branch, 200_000)
+    table = write_profile(profile, 'day99', tmp_path, limit=3)
+    assert (tmp_path / 'day99.pstats').exists()
+    assert len(table) == 4
+    assert 'ncalls' in table[0]
+    collapsed = (tmp_path / 'day99.collapsed').read_text().splitlines()
+    stacks = dict(line.rsplit(' ', 1) for line in collapsed)
+    sum_stacks = [stack for stack in stacks if stack.endswith('builtins.sum>')]
+    assert len(sum_stacks) == 1
+    assert '(_branch);aoc/profiling.py' in sum_stacks[0]
+    assert all(int(us) > 0 for us in stacks.values())
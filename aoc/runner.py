@@ -0,0 +1,357 @@
+import json
+import os
+import platform
+import socket
+import time
+from contextlib import nullcontext
+from dataclasses import dataclass, field, replace
+from functools import partial
+from pathlib import Path
+
+from aoc import memo
+from aoc.days import DAYS
+
+
+@dataclass
+class PartResult:
+    part: int
+    answer: object
+    solve_ns: int
+    peak_bytes: int = None  # tracemalloc peak and RSS high-water mark, when tracking memory
+    rss_bytes: int = None
+
+    @property
+    def seconds(self) -> float:
+        return self.solve_ns / 1e9
+
+
+@dataclass
+class DayResult:
+    day: int
+    parse_ns: int = 0
+    parts: list[PartResult] = field(default_factory=list)
+    parse_peak_bytes: int = None
+    parse_rss_bytes: int = None
+    profile: list[str] = None  # top functions table when run with a profile directory
+    cached: bool = False  # answers and timings come from an earlier run
+    caches: list[memo.CacheStats] = field(default_factory=list)  # the day's memoised functions, over this input
+
+    @property
+    def parse_seconds(self) -> float:
+        return self.parse_ns / 1e9
+
+    @property
+    def seconds(self) -> float:
+        return self.parse_seconds + sum(part.seconds for part in self.parts)
+
+    @property
+    def peak_bytes(self) -> int | None:
+        if self.parse_peak_bytes is None:
+            return None
+        return max([self.parse_peak_bytes] + [part.peak_bytes for part in self.parts])
+
+    def to_json(self) -> dict:
+        return {'day': self.day, 'parse_seconds': self.parse_seconds,
+                'parts': [[part.part, part.answer, part.seconds] for part in self.parts]}
+
+    @staticmethod
+    def merge(results: list['DayResult']) -> 'DayResult':
+        # one day's parts, solved by different workers that each parsed the input for themselves: the day waited
+        # for the slowest of those parses, and a cache counts everything either worker did with it
+        merged = DayResult(results[0].day, max(result.parse_ns for result in results))
+        merged.parts = sorted((part for result in results for part in result.parts), key=lambda part: part.part)
+        peaks = [result.parse_peak_bytes for result in results if result.parse_peak_bytes is not None]
+        if peaks:
+            merged.parse_peak_bytes = max(peaks)
+            merged.parse_rss_bytes = max(result.parse_rss_bytes for result in results)
+        caches = {}
+        for stats in (stats for result in results for stats in result.caches):
+            if stats.name in caches:
+                total = caches[stats.name]
+                total.hits, total.misses = total.hits + stats.hits, total.misses + stats.misses
+                total.peak_size = max(total.peak_size, stats.peak_size)
+            else:
+                caches[stats.name] = replace(stats)
+        merged.caches = list(caches.values())
+        return merged
+
+    @staticmethod
+    def from_json(entry: dict) -> 'DayResult':
+        parts = [PartResult(part, answer, round(seconds * 1e9)) for part, answer, seconds in entry['parts']]
+        return DayResult(entry['day'], round(entry['parse_seconds'] * 1e9), parts, cached=True)
+
+    def to_records(self, host: dict, started_at: str) -> list[dict]:
+        # one flat object per part for --jsonl, the parse shared by the parts counted in each of them
+        return [{
+            'day': self.day,
+            'part': part.part,
+            'answer': part.answer,
+            'parse_ns': self.parse_ns,
+            'solve_ns': part.solve_ns,
+            'parse_peak_bytes': self.parse_peak_bytes,
+            'peak_bytes': part.peak_bytes,
+            'rss_bytes': part.rss_bytes,
+            'cached': self.cached,
+            'started_at': started_at,
+            'host': host,
+        } for part in self.parts]
+
+
+def host_info() -> dict:
+    return {
+        'hostname': socket.gethostname(),
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'machine': platform.machine(),
+        'system': platform.system(),
+        'cpus': os.cpu_count(),
+    }
+
+
+def write_records(results: list[DayResult], out, started_at: str) -> None:
+    host = host_info()
+    for result in results:
+        for record in result.to_records(host, started_at):
+            out.write(json.dumps(record, default=str) + '\n')
+
+
+def run_day(number: int, profile_dir: Path | None = None, track_memory: bool = False,
+            parts: tuple[int, ...] = (1, 2)) -> DayResult:
+    if profile_dir is not None:
+        import cProfile
+        from aoc.profiling import write_profile
+        profile = cProfile.Profile()
+        result = profile.runcall(run_day, number, track_memory=track_memory, parts=parts)
+        result.profile = write_profile(profile, f'day{number:02}', profile_dir)
+        return result
+
+    day = DAYS[number]
+    source = day.read_grids() if day.grid else day.read_source()
+    return solve_source(number, source, parts, track_memory=track_memory)
+
+
+def solve_source(number: int, source: str | list, parts: tuple[int, ...] = (1, 2),
+                 track_memory: bool = False) -> DayResult:
+    # source is either the input text or, for grid days, the GridBuffers loaded from its binary cache
+    if track_memory:
+        from aoc.memory import PeakMemory
+    def measure():
+        return PeakMemory() if track_memory else nullcontext()
+
+    modules = DAYS[number].modules
+    # whatever was memoised for an earlier input (or, in the daemon, an earlier request) goes first
+    memo.clear('input', modules)
+    memo.reset_stats(modules)
+    result = DayResult(number)
+    models = {}  # parts sharing a parser share the parsed model
+    for solver in DAYS[number].solvers():
+        if solver.part not in parts:
+            continue
+        parse = solver.parse if isinstance(source, str) else solver.parse_grids
+        if parse not in models:
+            start_time = time.perf_counter_ns()
+            with measure() as memory:
+                models[parse] = parse(source)
+            result.parse_ns += time.perf_counter_ns() - start_time
+            if memory:
+                result.parse_peak_bytes = max(result.parse_peak_bytes or 0, memory.traced_bytes)
+                result.parse_rss_bytes = max(result.parse_rss_bytes or 0, memory.rss_bytes)
+        start_time = time.perf_counter_ns()
+        with measure() as memory:
+            answer = solver.solve(models[parse])
+        part = PartResult(solver.part, answer, time.perf_counter_ns() - start_time)
+        if memory:
+            part.peak_bytes, part.rss_bytes = memory.traced_bytes, memory.rss_bytes
+        result.parts.append(part)
+    result.caches = [stats for stats in memo.stats(modules) if stats.hits or stats.misses]
+    return result
+
+
+def run_days(days: list[int], jobs: int | None = None, profile_dir: Path | None = None,
+             track_memory: bool = False, cache=None, refresh: bool = False) -> list[DayResult]:
+    # cache is an aoc.cache.ResultCache; refresh solves everything again but still stores the answers
+    jobs = jobs or os.cpu_count() or 1
+    start_time = time.perf_counter()
+    use_cache = cache is not None and profile_dir is None and not track_memory
+    if use_cache:
+        from aoc.cache import fingerprint
+        keys = {day: fingerprint(day) for day in days}
+    cached = {}
+    if use_cache and not refresh:
+        for day in days:
+            entry = cache.get(keys[day])
+            if entry is not None:
+                cached[day] = DayResult.from_json(entry)
+
+    run = partial(run_day, profile_dir=profile_dir, track_memory=track_memory)
+    pending = [day for day in days if day not in cached]
+    pool = None
+    if jobs > 1 and pending:
+        from concurrent.futures import ProcessPoolExecutor  # only pay for the import when fanning out
+        # each part of a day is its own work item, so a slow day's parts run side by side; a profile is written
+        # per day, so profiled days stay whole. A day without a part 2 just returns no parts for it.
+        by_part = (1,), (2,)
+        work = {day: by_part if profile_dir is None else ((1, 2),) for day in pending}
+        pool = ProcessPoolExecutor(max_workers=min(jobs, sum(map(len, work.values()))))
+        futures = {day: [pool.submit(run, day, parts=parts) for parts in work[day]] for day in pending}
+    results = []
+    try:
+        for day in days:
+            if day in cached:
+                result = cached[day]
+            else:
+                result = DayResult.merge([future.result() for future in futures[day]]) if pool else run(day)
+                if use_cache:
+                    cache.put(keys[day], result.to_json())
+            print_answers(result)
+            results.append(result)
+    finally:
+        if pool:
+            pool.shutdown()
+    total = time.perf_counter() - start_time
+    print_timings(results, total)
+    print_caches(results)
+    if track_memory:
+        print_memory(results)
+    if profile_dir is not None:
+        print_profiles(results, profile_dir)
+    return results
+
+
+def print_answers(result: DayResult) -> None:
+    for part in result.parts:
+        print(f'Day{result.day:02} part {part.part}: {part.answer}')
+
+
+def print_timings(results: list[DayResult], total: float) -> None:
+    print()
+    for result in results:
+        solve_times = ', '.join(f'part {part.part} {part.seconds:.2f}s' for part in result.parts)
+        timings = f'{result.seconds:.2f}s (parse {result.parse_seconds:.2f}s, {solve_times})'
+        if result.cached:
+            print(f'Day{result.day:02} cached, took {timings} when solved')
+        else:
+            print(f'Day{result.day:02} took {timings}')
+    solved_seconds = sum(r.seconds for r in results if not r.cached)
+    print(f'Total: {total:.2f}s (sum of days: {solved_seconds:.2f}s)')
+
+
+def print_caches(results: list[DayResult]) -> None:
+    lines = [f'Day{result.day:02} cache {stats}' for result in results for stats in result.caches]
+    if lines:
+        print()
+        print('\n'.join(lines))
+
+
+def print_memory(results: list[DayResult]) -> None:
+    from aoc.memory import format_bytes
+    print()
+    for result in results:
+        phases = [f'parse {format_bytes(result.parse_peak_bytes)} (rss {format_bytes(result.parse_rss_bytes)})']
+        phases += [f'part {part.part} {format_bytes(part.peak_bytes)} (rss {format_bytes(part.rss_bytes)})'
+                   for part in result.parts]
+        print(f'Day{result.day:02} peak memory: {", ".join(phases)}')
+
+
+def find_over_budget(results: list[DayResult], budgets: dict[int, int]) -> list[str]:
+    failures = []
+    for result in results:
+        budget = budgets.get(result.day)
+        if budget is not None and result.peak_bytes > budget:
+            failures.append(f'Day{result.day:02} peaked at {result.peak_bytes / 1024 ** 2:.1f}MiB, '
+                            f'over its {budget / 1024 ** 2:.1f}MiB budget')
+    return failures
+
+
+def print_profiles(results: list[DayResult], profile_dir: Path) -> None:
+    for result in results:
+        print()
+        print(f'Day{result.day:02} hottest functions (profiled run, see {profile_dir}/day{result.day:02}.pstats)')
+        for line in result.profile:
+            print(line)
+
+
+def test_run_day():
+    result = run_day(6)
+    assert result.day == 6
+    assert [(part.part, part.answer) for part in result.parts] == [(1, 4568778), (2, 28973936)]
+
+
+def test_solve_source_reports_caches():
+    source = (DAYS[16].directory / 'test_input.txt').read_text()
+    first = solve_source(16, source)
+    [stats] = first.caches
+    assert stats.name == 'day16.day16.new_headings' and stats.scope == 'process'
+    assert stats.hits > 0 and stats.peak_size > 0
+    # counts start again for each input, but a process scoped cache keeps its entries
+    assert solve_source(16, source).caches[0].misses == 0
+
+
+def test_write_records():
+    import io
+    result = DayResult(6, 1500, [PartResult(1, 288, 2500), PartResult(2, 71503, 4000, 2048, 4096)])
+    out = io.StringIO()
+    write_records([result], out, '2026-10-18T12:00:00+00:00')
+    first, second = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert (first['day'], first['part'], first['answer'], first['parse_ns'], first['solve_ns']) == (6, 1, 288, 1500, 2500)
+    assert first['peak_bytes'] is None and second['peak_bytes'] == 2048 and second['rss_bytes'] == 4096
+    assert second['host']['python'] == platform.python_version() and not second['cached']
+
+
+def test_cached_results_round_trip():
+    result = DayResult(6, 1_500_000, [PartResult(1, 288, 2_500_000)])
+    cached = DayResult.from_json(json.loads(json.dumps(result.to_json())))
+    assert (cached.parse_ns, cached.parts[0].solve_ns, cached.cached) == (1_500_000, 2_500_000, True)
+
+
+def test_grid_days_parse_the_same_from_grids():
+    for day in DAYS.values():
+        if day.grid:
+            solver = day.solvers()[0]
+            assert solver.parse_grids(day.read_grids()) == solver.parse(day.read_source())
+
+
+def test_run_day_profiled(tmp_path):
+    result = run_day(6, tmp_path)
+    assert [part.answer for part in result.parts] == [4568778, 28973936]
+    assert (tmp_path / 'day06.pstats').exists()
+    assert (tmp_path / 'day06.collapsed').read_text()
+    assert any('day06/day06.py' in line for line in result.profile)
+
+
+def test_run_day_tracking_memory():
+    result = run_day(11, track_memory=True)
+    assert [part.answer for part in result.parts] == [9165297, 568914596391]
+    assert result.parse_peak_bytes > 0
+    assert all(part.peak_bytes > 0 and part.rss_bytes > 0 for part in result.parts)
+    assert find_over_budget([result], {11: result.peak_bytes}) == []
+    assert len(find_over_budget([result], {11: result.peak_bytes - 1})) == 1
+
+
+def test_run_days_with_cache(tmp_path, capsys):
+    from aoc.cache import ResultCache
+    cache = ResultCache(tmp_path)
+    first = run_days([6], jobs=1, cache=cache)
+    second = run_days([6, 1], jobs=2, cache=cache)
+    assert not first[0].cached
+    assert second[0].cached and not second[1].cached
+    assert [part.answer for part in second[0].parts] == [4568778, 28973936]
+    assert run_days([6], jobs=1, cache=cache, refresh=True)[0].cached is False
+    assert 'Day06 cached, took' in capsys.readouterr().out
+
+
+def test_run_days_keeps_day_order(capsys):
+    results = run_days([6, 1], jobs=2)
+    assert [r.day for r in results] == [6, 1]
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0] == 'Day06 part 1: 4568778'
+    assert lines[2] == 'Day01 part 1: 55386'
+
+
+def test_run_days_splits_parts_across_workers(capsys):
+    [split] = run_days([16], jobs=2)
+    whole = run_day(16)
+    assert [(part.part, part.answer) for part in split.parts] == [(part.part, part.answer) for part in whole.parts]
+    [stats] = split.caches
+    assert stats.name == 'day16.day16.new_headings'
+    assert [part.part for part in run_days([21], jobs=2)[0].parts] == [1]
@@ -0,0 +1,19 @@
+def parametrize(argnames: str, argvalues: list):
+    # stands in for pytest.mark.parametrize so that importing a solution doesn't import pytest;
+    # conftest.py hands the recorded parameters to pytest at collection time
+    def decorate(func):
+        func.__dict__.setdefault('parametrize_args', []).append((argnames, argvalues))
+        return func
+    return decorate
+
+
+@parametrize('value, expected', [(1, 2), (2, 3)])
+def test_parametrize(value, expected):
+    assert value + 1 == expected
+
+
+def test_parametrize_records_arguments():
+    @parametrize('a', [1, 2])
+    def func(a):
+        pass
+    assert func.parametrize_args == [('a', [1, 2])]
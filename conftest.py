@@ -0,0 +1,3 @@
+def pytest_generate_tests(metafunc):
+    for argnames, argvalues in getattr(metafunc.function, 'parametrize_args', []):
+        metafunc.parametrize(argnames, argvalues)
@@ -1,23 +1,54 @@
-import pytest
+import mmap
 import re
 from pathlib import Path
+from typing import Iterable
+
+from aoc.testing import parametrize
 
 
 def run():
     with open(Path(__file__).parent / 'Input.txt') as f:
-        lines = f.read().split('\n')
+        lines = parse(f.read())
 
-    result = calc_all(lines)
+    result = solve_part1(lines)
     print(f'Day01 part 1: {result}')
 
 
+def parse(source: str) -> bytes:
+    # the whole input as one buffer for calc_all; streamed input arrives as lines instead
+    return source.encode()
+
+
+def solve_part1(data: bytes | Iterable[str]) -> int:
+    # parse()'s bytes, or the str lines aoc.lines.solve_streaming feeds it, as this day has no parse_line
+    return calc_all(data)
+
+
 def calc(value: str) -> int:
     numbers = re.sub('\\D', '', value)
     answer = f'{numbers[0]}{numbers[-1]}'
     return int(answer)
 
 
-def calc_all(data: list) -> int:
+BUFFER_TYPES = (bytes, bytearray, memoryview, mmap.mmap)
+# every byte but the digits and the newlines between lines
+NOT_DIGITS = bytes(c for c in range(256) if c not in b'0123456789\n')
+
+
+def calc_buffer(buffer: bytes) -> int:
+    # with everything but digits and newlines deleted, the first digit of a line is the byte after a newline and
+    # the last is the byte before one. Counting each of the ten '\n<digit>' and '<digit>\n' pairs sums them all
+    # without a Python step per line. Lines without a digit count as 0 rather than failing as calc() does.
+    digits = b'\n' + bytes(buffer).translate(None, NOT_DIGITS) + b'\n'
+    total = 0
+    for value, digit in enumerate(b'0123456789'):
+        total += 10 * value * digits.count(bytes((10, digit))) + value * digits.count(bytes((digit, 10)))
+    return total
+
+
+def calc_all(data: Iterable[str] | bytes) -> int:
+    if isinstance(data, BUFFER_TYPES):
+        return calc_buffer(data)
     total = 0
     for x in data:
         total += calc(x)
@@ -32,7 +63,7 @@ testdata = [
 ]
 
 
-@pytest.mark.parametrize("value, expected", testdata)
+@parametrize("value, expected", testdata)
 def test_calc(value: str, expected: int):
     # arrange
     # act
@@ -47,5 +78,19 @@ def test_calc_all():
     assert actual == 142
 
 
+def test_solve_part1():
+    source = '\n'.join(x for (x, y) in testdata)
+    assert solve_part1(parse(source)) == solve_part1(iter(source.split('\n'))) == 142
+
+
+def test_calc_buffer():
+    assert calc_all('\n'.join(x for (x, y) in testdata).encode()) == 142
+    assert calc_buffer(b'7\n\nab\r\n12x3\n') == 77 + 13
+    import random
+    rng = random.Random(1)
+    lines = [''.join(rng.choices('abc0123456789', k=rng.randint(1, 12))) + str(rng.randint(0, 9)) for _ in range(500)]
+    assert calc_buffer(memoryview('\n'.join(lines).encode())) == sum(map(calc, lines))
+
+
 if __name__ == '__main__':
     run()
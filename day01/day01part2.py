@@ -1,15 +1,26 @@
 from pathlib import Path
-import pytest
+from typing import Iterable
+
+from aoc.automaton import Scanner
+from aoc.testing import parametrize
 
 
 def run():
     with open(Path(__file__).parent / 'Input.txt') as f:
-        lines = f.read().split('\n')
+        lines = parse(f.read())
 
-    result = calc_all(lines)
+    result = solve_part2(lines)
     print(f'Day01 part 2: {result}')
 
 
+def parse(source: str) -> list[str]:
+    return source.split('\n')
+
+
+def solve_part2(lines: Iterable[str]) -> int:
+    return calc_all(lines)
+
+
 def calc(value: str) -> int:
 
     replacements = {
@@ -54,10 +65,22 @@ def calc(value: str) -> int:
     return int(f'{first_number}{last_number}')
 
 
-def calc_all(data: list) -> int:
+# calc (kept as the reference for aoc.differential) tries every word at every index, from each end. The words
+# and the digits themselves compile into one forward and one reverse automaton instead, and other languages'
+# number words only add states, not passes
+ENGLISH = {'zero': 0, 'one': 1, 'two': 2, 'three': 3, 'four': 4, 'five': 5, 'six': 6, 'seven': 7, 'eight': 8, 'nine': 9}
+DIGITS = {str(digit): digit for digit in range(10)}
+DIGIT_SCANNER = Scanner(ENGLISH | DIGITS)
+
+
+def calc_scanned(value: str, scanner: Scanner = DIGIT_SCANNER) -> int:
+    return 10 * scanner.first(value) + scanner.last(value)
+
+
+def calc_all(data: Iterable[str], scanner: Scanner = DIGIT_SCANNER) -> int:
     total = 0
     for x in data:
-        total += calc(x)
+        total += calc_scanned(x, scanner)
     return total
 
 
@@ -72,7 +95,7 @@ testdata = [
 ]
 
 
-@pytest.mark.parametrize("value, expected", testdata)
+@parametrize("value, expected", testdata)
 def test_calc(value: str, expected: int):
     # arrange
     # act
@@ -81,11 +104,24 @@ def test_calc(value: str, expected: int):
     assert result == expected
 
 
+@parametrize("value, expected", testdata)
+def test_calc_scanned(value: str, expected: int):
+    assert calc_scanned(value) == expected
+
+
 def test_calc_all():
     data = [x for (x, y) in testdata]
     actual = calc_all(data)
     assert actual == 281
 
 
+def test_calc_scanned_in_another_language():
+    german = {'null': 0, 'eins': 1, 'zwei': 2, 'drei': 3, 'vier': 4, 'fünf': 5, 'sechs': 6, 'sieben': 7, 'acht': 8,
+              'neun': 9}
+    scanner = Scanner(german | ENGLISH | DIGITS)
+    assert calc_scanned('zweiundvierzig', scanner) == 24
+    assert calc_all(['xachtfive', 'one2drei'], scanner) == 85 + 13
+
+
 if __name__ == '__main__':
     run()
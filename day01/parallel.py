@@ -0,0 +1,136 @@
+import argparse
+import mmap
+import os
+import time
+from pathlib import Path
+
+from aoc.automaton import Automaton
+from day01.day01part1 import calc_buffer
+from day01.day01part2 import DIGITS, ENGLISH
+
+
+def newline_chunks(buffer, count: int) -> list[(int, int)]:
+    # (start, end) of up to count pieces of the buffer of about the same size, each ending just after a newline
+    # (or at the end of the buffer), so no line is split between two of them
+    bounds = [0]
+    for k in range(1, count):
+        newline = buffer.find(b'\n', max(bounds[-1], len(buffer) * k // count))
+        if newline == -1:
+            break
+        bounds.append(newline + 1)
+    if bounds[-1] < len(buffer):
+        bounds.append(len(buffer))
+    return list(zip(bounds, bounds[1:]))
+
+def test_newline_chunks():
+    buffer = b'aa\nb\ncccc\nd\n\ne'
+    for count in range(1, 8):
+        chunks = newline_chunks(buffer, count)
+        assert b''.join(buffer[start:end] for start, end in chunks) == buffer
+        assert all(buffer[end - 1:end] == b'\n' for _, end in chunks[:-1])
+        assert len(chunks) <= count
+    assert newline_chunks(b'abc', 4) == [(0, 3)]
+    assert newline_chunks(b'', 2) == []
+
+
+BYTE_VOCABULARY = {word.encode(): value for word, value in (ENGLISH | DIGITS).items()}
+FORWARD = Automaton(BYTE_VOCABULARY)
+REVERSE = Automaton({word[::-1]: value for word, value in BYTE_VOCABULARY.items()})
+ZERO, NINE = ord('0'), ord('9')
+
+
+def scan_words(buffer, start: int, end: int) -> int:
+    # the part 2 total of the lines in buffer[start:end], read where they lie. Each line is walked in from its start
+    # with the forward automaton until its first digit or number word is known, then in from its end with the
+    # reverse automaton for the last one, so a byte is seldom looked at twice. A line with neither adds nothing.
+    total = 0
+    forward, forward_matches, longest = FORWARD.transitions, FORWARD.matches, FORWARD.longest
+    reverse, reverse_matches = REVERSE.transitions, REVERSE.matches
+    line_start = start
+    while line_start < end:
+        line_end = buffer.find(b'\n', line_start, end)
+        if line_end == -1:
+            line_end = end
+        for transitions, matches, positions, weight in (
+                (forward, forward_matches, range(line_start, line_end), 10),
+                (reverse, reverse_matches, range(line_end - 1, line_start - 1, -1), 1)):
+            state = 0
+            best = best_start = best_length = None
+            for steps, i in enumerate(positions):
+                state = transitions[state].get(buffer[i], 0)
+                match = matches[state]
+                if match is not None:
+                    length, value = match
+                    word_start = steps - length + 1
+                    if best_start is None or word_start < best_start or (
+                            word_start == best_start and length > best_length):
+                        best_start, best_length, best = word_start, length, value
+                # no later word can start before the best one
+                if best_start is not None and steps - longest + 1 >= best_start:
+                    break
+            total += weight * (best or 0)
+        line_start = line_end + 1
+    return total
+
+
+def test_scan_words():
+    from day01.day01part2 import calc_scanned
+    buffer = b'xx\n1abc2\npqr3stu8vwx\ntwone\neightwothree\n7pqrstsixteen\n\nzoneight234\nnone'
+    start = buffer.index(b'\n') + 1
+    lines = buffer[start:].decode().split('\n')
+    assert scan_words(buffer, start, len(buffer)) == sum(calc_scanned(line) for line in lines if line)
+    assert scan_words(buffer, 0, 2) == 0
+
+
+def scan_chunk(path: Path, start: int, end: int) -> (int, int):
+    # runs in a worker, which maps the file itself and reads only its own chunk, so just the offsets and the
+    # two totals cross between processes. Part 1 is summed at C speed by calc_buffer's translate and count over
+    # the chunk; only part 2's number words need the automata stepped in Python.
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        return calc_buffer(buffer[start:end]), scan_words(buffer, start, end)
+
+
+def calc_all(path: Path, jobs: int | None = None) -> (int, int):
+    # the part 1 and part 2 totals of a whole input file, a chunk per worker process
+    jobs = jobs or os.cpu_count() or 1
+    with open(path, 'rb') as f:
+        if f.seek(0, 2) == 0:  # an empty file can't be mapped
+            return 0, 0
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            chunks = newline_chunks(buffer, jobs)
+    if jobs == 1:
+        totals = [scan_chunk(path, start, end) for start, end in chunks]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=min(jobs, len(chunks))) as pool:
+            totals = list(pool.map(scan_chunk, [path] * len(chunks), *zip(*chunks)))
+    return sum(part1 for part1, _ in totals), sum(part2 for _, part2 in totals)
+
+def test_calc_all(tmp_path):
+    from aoc.generators import generate
+    from day01.day01part1 import calc_all as calc_all_part1, parse
+    from day01.day01part2 import calc_all as calc_all_part2
+    source = generate(1, 500, seed=2)
+    path = tmp_path / 'input.txt'
+    path.write_text(source + '\n')
+    expected = calc_all_part1(parse(source)), calc_all_part2(source.split('\n'))
+    assert calc_all(path, jobs=1) == expected
+    assert calc_all(path, jobs=3) == expected
+    (tmp_path / 'empty.txt').write_text('')
+    assert calc_all(tmp_path / 'empty.txt') == (0, 0)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description='Solve both parts of day 1 for a large input across processes')
+    parser.add_argument('input', type=Path, nargs='?', default=Path(__file__).parent / 'Input.txt')
+    parser.add_argument('-j', '--jobs', type=int, default=None, help='worker processes (default: one per core)')
+    args = parser.parse_args(argv)
+
+    start_time = time.perf_counter()
+    part1, part2 = calc_all(args.input, args.jobs)
+    print(f'Day01 part 1: {part1}')
+    print(f'Day01 part 2: {part2}')
+    print(f'took {time.perf_counter() - start_time:.2f}s')
+
+if __name__ == '__main__':
+    main()
@@ -1,39 +1,60 @@
-from typing import Tuple
+from array import array
+from typing import Iterable, Tuple
 
-import pytest
 from pathlib import Path
 
+from day02.games import GameTable
+from aoc.ints import ints, ints_by_line
+from aoc.testing import parametrize
+
 
 def run():
     with open(Path(__file__).parent / 'Input.txt') as f:
-        lines = f.read().split('\n')
+        lines = parse(f.read())
 
-    result = calc_all(lines)
+    result = solve_part1(lines)
     print(f'Day02 part 1: {result}')
 
 
-limits = {
-    'red': 12,
-    'green': 13,
-    'blue': 14
-}
-
-def calc(value: str) -> (int, bool):
-    items = value.split(':')
-    game = items[0]
-    game = int(game.split()[1])
-    subsets = items[1].split(';')
-    subsets = [ subset.split(',') for subset in subsets ]
-    for subset in subsets:
-        for item in subset:
-            colour = item.split()[1]
-            count = int(item.split()[0])
-            if count > limits.get(colour, 0):
-                return game, False
-    return game, True
-
-
-def calc_all(data: list) -> int:
+COLOURS = ('red', 'green', 'blue')
+
+
+def encode_colours(text: str) -> str:
+    # each colour becomes its index in COLOURS, so a game is all numbers: its id, then a count and colour per draw
+    for code, colour in enumerate(COLOURS):
+        text = text.replace(f' {colour}', f' {code}')
+    return text
+
+
+def parse(source: str) -> GameTable:
+    return GameTable.from_games(ints_by_line(encode_colours(source)))
+
+
+def parse_line(line: str) -> array:
+    return ints(encode_colours(line))
+
+
+def test_parse_line():
+    assert parse_line('Game 12: 3 blue, 4 red; 1 green').tolist() == [12, 3, 2, 4, 0, 1, 1]
+
+
+def solve_part1(games: GameTable | Iterable[array]) -> int:
+    return calc_all(games)
+
+
+limits = (12, 13, 14)  # red, green, blue
+
+def calc(game: array) -> (int, bool):
+    for count, colour in zip(game[1::2], game[2::2]):
+        if count > limits[colour]:
+            return game[0], False
+    return game[0], True
+
+
+def calc_all(data: GameTable | Iterable[array], limits: (int, int, int) = limits) -> int:
+    # a parsed table answers for any limits at once; games streamed in one by one are checked as they come
+    if isinstance(data, GameTable):
+        return data.sum_possible(limits)
     total = 0
     for x in data:
         game, result = calc(x)
@@ -51,20 +72,29 @@ testdata = [
 ]
 
 
-@pytest.mark.parametrize("value, expected", testdata)
+@parametrize("value, expected", testdata)
 def test_calc(value: str, expected: Tuple[int, bool]):
     # arrange
     # act
-    result = calc(value)
+    result = calc(parse_line(value))
     # assert
     assert result == expected
 
 
 def test_calc_all():
-    data = [x for (x, y) in testdata]
+    data = parse('\n'.join(x for (x, y) in testdata))
     actual = calc_all(data)
     assert actual == 8
 
 
+def test_calc_all_streamed():
+    assert calc_all(map(parse_line, (x for (x, y) in testdata))) == 8
+
+
+def test_calc_all_with_other_limits():
+    table = parse('\n'.join(x for (x, y) in testdata))
+    assert calc_all(table, (20, 13, 6)) == 1 + 2 + 3 + 5
+
+
 if __name__ == '__main__':
     run()
@@ -1,36 +1,35 @@
+from array import array
 from pathlib import Path
-import pytest
+from typing import Iterable
+
+from day02.day02part1 import parse, parse_line
+from day02.games import GameTable
+from aoc.testing import parametrize
 
 
 def run():
     with open(Path(__file__).parent / 'Input.txt') as f:
-        lines = f.read().split('\n')
+        lines = parse(f.read())
 
-    result = calc_all(lines)
+    result = solve_part2(lines)
     print(f'Day02 part 2: {result}')
 
 
-def calc(value: str) -> int:
-    subsets = value.split(':')[1].split(';')
-    subsets = [subset.split(',') for subset in subsets]
-    # print()
-    limits = {
-        'red': 0,
-        'green': 0,
-        'blue': 0,
-    }
-    for subset in subsets:
-        for item in subset:
-            colour = item.split()[1]
-            count = int(item.split()[0])
-            # print(f'colour: {colour}')
-            # print(f'count: {count}')
-            if count > limits.get(colour, 0):
-                limits[colour] = count
-    return limits['red'] * limits['green'] * limits['blue']
-
-
-def calc_all(data: list) -> int:
+def solve_part2(games: GameTable | Iterable[array]) -> int:
+    return calc_all(games)
+
+
+def calc(game: array) -> int:
+    limits = [0, 0, 0]  # red, green, blue
+    for count, colour in zip(game[1::2], game[2::2]):
+        if count > limits[colour]:
+            limits[colour] = count
+    return limits[0] * limits[1] * limits[2]
+
+
+def calc_all(data: GameTable | Iterable[array]) -> int:
+    if isinstance(data, GameTable):
+        return data.total_power()
     total = 0
     for x in data:
         total += calc(x)
@@ -46,20 +45,24 @@ testdata = [
 ]
 
 
-@pytest.mark.parametrize("value, expected", testdata)
+@parametrize("value, expected", testdata)
 def test_calc(value: str, expected: int):
     # arrange
     # act
-    result = calc(value)
+    result = calc(parse_line(value))
     # assert
     assert result == expected
 
 
 def test_calc_all():
-    data = [x for (x, y) in testdata]
+    data = parse('\n'.join(x for (x, y) in testdata))
     actual = calc_all(data)
     assert actual == 2286
 
 
+def test_calc_all_streamed():
+    assert calc_all(map(parse_line, (x for (x, y) in testdata))) == 2286
+
+
 if __name__ == '__main__':
     run()
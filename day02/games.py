@@ -0,0 +1,71 @@
+from array import array
+from typing import Iterable
+
+from aoc.testing import parametrize
+
+
+class GameTable:
+    # one row per game in columns: its id and the most cubes of each colour (red, green, blue) shown at once,
+    # which is all either part needs, so both answer from the one parse and part 1 takes any limits
+    __slots__ = ('ids', 'reds', 'greens', 'blues')
+
+    def __init__(self):
+        self.ids = array('q')
+        self.reds = array('q')
+        self.greens = array('q')
+        self.blues = array('q')
+
+    @classmethod
+    def from_games(cls, games: Iterable[array]) -> 'GameTable':
+        # each game is its id then a count and colour index per draw, as day02part1.parse_line gives
+        table = cls()
+        for game in games:
+            if not game:
+                continue
+            maxima = [0, 0, 0]
+            for count, colour in zip(game[1::2], game[2::2]):
+                if count > maxima[colour]:
+                    maxima[colour] = count
+            table.ids.append(game[0])
+            table.reds.append(maxima[0])
+            table.greens.append(maxima[1])
+            table.blues.append(maxima[2])
+        return table
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def sum_possible(self, limits: (int, int, int)) -> int:
+        # the ids of the games that never showed more of a colour than its limit
+        red, green, blue = limits
+        return sum(game for game, r, g, b in zip(self.ids, self.reds, self.greens, self.blues)
+                   if r <= red and g <= green and b <= blue)
+
+    def total_power(self) -> int:
+        return sum(r * g * b for r, g, b in zip(self.reds, self.greens, self.blues))
+
+
+test_games = [
+    array('q', [1, 3, 2, 4, 0, 1, 0, 2, 1, 6, 2, 2, 1]),
+    array('q', [7, 20, 0, 5, 2]),
+    array('q'),
+]
+
+def test_from_games():
+    table = GameTable.from_games(test_games)
+    assert len(table) == 2
+    assert [table.ids.tolist(), table.reds.tolist(), table.greens.tolist(), table.blues.tolist()] == [
+        [1, 7], [4, 20], [2, 0], [6, 5]]
+
+
+@parametrize('limits, expected', [
+    ((12, 13, 14), 1),
+    ((20, 2, 6), 8),
+    ((3, 13, 14), 0),
+])
+def test_sum_possible(limits, expected):
+    assert GameTable.from_games(test_games).sum_possible(limits) == expected
+
+
+def test_total_power():
+    assert GameTable.from_games(test_games).total_power() == 48
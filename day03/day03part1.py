@@ -1,15 +1,32 @@
-from typing import List, Tuple, Dict
-import pytest
+from typing import Tuple, Dict
 from pathlib import Path
 
+from aoc.grid import ALL_DIRECTIONS, Grid
+from aoc.gridfile import GridBuffer
+from day03.number_index import NumberIndex
+from aoc.testing import parametrize
+
 
 def run():
     with open(Path(__file__).parent / 'Input.txt') as f:
-        lines = f.read().split('\n')
+        lines = parse(f.read())
 
-    result = calc(lines)
+    result = solve_part1(lines)
     print(f'Day03 part 1: {result}')
 
+
+def parse(source: str) -> NumberIndex:
+    return NumberIndex.from_grid(Grid.from_text(source))
+
+
+def parse_grids(grids: list[GridBuffer]) -> NumberIndex:
+    return NumberIndex.from_grid(Grid.from_buffer(grids[0]))
+
+
+def solve_part1(index: NumberIndex) -> int:
+    return index.part_number_sum()
+
+
 def get_number(line: str, start_index: int) -> Tuple[int, int]:
     number = ''
     real_start = start_index
@@ -33,7 +50,7 @@ testdata_get_number = [
     (138,764,137),
     (139,764,137),
 ]
-@pytest.mark.parametrize("start_index, expected_number, expected_real_start", testdata_get_number)
+@parametrize("start_index, expected_number, expected_real_start", testdata_get_number)
 def test_get_number(start_index, expected_number, expected_real_start):
     # arrange
     input = '.......-.............343......750..661....%........+..323.....1..............480.........+..............198.......................533.../764'
@@ -48,38 +65,11 @@ def is_symbol(char: str) -> int:
     return 0 if (char.isdigit() or char == ".") else 1
 
 
-def get_adjacent_positions(position: Tuple[int, int], max_i, max_j) -> List[Tuple[int,int]]:
-    i, j = position
-    valid = []
-    for x in range(max(i-1,0),min(i+1, max_i)+1):
-        for y in range(max(j-1,0),min(j+1, max_j)+1):
-            if (x,y) != position:
-                valid.append((x,y))
-    return valid
-
-
-testdata_get_adjacent_spaces = [
-    ((0,0),[(0,1),(1,0),(1,1)]),
-    ((9,9),[(8,8),(8,9),(9,8)]),
-    ((5,5),[(4,4),(4,5),(4,6),(5,4),(5,6),(6,4),(6,5),(6,6)])
-]
-@pytest.mark.parametrize("position, expected", testdata_get_adjacent_spaces)
-def test_get_adjacent_positions(position, expected):
-    # arrange
-    position = (0,0)
-    max_i = max_j = 9
-    expected = [(0,1),(1,0),(1,1)]
-    # act
-    actual = get_adjacent_positions(position, max_i, max_j)
-    # assert
-    assert actual == expected
-
-
-def get_adjacent_numbers(i: int, j: int, data: List[str]) -> Dict[Tuple[int, int], int]:
+def get_adjacent_numbers(i: int, j: int, grid: Grid) -> Dict[Tuple[int, int], int]:
     adjacent_numbers = {}
-    for x, y in get_adjacent_positions((i, j), len(data), len(data[0])):
-        if data[x][y].isdigit():
-            number, real_start = get_number(data[x], y)
+    for x, y in grid.neighbours(i, j, ALL_DIRECTIONS):
+        if grid[x, y].isdigit():
+            number, real_start = get_number(grid.row(x), y)
             adjacent_numbers[(x, real_start)] = number
     return adjacent_numbers
 
@@ -104,7 +94,7 @@ testdata_get_adjacent_numbers = [
         (2,2): 35,
     })
 ]
-@pytest.mark.parametrize("i, j, expected", testdata_get_adjacent_numbers)
+@parametrize("i, j, expected", testdata_get_adjacent_numbers)
 def test_get_adjacent_numbers(i, j, expected):
     # arrange
     i = 1
@@ -114,17 +104,17 @@ def test_get_adjacent_numbers(i, j, expected):
         (2, 2): 35,
     }
     # act
-    actual = get_adjacent_numbers(i, j, testdata)
+    actual = get_adjacent_numbers(i, j, Grid.from_rows(testdata))
     # assert
     assert actual == expected
 
 
-def calc(data: List[str]) -> int:
+def calc(grid: Grid) -> int:
     valid_numbers = {} # position to value
-    for i, line in enumerate(data):
-        for j, item in enumerate(line):
+    for i in range(grid.height):
+        for j, item in enumerate(grid.row(i)):
             if is_symbol(item):
-                for position, number in get_adjacent_numbers(i, j, data).items():
+                for position, number in get_adjacent_numbers(i, j, grid).items():
                     valid_numbers[position] = number
     total = 0
     for number in valid_numbers.values():
@@ -134,8 +124,23 @@ def calc(data: List[str]) -> int:
 
 def test_calc():
     expected = 4361
-    actual = calc(testdata)
+    actual = calc(Grid.from_rows(testdata))
     assert actual == expected
+    assert calc_indexed(Grid.from_rows(testdata)) == expected
+
+
+def test_calc_symbols_on_the_edges():
+    grid = Grid.from_rows([
+        '12.',
+        '..3',
+        '4*#',
+    ])
+    assert calc(grid) == 7
+    assert calc_indexed(grid) == 7
+
+
+def calc_indexed(grid: Grid) -> int:
+    return NumberIndex.from_grid(grid).part_number_sum()
 
 
 if __name__ == '__main__':
@@ -1,31 +1,36 @@
-from typing import List
-import pytest
 from pathlib import Path
 
-from day03.day03part1 import get_adjacent_positions, get_number
+from day03.day03part1 import get_number, parse, parse_grids
+from aoc.grid import ALL_DIRECTIONS, Grid
+from day03.number_index import NumberIndex
 
 
 def run():
     with open(Path(__file__).parent / 'Input.txt') as f:
-        lines = f.read().split('\n')
+        lines = parse(f.read())
 
-    result = calc(lines)
+    result = solve_part2(lines)
     print(f'Day03 part 2: {result}')
 
-def calc(data: list) -> int:
+
+def solve_part2(index: NumberIndex) -> int:
+    return index.gear_ratio_sum()
+
+
+def calc(grid: Grid) -> int:
     total = 0
-    for i, line in enumerate(data):
-        for j, item in enumerate(line):
+    for i in range(grid.height):
+        for j, item in enumerate(grid.row(i)):
             if item == '*':
-                total += gear_result(i, j, data)
+                total += gear_result(i, j, grid)
     return total
 
-def gear_result(i: int, j: int, data: List[str]) -> int:
+def gear_result(i: int, j: int, grid: Grid) -> int:
     numbers = {} # starting position to value
     result = 1
-    for x, y in get_adjacent_positions((i, j), len(data), len(data[0])):
-        if data[x][y].isdigit():
-            number, real_start_index = get_number(data[x], y)
+    for x, y in grid.neighbours(i, j, ALL_DIRECTIONS):
+        if grid[x, y].isdigit():
+            number, real_start_index = get_number(grid.row(x), y)
             start_position = (x, real_start_index)
             if not start_position in numbers:
                 numbers[start_position] = number
@@ -33,6 +38,10 @@ def gear_result(i: int, j: int, data: List[str]) -> int:
     return result if len(numbers) == 2 else 0
 
 
+def calc_indexed(grid: Grid) -> int:
+    return NumberIndex.from_grid(grid).gear_ratio_sum()
+
+
 testdata = [
     "467..114..",
     "...*......",
@@ -47,8 +56,9 @@ testdata = [
 ]
 
 def test_calc_all():
-    actual = calc(testdata)
+    actual = calc(Grid.from_rows(testdata))
     assert actual == 467835
+    assert calc_indexed(Grid.from_rows(testdata)) == 467835
 
 
 if __name__ == '__main__':
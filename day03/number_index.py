@@ -0,0 +1,117 @@
+import re
+from array import array
+
+from aoc.grid import ALL_DIRECTIONS, Grid
+
+NUMBER_OR_SYMBOL = re.compile(rb'(\d+)|[^\d.]')
+STAR = ord('*')
+
+
+class NumberIndex:
+    # every number of a schematic labelled in one pass: labels[i] is the id of the number covering flat grid index
+    # i, or -1, and values, starts and ends (flat indices of its first and last digits) are indexed by id. Symbols
+    # then find their numbers by looking up their neighbours' labels, so no row is ever scanned twice.
+    __slots__ = ('labels', 'values', 'starts', 'ends', 'symbols', 'gears', 'offsets')
+
+    def __init__(self):
+        self.labels = array('l')
+        self.values = array('q')
+        self.starts = array('q')
+        self.ends = array('q')
+        self.symbols = array('q')  # flat indices of every symbol
+        self.gears = array('q')  # and of just the '*'s
+        self.offsets: list[int] = []
+
+    @classmethod
+    def from_grid(cls, grid: Grid) -> 'NumberIndex':
+        if grid.col_step != 1:
+            grid = grid.copy()  # a transposed or rotated view, whose rows don't run along the buffer
+        index = cls()
+        cells = bytes(grid.cells)
+        labels = index.labels
+        labels.extend([-1] * len(cells))
+        values, starts, ends = index.values, index.starts, index.ends
+        for y in range(grid.height):
+            # matched in place, so a match's span is already its flat indices
+            row_start = grid.index(y, 0)
+            for match in NUMBER_OR_SYMBOL.finditer(cells, row_start, row_start + grid.width):
+                start, end = match.span()
+                digits = match.group(1)
+                if digits is None:
+                    index.symbols.append(start)
+                    if cells[start] == STAR:
+                        index.gears.append(start)
+                    continue
+                number = len(values)
+                for i in range(start, end):
+                    labels[i] = number
+                values.append(int(digits))
+                starts.append(start)
+                ends.append(end - 1)
+        index.offsets = grid.offsets(ALL_DIRECTIONS)
+        return index
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, NumberIndex) and all(
+            getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def adjacent(self, index: int) -> set[int]:
+        # ids of the numbers next to a cell. Steps off the sides of a row land on separators, which have no
+        # label, so only the first and last rows need a bounds check
+        labels = self.labels
+        size = len(labels)
+        numbers = {labels[index + offset] for offset in self.offsets if 0 <= index + offset < size}
+        numbers.discard(-1)
+        return numbers
+
+    def part_number_sum(self) -> int:
+        # each number once, however many symbols it touches
+        parts = set()
+        for symbol in self.symbols:
+            parts |= self.adjacent(symbol)
+        values = self.values
+        return sum(values[number] for number in parts)
+
+    def gear_ratio_sum(self) -> int:
+        values = self.values
+        total = 0
+        for gear in self.gears:
+            numbers = self.adjacent(gear)
+            if len(numbers) == 2:
+                first, second = numbers
+                total += values[first] * values[second]
+        return total
+
+
+test_rows = [
+    '467..114..',
+    '...*......',
+    '..35..633.',
+    '......#...',
+    '617*......',
+]
+
+def test_from_grid():
+    grid = Grid.from_rows(test_rows)
+    index = NumberIndex.from_grid(grid)
+    assert index.values.tolist() == [467, 114, 35, 633, 617]
+    assert [grid.position(start) for start in index.starts] == [(0, 0), (0, 5), (2, 2), (2, 6), (4, 0)]
+    assert [grid.position(end) for end in index.ends] == [(0, 2), (0, 7), (2, 3), (2, 8), (4, 2)]
+    assert [index.labels[grid.index(2, x)] for x in range(10)] == [-1, -1, 2, 2, -1, -1, 3, 3, 3, -1]
+    assert [grid.position(symbol) for symbol in index.symbols] == [(1, 3), (3, 6), (4, 3)]
+    assert [grid.position(gear) for gear in index.gears] == [(1, 3), (4, 3)]
+
+
+def test_adjacent():
+    grid = Grid.from_rows(test_rows)
+    index = NumberIndex.from_grid(grid)
+    assert index.adjacent(grid.index(1, 3)) == {0, 2}
+    assert index.adjacent(grid.index(4, 3)) == {4}
+    assert index.adjacent(grid.index(0, 8)) == {1}
+    assert index.adjacent(grid.index(4, 9)) == set()
+
+
+def test_sums():
+    index = NumberIndex.from_grid(Grid.from_rows(test_rows))
+    assert index.part_number_sum() == 467 + 35 + 633 + 617
+    assert index.gear_ratio_sum() == 467 * 35
@@ -1,22 +1,45 @@
-from typing import Tuple, Set, List
+from array import array
+from typing import Iterable, Tuple, Set
 
-import pytest
 from pathlib import Path
 
+from aoc.ints import ints
+from aoc.testing import parametrize
+
 
 def run():
     with open(Path(__file__).parent / 'Input.txt') as f:
-        lines = f.read().split('\n')
+        lines = parse(f.read())
 
-    result = calc_all(lines)
+    result = solve_part1(lines)
     print(f'Day04 part 1: {result}')
 
 
-def seperate_numbers(line: str) -> Tuple[Set[int], List[int]]:
-    inputs = line.split(':')[1].split('|')
-    winners = { int(x) for x in inputs[0].strip().split(' ') if x != '' }
-    ours = [ int(x) for x in inputs[1].strip().split(' ') if x != '' ]
-    return winners, ours
+def parse(source: str) -> list[Tuple[Set[int], array]]:
+    # every card has as many numbers as the first, so they're all pulled out in one go and cut up into cards
+    first_line = source.split('\n', 1)[0]
+    winner_count = len(ints(first_line.split('|')[0])) - 1  # less the card number
+    width = len(ints(first_line))
+    numbers = ints(source)
+    if len(numbers) % width:
+        raise ValueError(f'Cards should all have {width} numbers, including the card number')
+    return [
+        (set(numbers[i + 1:i + 1 + winner_count]), numbers[i + 1 + winner_count:i + width])
+        for i in range(0, len(numbers), width)
+    ]
+
+
+def parse_line(line: str) -> Tuple[Set[int], array]:
+    return seperate_numbers(line)
+
+
+def solve_part1(cards: Iterable[Tuple[Set[int], array]]) -> int:
+    return calc_all(cards)
+
+
+def seperate_numbers(line: str) -> Tuple[Set[int], array]:
+    winners, ours = line.split(':')[1].split('|')
+    return set(ints(winners)), ints(ours)
 
 def test_seperate_numbers():
     line = 'Card 1: 41 48 83 86 17 | 83 86  6 31 17  9 48 53'
@@ -24,10 +47,14 @@ def test_seperate_numbers():
     expected_ours = [83, 86, 6, 31, 17, 9, 48, 53]
     winners, ours = seperate_numbers(line)
     assert winners == expected_winners
-    assert ours == expected_ours
+    assert ours.tolist() == expected_ours
+
+def test_parse():
+    source = '\n'.join(value for value, _ in testdata)
+    assert parse(source) == [parse_line(value) for value, _ in testdata]
 
-def calculate_score(value: str) -> int:
-    winners, ours = seperate_numbers(value)
+def calculate_score(card: Tuple[Set[int], array]) -> int:
+    winners, ours = card
     matching_numbers = [ x for x in ours if x in winners ]
     matches = len(matching_numbers)
     points = 0 if matches == 0 else pow(2, matches - 1)
@@ -41,23 +68,23 @@ testdata = [
     ('Card 5: 87 83 26 28 32 | 88 30 70 12 93 22 82 36', 0),
     ('Card 6: 31 18 13 56 72 | 74 77 10 23 35 67 36 11', 0),
 ]
-@pytest.mark.parametrize("value, expected", testdata)
+@parametrize("value, expected", testdata)
 def test_calculate_score(value: str, expected: int):
     # arrange
     # act
-    result = calculate_score(value)
+    result = calculate_score(parse_line(value))
     # assert
     assert result == expected
 
 
-def calc_all(data: list) -> int:
+def calc_all(data: Iterable[Tuple[Set[int], array]]) -> int:
     total = 0
     for x in data:
         total += calculate_score(x)
     return total
 
 def test_calc_all():
-    data = [x for (x, y) in testdata]
+    data = parse('\n'.join(x for (x, y) in testdata))
     actual = calc_all(data)
     assert actual == 13
 
@@ -1,20 +1,27 @@
-from typing import List
+from array import array
+from collections import deque
+from typing import Iterable, Tuple, Set
 
-import pytest
 from pathlib import Path
 
-from day04.day04part1 import seperate_numbers
+from day04.day04part1 import parse, parse_line
+from aoc.testing import parametrize
 
 
 def run():
     with open(Path(__file__).parent / 'Input.txt') as f:
-        lines = f.read().split('\n')
+        lines = parse(f.read())
 
-    result = calc_all(lines)
+    result = solve_part2(lines)
     print(f'Day04 part 2: {result}')
 
-def calculate_score(value: str) -> int:
-    winners, ours = seperate_numbers(value)
+
+def solve_part2(cards: Iterable[Tuple[Set[int], array]]) -> int:
+    return calc_all(cards)
+
+
+def calculate_score(card: Tuple[Set[int], array]) -> int:
+    winners, ours = card
     matching_numbers = [ x for x in ours if x in winners ]
     return len(matching_numbers)
 
@@ -26,26 +33,26 @@ testdata = [
     ('Card 5: 87 83 26 28 32 | 88 30 70 12 93 22 82 36', 0),
     ('Card 6: 31 18 13 56 72 | 74 77 10 23 35 67 36 11', 0),
 ]
-@pytest.mark.parametrize("value, expected", testdata)
+@parametrize("value, expected", testdata)
 def test_calculate_score(value: str, expected: int):
     # arrange
     # act
-    result = calculate_score(value)
+    result = calculate_score(parse_line(value))
     # assert
     assert result == expected
 
-def get_card_scores(data: List[str]) -> List[int]:
-    return [ calculate_score(line) for line in data ]
-
-def calc_all(data: list) -> int:
-    scores = get_card_scores(data)
-    counts = [ 1 for _ in data ]
-    for card, score in enumerate(scores):
-        for x in range(card, card + score):
-            counts[x+1] += counts[card]
+def calc_all(data: Iterable[Tuple[Set[int], array]]) -> int:
+    # a card only wins copies of the next few cards, so only those counts need keeping
+    won_copies = deque()
     total_count = 0
-    for count in counts:
+    for card in data:
+        count = 1 + (won_copies.popleft() if won_copies else 0)
         total_count += count
+        for x in range(calculate_score(card)):
+            if x < len(won_copies):
+                won_copies[x] += count
+            else:
+                won_copies.append(count)
     return total_count
 
 testdata = [
@@ -57,7 +64,7 @@ testdata = [
     'Card 6: 31 18 13 56 72 | 74 77 10 23 35 67 36 11',
 ]
 def test_calc_all():
-    actual = calc_all(testdata)
+    actual = calc_all(parse('\n'.join(testdata)))
     assert actual == 30
 
 
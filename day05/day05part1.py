@@ -1,25 +1,37 @@
-from typing import List
+from typing import List, Tuple
 
 from pathlib import Path
 
 from day05.mappers import Mapper, ChainedMapper, MiniMapper
+from aoc.ints import ints
 
 
 def run():
-    with open(Path(__file__).parent / f'0.txt') as f:
-        seeds = get_seeds(f.read().split('\n')[0])
-    mappers = []
-    for x in range(1, 8):
-        with open(Path(__file__).parent / f'{x}.txt') as f:
-            map_strings = f.read().split('\n')[1:]
-            mini_mappers = [ MiniMapper(map_string) for map_string in map_strings ]
-            mappers.append(Mapper(mini_mappers))
-    chained_mapper = ChainedMapper(mappers)
-    result = chained_mapper.get_min_mapped(seeds)
+    with open(Path(__file__).parent / 'Input.txt') as f:
+        almanac = parse(f.read())
+
+    result = solve_part1(almanac)
     print(f'Day05 part 1: {result}')
 
+
+def parse(source: str) -> Tuple[List[int], ChainedMapper]:
+    sections = source.split('\n\n')
+    seeds = get_seeds(sections[0].split('\n')[0])
+    mappers = []
+    for section in sections[1:]:
+        # after the 'x-to-y map:' header, dest, source and length triples
+        numbers = iter(ints(section.split(':', 1)[1]))
+        mini_mappers = [ MiniMapper(*triple) for triple in zip(numbers, numbers, numbers) ]
+        mappers.append(Mapper(mini_mappers))
+    return seeds, ChainedMapper(mappers)
+
+
+def solve_part1(almanac: Tuple[List[int], ChainedMapper]) -> int:
+    seeds, chained_mapper = almanac
+    return chained_mapper.get_min_mapped(seeds)
+
 def get_seeds(seed_string: str) -> List[int]:
-    return [int(x) for x in seed_string.split(':')[1].strip().split()]
+    return ints(seed_string).tolist()
 
 def test_get_seeds():
     test_seeds = 'seeds: 79 14 55 13'
@@ -27,6 +39,44 @@ def test_get_seeds():
     actual = get_seeds(test_seeds)
     assert actual == expected
 
+test_almanac = '''seeds: 79 14 55 13
+
+seed-to-soil map:
+50 98 2
+52 50 48
+
+soil-to-fertilizer map:
+0 15 37
+37 52 2
+39 0 15
+
+fertilizer-to-water map:
+49 53 8
+0 11 42
+42 0 7
+57 7 4
+
+water-to-light map:
+88 18 7
+18 25 70
+
+light-to-temperature map:
+45 77 23
+81 45 19
+68 64 13
+
+temperature-to-humidity map:
+0 69 1
+1 0 69
+
+humidity-to-location map:
+60 56 37
+56 93 4
+'''
+
+def test_solve_part1():
+    assert solve_part1(parse(test_almanac)) == 35
+
 
 if __name__ == '__main__':
     run()
@@ -1,22 +1,24 @@
-from typing import Tuple
+from typing import List, Tuple
 from pathlib import Path
-from day05.day05part1 import  get_seeds
-from day05.mappers import Mapper, ChainedMapper, MiniMapper
+from day05.day05part1 import get_seeds, parse, test_almanac
+from day05.mappers import ChainedMapper
 
 
 def run():
-    with open(Path(__file__).parent / f'0.txt') as f:
-        seed_ranges = get_seeds_range(f.read().split('\n')[0])
-    mappers = []
-    for x in range(1, 8):
-        with open(Path(__file__).parent / f'{x}.txt') as f:
-            mappers.append(Mapper([MiniMapper(line) for line in f.read().split('\n')[1:]]))
-    chained_mapper = ChainedMapper(mappers)
-    result = chained_mapper.get_min_mapped_range(seed_ranges)
+    with open(Path(__file__).parent / 'Input.txt') as f:
+        almanac = parse(f.read())
+
+    result = solve_part2(almanac)
     print(f'Day05 part 2: {result}')
 
+def solve_part2(almanac: Tuple[List[int], ChainedMapper]) -> int:
+    seeds, chained_mapper = almanac
+    return chained_mapper.get_min_mapped_range(pair_seed_ranges(seeds))
+
 def get_seeds_range(seeds_string: str) -> [Tuple[int, int]]:
-    seed_range_inputs = get_seeds(seeds_string)
+    return pair_seed_ranges(get_seeds(seeds_string))
+
+def pair_seed_ranges(seed_range_inputs: List[int]) -> [Tuple[int, int]]:
     seeds = []
     for i, start in enumerate(seed_range_inputs):
         if i % 2 != 0:
@@ -30,5 +32,8 @@ def test_get_seeds_range():
     actual = get_seeds_range("seeds: 79 14 55 13")
     assert actual == expected
 
+def test_solve_part2():
+    assert solve_part2(parse(test_almanac)) == 46
+
 if __name__ == '__main__':
     run()
\ No newline at end of file
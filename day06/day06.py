@@ -1,26 +1,41 @@
 from math import sqrt, ceil, floor
+from pathlib import Path
 from typing import Dict, Tuple
-import pytest
 
-def run():
-    # Time:        48     98     90     83
-    # Distance:   390   1103   1112   1360
-    races = {
-        48: 390,
-        98: 1103,
-        90: 1112,
-        83: 1360,
-    }
+from aoc.testing import parametrize
 
-    races2 = {
-        48989083: 390110311121360
-    }
+def run():
+    with open(Path(__file__).parent / 'Input.txt') as f:
+        races = parse(f.read())
 
-    result = get_multiplied_margins_of_error(races)
-    result2 = get_multiplied_margins_of_error(races2)
+    result = solve_part1(races)
+    result2 = solve_part2(races)
     print(f'Day06 part 1: {result}')
     print(f'Day06 part 2: {result2}')
 
+def parse(source: str) -> Dict[int, int]:
+    lines = source.split('\n')
+    times = [int(x) for x in lines[0].split(':')[1].split()]
+    distances = [int(x) for x in lines[1].split(':')[1].split()]
+    return dict(zip(times, distances))
+
+def test_parse():
+    source = 'Time:      7  15   30\nDistance:  9  40  200'
+    assert parse(source) == {7: 9, 15: 40, 30: 200}
+
+def solve_part1(races: Dict[int, int]) -> int:
+    return get_multiplied_margins_of_error(races)
+
+def solve_part2(races: Dict[int, int]) -> int:
+    # the spaces between the numbers are just bad kerning
+    time = int(''.join(str(x) for x in races.keys()))
+    distance = int(''.join(str(x) for x in races.values()))
+    return get_margin_of_error(time, distance)
+
+def test_solve_part2():
+    races = {7: 9, 15: 40, 30: 200}
+    assert solve_part2(races) == 71503
+
 
 def get_speeds_for_exact_matches(time, distance) -> Tuple[float, float]:
     # where T = total race time, d = record distance
@@ -32,7 +47,7 @@ def get_speeds_for_exact_matches(time, distance) -> Tuple[float, float]:
     b = (time + sqrt(pow(time, 2) - 4 * distance)) / 2
     return a, b
 
-@pytest.mark.parametrize("time, distance, expected", [
+@parametrize("time, distance, expected", [
     (7, 9, (2.0, 5.0)),
     (15, 40, (4.0, 11.0)),
 ])
@@ -57,7 +72,7 @@ def get_winning_limits(time, distance) -> Tuple[int, int]:
     a, b = a + win_margin, b - win_margin
     return int(ceil(a)), int(floor(b))
 
-@pytest.mark.parametrize("time, distance, expected", [
+@parametrize("time, distance, expected", [
     (7, 9, (2, 5)),
     (15, 40, (4, 11)),
     (30, 200, (11, 19)),
@@ -70,7 +85,7 @@ def get_margin_of_error(time: int, distance: int) -> int:
     a, b = get_winning_limits(time, distance)
     return b - a + 1
 
-@pytest.mark.parametrize("time, distance, expected", [
+@parametrize("time, distance, expected", [
     (7, 9, 4),
     (15, 40, 8),
     (71530, 940200, 71503)
@@ -2,9 +2,10 @@ from enum import Enum
 from functools import cmp_to_key
 from typing import List
 
-import pytest
 from pathlib import Path
 
+from aoc.testing import parametrize
+
 class Rank(Enum):
     FiveOfAKind = 7  # AAAAA
     FourOfAKind = 6  # AA8AA
@@ -23,12 +24,20 @@ class Card(Enum):
 
 def run():
     with open(Path(__file__).parent / 'Input.txt') as f:
-        lines = f.read().split('\n')
+        lines = parse(f.read())
 
-    result = calc_total_winnings(lines)
+    result = solve_part1(lines)
     print(f'Day07 part 1: {result}')
 
 
+def parse(source: str) -> list[str]:
+    return source.split('\n')
+
+
+def solve_part1(lines: list[str]) -> int:
+    return calc_total_winnings(lines)
+
+
 def get_rank(hand: str) -> Rank:
     counts = {}
     for card in hand:
@@ -52,7 +61,7 @@ def get_rank(hand: str) -> Rank:
     else:
         raise Exception(f'Unable to determine Rank: {hand}')
 
-@pytest.mark.parametrize('hand, expected', [
+@parametrize('hand, expected', [
     ('AAAAA', Rank.FiveOfAKind),
     ('AA8AA', Rank.FourOfAKind),
     ('23332', Rank.FullHouse),
@@ -77,7 +86,7 @@ def is_left_card_higher(left_card: str, right_card: str) -> bool:
         right = Card[right_card]
         return left.value > right.value
 
-@pytest.mark.parametrize('left_card, right_card, expected', [
+@parametrize('left_card, right_card, expected', [
     ('A', 'K', True),
     ('K', 'A', False),
     ('A', 'A', False),
@@ -97,7 +106,7 @@ def is_left_higher_by_card(left: str, right: str) -> bool:
             return is_left_card_higher(left_card, right_card)
     return False
 
-@pytest.mark.parametrize('left, right, expected', [
+@parametrize('left, right, expected', [
     ('33332', '2AAAA', True),
     ('2AAAA', '33332', False),
     ('77888', '77788', True),
@@ -119,7 +128,7 @@ def compare_hands(left: str, right: str) -> int: # -ve means left higher, 0 mean
     else:
         return -1 if is_left_higher_by_card(left, right) else 1
 
-@pytest.mark.parametrize("left, right, expected", [
+@parametrize("left, right, expected", [
     ('32T3K', 'KK677', 1),
     ('KK677', 'KTJJT', -1),
 ])
@@ -127,6 +136,32 @@ def test_compare_hands(left, right, expected):
     actual = compare_hands(left, right)
     assert actual == expected
 
+# the fast path, kept in step with compare_hands (sort_lines is the reference for aoc.differential): one sort
+# key per hand instead of a rank and a card by card walk per comparison
+CARD_VALUES = {card: value for value, card in enumerate('23456789TJQKA', 2)}
+RANKS_BY_COUNTS = {
+    (5, 0): Rank.FiveOfAKind.value,
+    (4, 1): Rank.FourOfAKind.value,
+    (3, 2): Rank.FullHouse.value,
+    (3, 1): Rank.ThreeOfAKind.value,
+    (2, 2): Rank.TwoPair.value,
+    (2, 1): Rank.OnePair.value,
+    (1, 1): Rank.HighCard.value,
+}
+
+def hand_key(hand: str) -> tuple[int, ...]:
+    counts = sorted(map(hand.count, set(hand)), reverse=True) + [0]
+    return (RANKS_BY_COUNTS[counts[0], counts[1]],) + tuple(map(CARD_VALUES.__getitem__, hand))
+
+@parametrize("left, right, expected", [
+    ('32T3K', 'KK677', False),
+    ('KK677', 'KTJJT', True),
+    ('KK677', 'KK677', False),
+    ('2AAAA', '33332', False),
+])
+def test_hand_key(left, right, expected):
+    assert (hand_key(left) > hand_key(right)) == expected
+
 def compare_lines(left, right):
     left_hand = left.split()[0]
     right_hand = right.split()[0]
@@ -146,6 +181,13 @@ def test_sort_lines():
     actual = sort_lines(test_lines)
     assert actual == expected
 
+def sort_lines_by_key(lines: List[str]) -> List[str]:
+    # reverse=True keeps equal hands in input order, so this is exactly sort_lines' order
+    return sorted(lines, key=lambda line: hand_key(line.split()[0]), reverse=True)
+
+def test_sort_lines_by_key():
+    assert sort_lines_by_key(test_lines + ['KK677 1']) == sort_lines(test_lines + ['KK677 1'])
+
 def sort_hands(hands: List[str]) -> List[str]:
     return sorted(hands, key=cmp_to_key(compare_hands))
 
@@ -170,7 +212,7 @@ def test_sort_hands():
     assert actual == expected
 
 def calc_total_winnings(lines: List[str]) -> int:
-    sorted_lines = reversed(sort_lines(lines))
+    sorted_lines = reversed(sort_lines_by_key(lines))
     total = 0
     for rank, line in enumerate(sorted_lines):
         total += (rank + 1) * int(line.split()[1])
@@ -2,10 +2,10 @@ from enum import Enum
 from functools import cmp_to_key
 from typing import List
 
-import pytest
 from pathlib import Path
 
-from day07.day07part1 import Rank
+from day07.day07part1 import Rank, parse
+from aoc.testing import parametrize
 
 class Card(Enum):
     A = 14
@@ -16,12 +16,16 @@ class Card(Enum):
 
 def run():
     with open(Path(__file__).parent / 'Input.txt') as f:
-        lines = f.read().split('\n')
+        lines = parse(f.read())
 
-    result = calc_total_winnings(lines)
+    result = solve_part2(lines)
     print(f'Day07 part 2: {result}')
 
 
+def solve_part2(lines: list[str]) -> int:
+    return calc_total_winnings(lines)
+
+
 def get_rank(hand: str) -> Rank:
     counts = {}
     single_jack_bonus = False
@@ -89,7 +93,7 @@ def get_rank(hand: str) -> Rank:
     else:
         raise Exception(f'Unable to determine Rank: {hand}')
 
-@pytest.mark.parametrize('hand, expected', [
+@parametrize('hand, expected', [
     ('AAAAA', Rank.FiveOfAKind),
     ('AA8AA', Rank.FourOfAKind),
     ('23332', Rank.FullHouse),
@@ -110,7 +114,7 @@ def is_left_card_higher(left_card: str, right_card: str) -> bool:
     right_value = int(right_card) if right_card.isdigit() else Card[right_card].value
     return left_value > right_value
 
-@pytest.mark.parametrize('left_card, right_card, expected', [
+@parametrize('left_card, right_card, expected', [
     ('A', 'K', True),
     ('K', 'A', False),
     ('A', 'A', False),
@@ -132,7 +136,7 @@ def is_left_higher_by_card(left: str, right: str) -> bool:
             return is_left_card_higher(left_card, right_card)
     return False
 
-@pytest.mark.parametrize('left, right, expected', [
+@parametrize('left, right, expected', [
     ('33332', '2AAAA', True),
     ('2AAAA', '33332', False),
     ('77888', '77788', True),
@@ -154,7 +158,7 @@ def compare_hands(left: str, right: str) -> int: # -ve means left higher, 0 mean
     else:
         return -1 if is_left_higher_by_card(left, right) else 1
 
-@pytest.mark.parametrize("left, right, expected", [
+@parametrize("left, right, expected", [
     ('32T3K', 'KK677', 1),
     ('KK677', 'KTJJT', 1),
 ])
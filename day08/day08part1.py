@@ -1,20 +1,29 @@
 import re
 from typing import List, Tuple, Dict
 
-import pytest
 from pathlib import Path
 
+from aoc.graph import Graph
+
 
 def run():
     with open(Path(__file__).parent / 'Input.txt') as f:
-        lines = f.read().split('\n')
+        documents = parse(f.read())
+
+    result = solve_part1(documents)
+    print(f'Day08 part 1: {result}')
+
 
+def parse(source: str) -> Tuple[str, Graph]:
+    lines = source.split('\n')
     directions = lines[0]
-    nodes = lines[2:]
+    nodes = [line for line in lines[2:] if line]
+    return directions, Graph.from_adjacency(parse_nodes(nodes))
 
-    result = count_steps_to_end(directions, nodes)
-    print(f'Day08 part 1: {result}')
 
+def solve_part1(documents: Tuple[str, Graph]) -> int:
+    directions, graph = documents
+    return traverse_map(directions, graph)
 
 
 def parse_nodes(nodes: List[str]) -> Dict[str, Tuple[str, str]]:
@@ -51,27 +60,26 @@ def test_parse_node_string():
     assert actual == expected
 
 
-def traverse_map(directions: str, node_map: Dict[str, Tuple[str, str]]) -> int:
-    current_node = node_map['AAA']
+def get_steps(directions: str) -> List[int]:
+    # every node has a left then a right edge, so a step is an offset into its edges
+    return [0 if direction == 'L' else 1 for direction in directions]
+
+def traverse_map(directions: str, graph: Graph) -> int:
+    offsets, targets = graph.offsets, graph.targets
+    current_node = graph.id('AAA')
+    end_node = graph.id('ZZZ')
     total_steps = 0
+    steps = get_steps(directions)
     while True:
-        for direction in directions:
+        for step in steps:
             total_steps += 1
-            if direction == 'L':
-                new_node = current_node[0]
-            else:
-                new_node = current_node[1]
-            if new_node == 'ZZZ':
-                break
-            current_node = node_map[new_node]
-        else:
-            continue
-        break
-    return total_steps
+            current_node = targets[offsets[current_node] + step]
+            if current_node == end_node:
+                return total_steps
 
 def count_steps_to_end(directions: str, nodes: List[str]):
-    node_map = parse_nodes(nodes)
-    result = traverse_map(directions, node_map)
+    graph = Graph.from_adjacency(parse_nodes(nodes))
+    result = traverse_map(directions, graph)
     return result
 
 def test_count_steps_to_end():
@@ -85,6 +93,10 @@ def test_count_steps_to_end():
     actual = count_steps_to_end(directions, nodes)
     assert actual == expected
 
+def test_solve_part1():
+    source = 'LLR\n\nAAA = (BBB, BBB)\nBBB = (AAA, ZZZ)\nZZZ = (ZZZ, ZZZ)'
+    assert solve_part1(parse(source)) == 6
+
 
 if __name__ == '__main__':
     run()
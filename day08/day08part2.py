@@ -1,48 +1,61 @@
 from math import lcm
 from typing import List, Dict, Tuple
 
-import pytest
 from pathlib import Path
 
-from day08.day08part1 import parse_nodes
+from day08.day08part1 import get_steps, parse_nodes, parse
+from aoc.graph import Graph
 
 
 def run():
     with open(Path(__file__).parent / 'Input.txt') as f:
-        lines = f.read().split('\n')
+        documents = parse(f.read())
 
-    directions = lines[0]
-    nodes = lines[2:]
-
-    result = parallel_count_steps_to_end(directions, nodes)
+    result = solve_part2(documents)
     print(f'Day08 part 2: {result}')
 
-def traverse_map(start_node: str, directions: str, node_map: Dict[str, Tuple[str, str]]) -> int:
-    current_node = node_map[start_node]
+def solve_part2(documents: Tuple[str, Graph]) -> int:
+    directions, graph = documents
+    return parallel_traverse_map(directions, graph)
+
+def traverse_map(start_node: int, directions: str, graph: Graph) -> int:
+    offsets, targets = graph.offsets, graph.targets
+    is_end = [name[2] == 'Z' for name in graph.names]
+    current_node = start_node
     total_steps = 0
+    steps = get_steps(directions)
     while True:
-        for direction in directions:
+        for step in steps:
             total_steps += 1
-            if direction == 'L':
-                new_node = current_node[0]
-            else:
-                new_node = current_node[1]
-            if new_node[2] == 'Z':
-                break
-            current_node = node_map[new_node]
-        else:
-            continue
-        break
-    return total_steps
+            current_node = targets[offsets[current_node] + step]
+            if is_end[current_node]:
+                return total_steps
 
 def parallel_count_steps_to_end(directions: str, nodes: List[str]) -> int:
-    node_map = parse_nodes(nodes)
+    graph = Graph.from_adjacency(parse_nodes(nodes))
+    return parallel_traverse_map(directions, graph)
+
+def parallel_traverse_map(directions: str, graph: Graph) -> int:
     loop_length: Dict[str, int] = {}
-    for starting_node in [ x for x in node_map.keys() if x[2] == 'A' ]:
-        loop_length[starting_node] = traverse_map(starting_node, directions, node_map)
+    for starting_node in [ i for i, name in enumerate(graph.names) if name[2] == 'A' ]:
+        loop_length[graph.names[starting_node]] = traverse_map(starting_node, directions, graph)
     result = lcm(*list(loop_length.values()))
     return result
 
+def test_parallel_count_steps_to_end():
+    directions = 'LR'
+    nodes = [
+        'QQA = (QQB, XXX)',
+        'QQB = (XXX, QQZ)',
+        'QQZ = (QQB, XXX)',
+        'RRA = (RRB, XXX)',
+        'RRB = (RRC, RRC)',
+        'RRC = (RRZ, RRZ)',
+        'RRZ = (RRB, RRB)',
+        'XXX = (XXX, XXX)',
+    ]
+    assert parallel_count_steps_to_end(directions, nodes) == 6
+
 
 if __name__ == '__main__':
     run()
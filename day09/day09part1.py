@@ -1,14 +1,31 @@
-import pytest
+from array import array
 from pathlib import Path
+from typing import Iterable, Sequence
+
+from aoc.ints import ints, ints_by_line
+from aoc.testing import parametrize
 
 
 def run():
     with open(Path(__file__).parent / 'Input.txt') as f:
-        lines = f.read().split('\n')
+        lines = parse(f.read())
 
-    result = calc_all(lines)
+    result = solve_part1(lines)
     print(f'Day09 part 1: {result}')
 
+
+def parse(source: str) -> list[array]:
+    return ints_by_line(source)
+
+
+def parse_line(line: str) -> array:
+    return ints(line)
+
+
+def solve_part1(histories: Iterable[Sequence[int]]) -> int:
+    return calc_all(histories)
+
+
 def append_values(levels: list[list[int]]):
     for a, b in list(zip(levels, levels[1:]))[::-1]:
         a.append(a[-1] + b[-1])
@@ -59,7 +76,7 @@ def are_all_zeros(numbers: list[int]) -> bool:
             return False
     return True
 
-@pytest.mark.parametrize("numbers, expected", [
+@parametrize("numbers, expected", [
     ([0,0,0,0], True),
     ([0,1,0,0], False),
     ([0,0,0,-1], False),
@@ -71,16 +88,16 @@ def test_are_all_zeros(numbers, expected):
 def find_rate_of_change(numbers: list[int]) -> list[int]:
     return [b - a for a, b in zip(numbers, numbers[1:])]
 
-@pytest.mark.parametrize("numbers, expected", [
+@parametrize("numbers, expected", [
     ([1, 3, 6, 10, 15, 21], [2, 3, 4, 5, 6]),
 ])
 def test_find_rate_of_change(numbers, expected):
     actual = find_rate_of_change(numbers)
     assert actual == expected
 
-def calc(value: str) -> int:
-    numbers = [int(x) for x in value.split()]
-    levels = calculate_all_levels(numbers)
+def calc(history: Sequence[int]) -> int:
+    # a list, as the levels get appended to
+    levels = calculate_all_levels(list(history))
     append_values(levels)
     return levels[0][-1]
 
@@ -91,12 +108,12 @@ testdata =[
     ("10 13 16 21 30 45", 68),
 ]
 
-@pytest.mark.parametrize("value, expected", testdata)
+@parametrize("value, expected", testdata)
 def test_calc(value: str, expected: int):
-    result = calc(value)
+    result = calc(parse_line(value))
     assert result == expected
 
-def calc_all(data: list) -> int:
+def calc_all(data: Iterable[Sequence[int]]) -> int:
     total = 0
     for x in data:
         total += calc(x)
@@ -104,7 +121,7 @@ def calc_all(data: list) -> int:
 
 
 def test_calc_all():
-    data = [x for (x, y) in testdata]
+    data = parse('\n'.join(x for (x, y) in testdata))
     actual = calc_all(data)
     assert actual == 114
 
@@ -1,16 +1,22 @@
-import pytest
 from pathlib import Path
+from typing import Iterable, Sequence
 
-from day09.day09part1 import calculate_all_levels
+from day09.day09part1 import calculate_all_levels, parse, parse_line
+from aoc.testing import parametrize
 
 
 def run():
     with open(Path(__file__).parent / 'Input.txt') as f:
-        lines = f.read().split('\n')
+        lines = parse(f.read())
 
-    result = calc_all(lines)
+    result = solve_part2(lines)
     print(f'Day09 part 2: {result}')
 
+
+def solve_part2(histories: Iterable[Sequence[int]]) -> int:
+    return calc_all(histories)
+
+
 def append_values(levels: list[list[int]]):
     levels[-1].append(0)
     for a, b in list(zip(levels, levels[1:]))[::-1]:
@@ -33,9 +39,9 @@ def test_append_values():
     append_values(levels)
     assert levels == expected
 
-def calc(value: str) -> int:
-    numbers = [int(x) for x in value.split()]
-    levels = calculate_all_levels(numbers)
+def calc(history: Sequence[int]) -> int:
+    # a list, as the levels get appended to
+    levels = calculate_all_levels(list(history))
     append_values(levels)
     return levels[0][-1]
 
@@ -46,12 +52,12 @@ testdata =[
     ("10 13 16 21 30 45", 5),
 ]
 
-@pytest.mark.parametrize("value, expected", testdata)
+@parametrize("value, expected", testdata)
 def test_calc(value: str, expected: int):
-    result = calc(value)
+    result = calc(parse_line(value))
     assert result == expected
 
-def calc_all(data: list) -> int:
+def calc_all(data: Iterable[Sequence[int]]) -> int:
     total = 0
     for x in data:
         total += calc(x)
@@ -59,7 +65,7 @@ def calc_all(data: list) -> int:
 
 
 def test_calc_all():
-    data = [x for (x, y) in testdata]
+    data = parse('\n'.join(x for (x, y) in testdata))
     actual = calc_all(data)
     assert actual == 2
 
@@ -1,18 +1,54 @@
-import pytest
 from pathlib import Path
 
+from aoc.grid import Grid
+from aoc.gridfile import GridBuffer
+
 
 def run():
     with open(Path(__file__).parent / 'Input.txt') as f:
-        rows = f.read().split('\n')
-    start_char = 'J'
+        sketch = parse(f.read())
 
-    result = length_to_furthest_point(rows, start_char)
+    result = solve_part1(sketch)
     print(f'Day10 part 1: {result}')
 
-def take_step(rows: list[str], current_position: (int, int), previous_position: (int, int)) -> (int, int):
+def parse(source: str) -> (Grid, str):
+    grid = Grid.from_text(source)
+    return grid, infer_start_char(grid)
+
+
+def parse_grids(grids: list[GridBuffer]) -> (Grid, str):
+    grid = Grid.from_buffer(grids[0])
+    return grid, infer_start_char(grid)
+
+def solve_part1(sketch: (Grid, str)) -> int:
+    grid, start_char = sketch
+    # copy, as the start char gets written into the grid
+    return length_to_furthest_point(grid.copy(), start_char)
+
+def infer_start_char(grid: Grid) -> str:
+    i, j = get_starting_position(grid)
+    up = i > 0 and grid[i - 1, j] in '|7F'
+    down = i < grid.height - 1 and grid[i + 1, j] in '|LJ'
+    left = j > 0 and grid[i, j - 1] in '-LF'
+    right = j < grid.width - 1 and grid[i, j + 1] in '-J7'
+    match up, down, left, right:
+        case True, True, _, _:
+            return '|'
+        case _, _, True, True:
+            return '-'
+        case True, _, _, True:
+            return 'L'
+        case True, _, True, _:
+            return 'J'
+        case _, True, True, _:
+            return '7'
+        case _, True, _, True:
+            return 'F'
+    raise ValueError(f'unable to infer pipe at start: {(i, j)}')
+
+def take_step(grid: Grid, current_position: (int, int), previous_position: (int, int)) -> (int, int):
     i, j = current_position
-    char = rows[i][j]
+    char = grid[i, j]
     a = b = None
     match char:
         case '|':
@@ -35,12 +71,8 @@ def take_step(rows: list[str], current_position: (int, int), previous_position:
             b = i + 1, j
     return a if a != previous_position else b
 
-def get_starting_position(rows) -> (int, int):
-    for i, row in enumerate(rows):
-        for j, char in enumerate(row):
-            if char == 'S':
-                return i, j
-    raise ValueError
+def get_starting_position(grid: Grid) -> (int, int):
+    return grid.find('S')
 
 test_rows = [
         '..F7.',
@@ -49,23 +81,26 @@ test_rows = [
         '|F--J',
         'LJ...',
     ]
+test_grid = Grid.from_rows(test_rows)
 test_start_char = 'F'
 
 def test_get_starting_position():
     expected = (2, 0)
-    actual = get_starting_position(test_rows)
+    actual = get_starting_position(test_grid)
     assert actual == expected
 
-def length_to_furthest_point(rows: list[str], start_char: str) -> int:
-    start_position = get_starting_position(rows)
-    i, j = start_position
-    rows[i] = rows[i][:j] + start_char + rows[i][j+1:] if j != 0 else start_char + rows[i][j+1:]
+def test_infer_start_char():
+    assert infer_start_char(test_grid) == test_start_char
+
+def length_to_furthest_point(grid: Grid, start_char: str) -> int:
+    start_position = get_starting_position(grid)
+    grid[start_position] = start_char
     current_position = start_position
     total_steps = 0
     previous_position = None
     new_position = None
     while new_position != start_position:
-        new_position = take_step(rows, current_position, previous_position)
+        new_position = take_step(grid, current_position, previous_position)
         total_steps += 1
         previous_position = current_position
         current_position = new_position
@@ -74,7 +109,7 @@ def length_to_furthest_point(rows: list[str], start_char: str) -> int:
 
 def test_length_to_furthest_point():
     expected = 8
-    actual = length_to_furthest_point(test_rows, test_start_char)
+    actual = length_to_furthest_point(test_grid.copy(), test_start_char)
     assert actual == expected
 
 if __name__ == '__main__':
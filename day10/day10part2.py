@@ -1,28 +1,32 @@
-import pytest
 from pathlib import Path
 
-from day10.day10part1 import get_starting_position
+from day10.day10part1 import get_starting_position, parse, parse_grids
+from aoc.grid import ALL_DIRECTIONS, Grid
 
 
 def run():
     with open(Path(__file__).parent / 'Input.txt') as f:
-        rows = f.read().split('\n')
-    start_char = 'J'
+        sketch = parse(f.read())
 
-    result = area_enclosed_by_loop(rows, start_char)
+    result = solve_part2(sketch)
     print(f'Day10 part 2: {result}')
 
-def get_char_at(rows: list[str], position: (int, int)) -> str:
-    i, j = position
-    return rows[i][j]
+# cells of the path and region grids
+MARKED = 'O'
+UNMARKED = '.'
+PATH = '#'
 
-def set_position(array: list[list[int]], position, value) -> None:
-    x, y, = position
-    if 0 <= x < len(array) and 0 <= y < len(array[0]):
-        array[x][y] = 1 if value else 0
+def solve_part2(sketch: (Grid, str)) -> int:
+    grid, start_char = sketch
+    # copy, as the start char gets written into the grid
+    return area_enclosed_by_loop(grid.copy(), start_char)
+
+def set_position(grid: Grid, position, value) -> None:
+    if grid.in_bounds(*position):
+        grid[position] = MARKED if value else UNMARKED
 
 def take_step2(
-        rows: list[str],
+        grid: Grid,
         current_position: (int, int),
         previous_position: (int, int),
         path,
@@ -31,7 +35,7 @@ def take_step2(
 ) -> (int, int):
     i, j = current_position
     set_position(path, current_position, True)
-    char = rows[i][j]
+    char = grid[i, j]
     next_position = None
     left = i, j - 1
     right = i, j + 1
@@ -109,60 +113,87 @@ def take_step2(
     set_position(path, next_position, True)
     return next_position
 
-def area_enclosed_by_loop(rows: list[str], start_char: str) -> int:
-    start_position = get_starting_position(rows)
-    i, j = start_position
-    rows[i] = rows[i][:j] + start_char + rows[i][j + 1:] if j != 0 else start_char + rows[i][j + 1:]
+def area_enclosed_by_loop(grid: Grid, start_char: str) -> int:
+    blue, red = mark_regions(grid, start_char)
+    blue_is_good, blue_size = fill_and_count_region(blue)
+    _, red_size = fill_and_count_region(red)
+    return blue_size if blue_is_good else red_size
+
+def mark_regions(grid: Grid, start_char: str) -> (Grid, Grid):
+    # walks the loop, marking the cells either side of it in two regions with the loop itself drawn in as PATH
+    start_position = get_starting_position(grid)
+    grid[start_position] = start_char
     current_position = start_position
     previous_position = None
     new_position = None
 
-    is_path = [[0]*len(rows[0]) for _ in rows]
-    blue = [[0]*len(rows[0]) for _ in rows] # this could be the inside region or outside, we don't know yet
-    red = [[0]*len(rows[0]) for _ in rows] # so could this
+    is_path = Grid.filled(grid.width, grid.height, UNMARKED)
+    blue = Grid.filled(grid.width, grid.height, UNMARKED) # this could be the inside region or outside, we don't know yet
+    red = Grid.filled(grid.width, grid.height, UNMARKED) # so could this
 
     while new_position != start_position:
-        new_position = take_step2(rows, current_position, previous_position, is_path, blue, red)
+        new_position = take_step2(grid, current_position, previous_position, is_path, blue, red)
         previous_position = current_position
         current_position = new_position
 
     mark_path(blue, is_path)
     mark_path(red, is_path)
-    blue_is_good, blue_size = expand_and_count_region(blue)
-    _, red_size = expand_and_count_region(red)
-    return blue_size if blue_is_good else red_size
+    return blue, red
 
-def mark_path(array, path):
-    for i, row in enumerate(array):
-        for j, char in enumerate(row):
-            if path[i][j]:
-                array[i][j] = 8
+def mark_path(region: Grid, path: Grid):
+    for i in range(path.height):
+        for j, char in enumerate(path.row(i)):
+            if char == MARKED:
+                region[i, j] = PATH
 
 def get_neighbours(i: int, j: int) -> list[(int, int)]:
     return [ (x, y) for x in range(i - 1, i + 2) for y in range(j - 1, j + 2) if not (x, y) == (i, j) ]
 
-def is_out_of_bounds(position, array) -> bool:
-    x, y = position
-    return x < 0 or y < 0 or x >= len(array) or y >= len(array[0])
+def is_out_of_bounds(position, grid: Grid) -> bool:
+    return not grid.in_bounds(*position)
 
-def expand_and_count_region(array) -> (bool, int):
+def expand_and_count_region(region: Grid) -> (bool, int):
     dirty = True
     total_area = 0
     while dirty:
         dirty = False
         total_area = 0
-        for i, row in enumerate(array):
-            for j, char in enumerate(row):
-                if char == 1:
+        for i in range(region.height):
+            for j, char in enumerate(region.row(i)):
+                if char == MARKED:
                     total_area += 1
                     for neighbour in get_neighbours(i, j):
-                        if is_out_of_bounds(neighbour, array):
+                        if is_out_of_bounds(neighbour, region):
                             return False, -1
-                        elif get_char_at(array, neighbour) == 0:
-                            set_position(array, neighbour, 1)
+                        elif region[neighbour] == UNMARKED:
+                            region[neighbour] = MARKED
                             dirty = True
     return True, total_area
 
+def fill_and_count_region(region: Grid) -> (bool, int):
+    # the same result as expand_and_count_region (kept as the reference for aoc.differential) from one fill out
+    # of the marked cells over flat indices, rather than sweeping the whole grid until nothing changes
+    cells = region.cells
+    marked, unmarked = ord(MARKED), ord(UNMARKED)
+    offsets = region.offsets(ALL_DIRECTIONS)
+    frontier = [index for index, cell in enumerate(cells) if cell == marked]
+    area = len(frontier)
+    while frontier:
+        index = frontier.pop()
+        for offset in offsets:
+            neighbour = index + offset
+            if not region.contains_index(neighbour):
+                return False, -1
+            if cells[neighbour] == unmarked:
+                cells[neighbour] = marked
+                frontier.append(neighbour)
+                area += 1
+    return True, area
+
+def test_fill_and_count_region():
+    region = Grid.from_rows(['#####', '#O..#', '#.#.#', '#####'])
+    assert fill_and_count_region(region) == (True, 5)
+    assert fill_and_count_region(Grid.from_rows(['#O.', '###'])) == (False, -1)
 
 
 def test_area_enclosed_by_loop():
@@ -178,7 +209,7 @@ def test_area_enclosed_by_loop():
         '...........',
     ]
     start_char = 'F'
-    actual = area_enclosed_by_loop(rows, start_char)
+    actual = area_enclosed_by_loop(Grid.from_rows(rows), start_char)
     assert actual == 4
 
 
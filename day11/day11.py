@@ -1,19 +1,33 @@
 import time
-import pytest
 from pathlib import Path
 
+from aoc.gridfile import GridBuffer
+from aoc.testing import parametrize
+
 
 def run():
     with open(Path(__file__).parent / 'Input.txt') as f:
-        lines = f.read().split('\n')
+        lines = parse(f.read())
+
+    start_time = time.perf_counter()
+    result1 = solve_part1(lines)
+    print(f'Day11 part 1: {result1} (in {(time.perf_counter() - start_time):.2f}s)')
+
+    start_time = time.perf_counter()
+    result2 = solve_part2(lines)
+    print(f'Day11 part 2: {result2} (in {(time.perf_counter() - start_time):.2f}s)')
+
+def parse(source: str) -> list[str]:
+    return source.split('\n')
+
+def parse_grids(grids: list[GridBuffer]) -> list[str]:
+    return grids[0].rows()
 
-    start_time = time.time()
-    result1 = sum_of_shortest_paths(lines, 1)
-    print(f'Day11 part 1: {result1} (in {(time.time() - start_time):.2f}s)')
+def solve_part1(lines: list[str]) -> int:
+    return sum_of_shortest_paths(lines, 1)
 
-    start_time = time.time()
-    result2 = sum_of_shortest_paths(lines, 1000000)
-    print(f'Day11 part 2: {result2} (in {(time.time() - start_time):.2f}s)')
+def solve_part2(lines: list[str]) -> int:
+    return sum_of_shortest_paths(lines, 1000000)
 
 def find_empty_space(rows: list[str]) -> (list[int], list[int]):
     empty_rows = [True] * len(rows)
@@ -61,7 +75,7 @@ def find_galaxies(rows: list[str], empty_rows, empty_columns, expansion_factor)
 test_galaxies = [
     '..#'
 ]
-@pytest.mark.parametrize('expansion_factor, expected', [
+@parametrize('expansion_factor, expected', [
     (1, [(0, 2)]),
     (2, [(0, 4)]),
     (10, [(0, 20)])
@@ -96,7 +110,7 @@ def sum_of_shortest_paths(rows: list[str], expansion_factor) -> int:
             total += get_shortest_path(x, y)
     return total
 
-@pytest.mark.parametrize('expansion_factor, expected', [
+@parametrize('expansion_factor, expected', [
     (2, 374),
     (10, 1030),
     (100, 8410),
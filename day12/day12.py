@@ -1,19 +1,30 @@
 import time
 from pathlib import Path
-import pytest
-from functools import cache
+from typing import Iterable
+
+from aoc import memo
+from aoc.testing import parametrize
 
 def run():
     with open(Path(__file__).parent / 'Input.txt') as f:
-        lines = f.read().split('\n')
+        lines = parse(f.read())
+
+    start_time = time.perf_counter()
+    result1 = solve_part1(lines)
+    print(f'Day12 part 1: {result1} (in {(time.perf_counter() - start_time):.2f}s)')
+
+    start_time = time.perf_counter()
+    result2 = solve_part2(lines)
+    print(f'Day12 part 2: {result2} (in {(time.perf_counter() - start_time):.2f}s)')
 
-    start_time = time.time()
-    result1 = sum_all_arrangements(lines, False)
-    print(f'Day12 part 1: {result1} (in {(time.time() - start_time):.2f}s)')
+def parse(source: str) -> list[str]:
+    return source.split('\n')
 
-    start_time = time.time()
-    result2 = sum_all_arrangements(lines, True)
-    print(f'Day12 part 2: {result2} (in {(time.time() - start_time):.2f}s)')
+def solve_part1(lines: Iterable[str]) -> int:
+    return sum_all_arrangements(lines, False)
+
+def solve_part2(lines: Iterable[str]) -> int:
+    return sum_all_arrangements(lines, True)
 
 def unfold_input(value: str, pattern: str) -> (str, list[int]):
     new_value = value
@@ -161,7 +172,7 @@ test_arrangements= [
     ]),
 ]
 
-@cache
+@memo.memoised('input')
 def recursive_count_arrangements(value: str, pattern_str: str) -> int:
     pattern = [] if len(pattern_str) == 0 else [int(x) for x in pattern_str.split(',')]
     if not pattern:
@@ -198,13 +209,39 @@ def recursive_count_arrangements(value: str, pattern_str: str) -> int:
 
     return result
 
-@pytest.mark.parametrize('row, arrangements', test_arrangements)
+@parametrize('row, arrangements', test_arrangements)
 def test_recursive_count_arrangements(row, arrangements):
     value, pattern = split_row(row)
     expected = len(arrangements)
     actual = recursive_count_arrangements(value, pattern)
     assert actual == expected
 
+def table_count_arrangements(value: str, pattern_str: str) -> int:
+    # the same count as recursive_count_arrangements (kept as the reference for aoc.differential), from a table
+    # filled from the end of the row back: ways[i][j] is the number of ways groups j onwards fit value[i:]
+    groups = [] if len(pattern_str) == 0 else [int(x) for x in pattern_str.split(',')]
+    n, m = len(value), len(groups)
+    # how many springs from i on could all be damaged
+    runs = [0] * (n + 1)
+    for i in range(n - 1, -1, -1):
+        runs[i] = 0 if value[i] == '.' else runs[i + 1] + 1
+    ways = [[0] * (m + 1) for _ in range(n + 2)]
+    ways[n][m] = ways[n + 1][m] = 1
+    for i in range(n - 1, -1, -1):
+        row, skip = ways[i], ways[i + 1]
+        if value[i] != '#':
+            row[:] = skip
+        for j in range(m):
+            size = groups[j]
+            # a group here has to be followed by the end of the row or an operational spring
+            if runs[i] >= size and (i + size == n or value[i + size] != '#'):
+                row[j] += ways[i + size + 1][j + 1]
+    return ways[0][0]
+
+@parametrize('row, arrangements', test_arrangements)
+def test_table_count_arrangements(row, arrangements):
+    assert table_count_arrangements(*split_row(row)) == len(arrangements)
+
 testdata = [
     ('???.### 1,1,3', 1),
     ('.??..??...?##. 1,1,3', 4),
@@ -218,15 +255,14 @@ def count_arrangements(row: str, unfold: bool) -> int:
     value, pattern = split_row(row)
     if unfold:
         value, pattern = unfold_input(value, pattern)
-    count = recursive_count_arrangements(value, pattern)
-    return count
+    return table_count_arrangements(value, pattern)
 
-@pytest.mark.parametrize("value, expected", testdata)
+@parametrize("value, expected", testdata)
 def test_count_arrangements(value, expected):
     actual = count_arrangements(value, False)
     assert actual == expected
 
-def sum_all_arrangements(lines: list[str], unfold: bool) -> int:
+def sum_all_arrangements(lines: Iterable[str], unfold: bool) -> int:
     total = 0
     for i, row in enumerate(lines):
         total += count_arrangements(row, unfold)
@@ -2,31 +2,45 @@ import time
 from itertools import groupby
 from pathlib import Path
 
-import pytest
+from aoc.grid import Grid
+from aoc.gridfile import GridBuffer
+from aoc.testing import parametrize
 
 
 def run():
     with open(Path(__file__).parent / 'Input.txt') as f:
-        lines = f.read().split('\n')
-    patterns = [list(g) for k, g in groupby(lines, key=lambda x: x == '') if not k]
+        patterns = parse(f.read())
 
-    start_time = time.time()
-    result1 = summarize_notes(patterns, False)
-    print(f'Day13 part 1: {result1} (in {(time.time() - start_time):.2f}s)')
+    start_time = time.perf_counter()
+    result1 = solve_part1(patterns)
+    print(f'Day13 part 1: {result1} (in {(time.perf_counter() - start_time):.2f}s)')
 
-    start_time = time.time()
-    result2 = summarize_notes(patterns, True)
-    print(f'Day13 part 2: {result2} (in {(time.time() - start_time):.2f}s)')
+    start_time = time.perf_counter()
+    result2 = solve_part2(patterns)
+    print(f'Day13 part 2: {result2} (in {(time.perf_counter() - start_time):.2f}s)')
 
-def find_mirror_with_transpose(pattern: list[str], smudge: bool) -> (int, bool):
-    horizontal_mirror = find_mirror(pattern, smudge)
+def parse(source: str) -> list[Grid]:
+    lines = source.split('\n')
+    return [Grid.from_rows(list(g)) for k, g in groupby(lines, key=lambda x: x == '') if not k]
+
+def parse_grids(grids: list[GridBuffer]) -> list[Grid]:
+    return [Grid.from_buffer(grid) for grid in grids]
+
+def solve_part1(patterns: list[Grid]) -> int:
+    return summarize_notes(patterns, False)
+
+def solve_part2(patterns: list[Grid]) -> int:
+    return summarize_notes(patterns, True)
+
+def find_mirror_with_transpose(pattern: Grid, smudge: bool) -> (int, bool):
+    horizontal_mirror = find_mirror(pattern.rows(), smudge)
     if horizontal_mirror is not None:
         return horizontal_mirror, False
-    vertical_mirror = find_mirror(transpose(pattern), smudge)
+    vertical_mirror = find_mirror(pattern.transposed().rows(), smudge)
     if vertical_mirror is not None:
         return vertical_mirror, True
     else:
-        raise Exception(f'No mirror found in pattern: {pattern}')
+        raise Exception(f'No mirror found in pattern:\n{pattern}')
 
 def test_find_mirror_with_transpose():
     pattern = test_data[1]
@@ -48,14 +62,6 @@ def test_find_mirror_with_transpose4():
     actual = find_mirror_with_transpose(pattern, False)
     assert actual == (0, True)
 
-def transpose(pattern: list[str]) -> list[str]:
-    return [''.join(x) for x in zip(*pattern)]
-
-def test_transpose():
-    data = ['123', '456']
-    expected = ['14', '25', '36']
-    assert transpose(data) == expected
-
 def verify_mirror(pattern: list[str], mirror_index: int) -> bool:
     for i in reversed(range(mirror_index + 1)):
         j = (mirror_index + 1) + (mirror_index - i)
@@ -65,7 +71,7 @@ def verify_mirror(pattern: list[str], mirror_index: int) -> bool:
             return False
     return True
 
-test_data = [
+test_rows = [
     [
         '#.##..##.',
         '..#.##.#.',
@@ -115,12 +121,13 @@ test_data = [
         '..#.#..',
     ],
 ]
+test_data = [Grid.from_rows(rows) for rows in test_rows]
 
-@pytest.mark.parametrize('pattern, index, expected', [
-    (test_data[1], 3, True),
-    (test_data[1], 0, False),
-    (test_data[2], 0, True),
-    (transpose(test_data[3]), 0, True),
+@parametrize('pattern, index, expected', [
+    (test_rows[1], 3, True),
+    (test_rows[1], 0, False),
+    (test_rows[2], 0, True),
+    (test_data[3].transposed().rows(), 0, True),
 ])
 def test_verify_mirror(pattern, index, expected):
     assert verify_mirror(pattern, index) == expected
@@ -137,7 +144,7 @@ def match_except_smudge(pattern1: str, pattern2: str) -> bool:
     return smudge_count == 1
 
 
-@pytest.mark.parametrize('value1, value2, expected', [
+@parametrize('value1, value2, expected', [
     ('...', '..#', True),
     ('...', '...', False),
     ('##.', '...', False),
@@ -160,10 +167,10 @@ def verify_smudged_mirror(pattern: list[str], mirror_index: int):
     return smudge_count == 1
 
 def test_verify_smudged_mirror():
-    assert verify_smudged_mirror(test_data[0], 2) == True
-    assert verify_smudged_mirror(test_data[1], 0) == True
-    # assert verify_smudged_mirror(test_data[2], 0) == True
-    # assert verify_smudged_mirror(transpose(test_data[3]), 0) == True
+    assert verify_smudged_mirror(test_rows[0], 2) == True
+    assert verify_smudged_mirror(test_rows[1], 0) == True
+    # assert verify_smudged_mirror(test_rows[2], 0) == True
+    # assert verify_smudged_mirror(test_data[3].transposed().rows(), 0) == True
 
 def find_mirror(pattern: list[str], smudge: bool) -> int:
     potentials = [i for i in range(len(pattern) - 1) if pattern[i] == pattern[i + 1]]
@@ -178,11 +185,11 @@ def find_mirror(pattern: list[str], smudge: bool) -> int:
     return mirrors[0] if mirrors else None
 
 def test_find_mirror():
-    pattern = test_data[1]
+    pattern = test_rows[1]
     actual = find_mirror(pattern, False)
     assert actual == 3
 
-def get_summary(pattern: list[str], smudge: bool) -> int:
+def get_summary(pattern: Grid, smudge: bool) -> int:
     index, is_vert = find_mirror_with_transpose(pattern, smudge)
     count = index + 1
     return count if is_vert else count * 100
@@ -192,7 +199,7 @@ def test_get_summary():
     assert get_summary(test_data[0], False) == 5
     assert get_summary(test_data[1], False) == 400
 
-def summarize_notes(patterns: list[list[str]], smudge: bool) -> int:
+def summarize_notes(patterns: list[Grid], smudge: bool) -> int:
     total = 0
     for pattern in patterns:
         total += get_summary(pattern, smudge)
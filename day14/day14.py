@@ -1,22 +1,36 @@
 import time
 
-import pytest
 from pathlib import Path
 
-from day13.day13 import transpose
+from aoc.grid import Grid
+from aoc.gridfile import GridBuffer
+from aoc.testing import parametrize
 
 
 def run():
     with open(Path(__file__).parent / 'Input.txt') as f:
-        lines = f.read().split('\n')
+        lines = parse(f.read())
 
-    start_time = time.time()
-    result1 = calc_north_load(lines)
-    print(f'Day14 part 1: {result1} (in {(time.time() - start_time):.2f}s)')
+    start_time = time.perf_counter()
+    result1 = solve_part1(lines)
+    print(f'Day14 part 1: {result1} (in {(time.perf_counter() - start_time):.2f}s)')
 
-    start_time = time.time()
-    lines, load = cycle(lines, 1000000000)
-    print(f'Day14 part 2: {load} (in {(time.time() - start_time):.2f}s)')
+    start_time = time.perf_counter()
+    load = solve_part2(lines)
+    print(f'Day14 part 2: {load} (in {(time.perf_counter() - start_time):.2f}s)')
+
+def parse(source: str) -> Grid:
+    return Grid.from_text(source)
+
+def parse_grids(grids: list[GridBuffer]) -> Grid:
+    return Grid.from_buffer(grids[0])
+
+def solve_part1(grid: Grid) -> int:
+    return calc_north_load(grid)
+
+def solve_part2(grid: Grid) -> int:
+    _, load = cycle(grid, 1000000000)
+    return load
 
 
 test_data = [
@@ -32,41 +46,36 @@ test_data = [
     '#OO..#....',
 ]
 
-def cycle(lines: list[str], times: int) -> (list[str], int):
-    seen: dict[int, int] = {}
-    lines = rotate_90_anticlockwise(lines)
+def cycle(grid: Grid, times: int) -> (Grid, int):
+    seen: dict[bytes, int] = {}
+    # tilts happen in place, on a copy viewed with north to the left
+    grid = grid.copy().rotated_anticlockwise()
     for i in range(times):
-        lines = inner_cycle(lines)
-        line_hash = hash(get_hashable(lines))
-        if line_hash in seen:
-            cycle_length = i - seen[line_hash]
+        grid = inner_cycle(grid)
+        state = bytes(grid.cells)
+        if state in seen:
+            cycle_length = i - seen[state]
             remaining = times - (i + 1)
             can_skip = (remaining // cycle_length) * cycle_length
             cycles_left_after_skip = remaining - can_skip
             for _ in range(cycles_left_after_skip):
-                lines = inner_cycle(lines)
-            north_load = calc_load(lines)
-            return rotate_90_clockwise(lines), north_load
+                grid = inner_cycle(grid)
+            north_load = calc_load(grid)
+            return grid.rotated_clockwise(), north_load
         else:
-            seen[line_hash] = i
-    north_load = calc_load(lines)
-    return rotate_90_clockwise(lines), north_load
-
-def get_hashable(rows: list[str]) -> str:
-    result = ''
-    for row in rows:
-        result += row
-    return result
+            seen[state] = i
+    north_load = calc_load(grid)
+    return grid.rotated_clockwise(), north_load
 
-@pytest.mark.parametrize('rows, times, expected', [
+@parametrize('rows, times, expected', [
     (test_data, 1000000000, 64),
     # (test_data, 20, 64),
 ])
 def test_load_after_cycles(rows, times, expected):
-    lines, load = cycle(rows, times)
+    grid, load = cycle(Grid.from_rows(rows), times)
     assert load == expected
 
-@pytest.mark.parametrize('rows, times, expected', [
+@parametrize('rows, times, expected', [
     (test_data, 1, [
         '.....#....',
         '....#...O#',
@@ -105,22 +114,24 @@ def test_load_after_cycles(rows, times, expected):
     ]),
 ])
 def test_cycle(rows, times, expected):
-    actual, load = cycle(rows, times)
-    assert actual == expected
-
-def inner_cycle(lines) -> list[str]: # takes facing north
-    lines = tilt(lines) # north
-    lines = rotate_90_clockwise(lines)
-    lines = tilt(lines) # west
-    lines = rotate_90_clockwise(lines)
-    lines = tilt(lines) # south
-    lines = rotate_90_clockwise(lines)
-    lines = tilt(lines) # east
-    lines = rotate_90_clockwise(lines)
-    return lines # returns facing north
-
-def calc_north_load(lines: list[str]) -> int:
-    return calc_west_load(rotate_90_anticlockwise(lines))
+    grid = Grid.from_rows(rows)
+    actual, load = cycle(grid, times)
+    assert actual.rows() == expected
+    assert grid.rows() == rows
+
+def inner_cycle(grid: Grid) -> Grid: # takes facing north
+    tilt(grid) # north
+    grid = grid.rotated_clockwise()
+    tilt(grid) # west
+    grid = grid.rotated_clockwise()
+    tilt(grid) # south
+    grid = grid.rotated_clockwise()
+    tilt(grid) # east
+    grid = grid.rotated_clockwise()
+    return grid # returns facing north
+
+def calc_north_load(grid: Grid) -> int:
+    return calc_west_load(grid.rotated_anticlockwise())
 
 def test_calc_north_load2():
     rows = [
@@ -136,19 +147,19 @@ def test_calc_north_load2():
         '#.OOO#...O',
     ]
     expected = 110
-    actual = calc_north_load(rows)
+    actual = calc_north_load(Grid.from_rows(rows))
     assert actual == expected
 
-def calc_west_load(lines: list[str]) -> int:
+def calc_west_load(grid: Grid) -> int:
     total_load = 0
-    for row in lines:
+    for row in grid.rows():
         result, load = tilt_row_left(row)
         total_load += load
     return total_load
 
-def calc_load(rows: list[str]) -> int:
+def calc_load(grid: Grid) -> int:
     total_load = 0
-    for row in rows:
+    for row in grid.rows():
         total_load += calc_row_load(row)
     return total_load
 
@@ -159,7 +170,7 @@ def calc_row_load(row: str) -> int:
             load += len(row) - i
     return load
 
-@pytest.mark.parametrize('row, expected', [
+@parametrize('row, expected', [
     ('OOO', 6),
     ('...', 0),
     ('.#.', 0),
@@ -171,21 +182,22 @@ def test_calc_row_load(row, expected):
     actual = calc_row_load(row)
     assert actual == expected
 
-def tilt(rows: list[str]) -> list[str]:
-    return [ tilt_row(row) for row in rows ]
+def tilt(grid: Grid) -> None:
+    # rolls every rock to the left of its row
+    for y in range(grid.height):
+        grid.set_row(y, tilt_row(grid.row(y)))
 
 def tilt_row(row: str) -> str:
-    result = ''
-    for i, char in enumerate(row):
-        match char:
-            case 'O':
-                result += 'O'
-            case '.':
-                continue
-            case '#':
-                result += '.'*(i - len(result)) + '#'
-    result += '.' * (len(row) - len(result))
-    return result
+    # between cube rocks, the round ones all end up on the left
+    return '#'.join('O' * part.count('O') + '.' * (len(part) - part.count('O')) for part in row.split('#'))
+
+@parametrize('row, expected', [
+    ('O.O', 'OO.'),
+    ('#.#..O#.##', '#.#O..#.##'),
+    ('.O#..O#.O', 'O.#O..#O.'),
+])
+def test_tilt_row(row, expected):
+    assert tilt_row(row) == expected
 
 def tilt_row_left(row: str) -> (str, int):
     result = ''
@@ -202,7 +214,7 @@ def tilt_row_left(row: str) -> (str, int):
     result += '.' * (len(row) - len(result))
     return result, load
 
-@pytest.mark.parametrize('row, expected', [
+@parametrize('row, expected', [
     ('OOO', ('OOO', 6)),
     ('...', ('...', 0)),
     ('.#.', ('.#.', 0)),
@@ -214,41 +226,9 @@ def test_tilt_left(row, expected):
     actual = tilt_row_left(row)
     assert actual == expected
 
-def rotate_90_clockwise(lines: list[str]) -> list[str]:
-    return [ x[::-1] for x in transpose(lines) ]
-
-def test_rotate_90_clockwise():
-    lines = [
-        'ABC',
-        'DEF',
-    ]
-    expected = [
-        'DA',
-        'EB',
-        'FC',
-    ]
-    actual = rotate_90_clockwise(lines)
-    assert actual == expected
-
-def rotate_90_anticlockwise(lines: list[str]) -> list[str]:
-    return list(reversed(transpose(lines)))
-
-def test_rotate_90_anticlockwise():
-    lines = [
-        'ABC',
-        'DEF',
-    ]
-    expected = [
-        'CF',
-        'BE',
-        'AD',
-    ]
-    actual = rotate_90_anticlockwise(lines)
-    assert actual == expected
-
 def test_calc_north_load():
     expected = 136
-    actual = calc_north_load(test_data)
+    actual = calc_north_load(Grid.from_rows(test_data))
     assert actual == expected
 
 if __name__ == '__main__':
@@ -1,22 +1,31 @@
 import time
 from collections import OrderedDict
 
-import pytest
 from pathlib import Path
 
+from aoc.testing import parametrize
+
 
 def run():
     with open(Path(__file__).parent / 'Input.txt') as f:
-        lines = f.read().split('\n')
-    init_seq = lines[0].split(',')
+        init_seq = parse(f.read())
+
+    start_time = time.perf_counter()
+    result1 = solve_part1(init_seq)
+    print(f'Day15 part 1: {result1} (in {(time.perf_counter() - start_time):.2f}s)')
+
+    start_time = time.perf_counter()
+    result2 = solve_part2(init_seq)
+    print(f'Day15 part 2: {result2} (in {(time.perf_counter() - start_time):.2f}s)')
+
+def parse(source: str) -> list[str]:
+    return source.split('\n')[0].split(',')
 
-    start_time = time.time()
-    result1 = sum_of_hashes(init_seq)
-    print(f'Day15 part 1: {result1} (in {(time.time() - start_time):.2f}s)')
+def solve_part1(init_seq: list[str]) -> int:
+    return sum_of_hashes(init_seq)
 
-    start_time = time.time()
-    result2 = sum_of_focusing_power(init_seq)
-    print(f'Day15 part 2: {result2} (in {(time.time() - start_time):.2f}s)')
+def solve_part2(init_seq: list[str]) -> int:
+    return sum_of_focusing_power(init_seq)
 
 def split_step(step: str) -> (str, int, str, int):
     if '-' in step:
@@ -33,7 +42,7 @@ def split_step(step: str) -> (str, int, str, int):
     box_number = aoc_hash(label)
     return label, box_number, op_char, focal_length
 
-@pytest.mark.parametrize('step, expected', [
+@parametrize('step, expected', [
     ('rn=1', ('rn', 0, '=', 1)),
     ('cm-', ('cm', 0, '-', None))
 ])
@@ -66,7 +75,7 @@ def lens_focus_pow(box_number: int, slot_index: int, focal_length: int) -> int:
     result = a * b * c
     return result
 
-@pytest.mark.parametrize('box_number, slot_index, focal_length, expected', [
+@parametrize('box_number, slot_index, focal_length, expected', [
     (0, 0, 1, 1),
     (0, 1, 2, 4),
     (3, 0, 7, 28),
@@ -83,7 +92,7 @@ def focus_power(box_number: int, lenses: OrderedDict[str, int]) -> int:
         result += lens_focus_pow(box_number, slot_index, focal_length)
     return result
 
-@pytest.mark.parametrize('box_number, lenses, expected', [
+@parametrize('box_number, lenses, expected', [
     (0, OrderedDict([('rn',1), ('cm', 2)]), 5),
     (3, OrderedDict([('ot', 7), ('ab', 5), ('pc', 6)]), 140),
 ])
@@ -95,7 +104,7 @@ def sum_of_focusing_power(init_seq: list[str]) -> int:
     boxes = apply_seq(init_seq)
     return sum([ focus_power(box_number, lenses) for box_number, lenses in enumerate(boxes) ])
 
-@pytest.mark.parametrize('line, expected', [
+@parametrize('line, expected', [
     ('rn=1,cm-,qp=3,cm=2,qp-,pc=4,ot=9,ab=5,pc-,pc=6,ot=7', 145),
 ])
 def test_sum_of_focusing_power(line, expected):
@@ -114,7 +123,7 @@ def aoc_hash(step: str) -> int:
     return current
 
 
-@pytest.mark.parametrize('step, expected', [
+@parametrize('step, expected', [
     ('HASH', 52),
     ('rn=1', 30),
     ('cm-', 253),
@@ -140,7 +149,7 @@ def test_aoc_has(step, expected):
 def sum_of_hashes(init_seq: list[str]) -> int:
     return sum([ aoc_hash(x) for x in init_seq ])
 
-@pytest.mark.parametrize('line, expected', [
+@parametrize('line, expected', [
     ('rn=1,cm-,qp=3,cm=2,qp-,pc=4,ot=9,ab=5,pc-,pc=6,ot=7', 1320),
 ])
 def test_sum_of_hashes(line, expected):
@@ -1,25 +1,38 @@
 import time
-from enum import Enum, StrEnum
-from functools import cache
+from enum import IntEnum, StrEnum
 from pathlib import Path
 
+from aoc import memo
+from aoc.grid import CHARS, Grid
+from aoc.gridfile import GridBuffer
+from aoc.testing import parametrize
+
 
 def run():
     with open(Path(__file__).parent / 'Input.txt') as f:
-        str_lines = f.read()
-        lines = str_lines.split('\n')
-        row_length = len(lines[0])
-        col_length = len(lines)
+        contraption = parse(f.read())
+
+    start_time = time.perf_counter()
+    result = solve_part1(contraption)
+    print(f'Day16 part 1: {result} (in {(time.perf_counter() - start_time):.2f}s)')
+
+    start_time = time.perf_counter()
+    result2 = solve_part2(contraption)
+    print(f'Day16 part 2: {result2} (in {(time.perf_counter() - start_time):.2f}s)')
+
+def parse(source: str) -> Grid:
+    return Grid.from_text(source)
+
+def parse_grids(grids: list[GridBuffer]) -> Grid:
+    return Grid.from_buffer(grids[0])
 
-    start_time = time.time()
-    result = count_energised_tiles(str_lines, row_length, col_length, (0,0), Heading.RIGHT)
-    print(f'Day16 part 1: {result} (in {(time.time() - start_time):.2f}s)')
+def solve_part1(grid: Grid) -> int:
+    return count_energised_tiles(grid, (0,0), Heading.RIGHT)
 
-    start_time = time.time()
-    result2 = get_max_energised_tiles(str_lines, row_length, col_length)
-    print(f'Day16 part 2: {result2} (in {(time.time() - start_time):.2f}s)')
+def solve_part2(grid: Grid) -> int:
+    return get_max_energised_tiles(grid)
 
-class Heading(Enum):
+class Heading(IntEnum):
     RIGHT = 1
     DOWN = 2
     LEFT = 3
@@ -32,96 +45,79 @@ class Tile(StrEnum):
     VERT_SPLIT = '|'
     HORIZ_SPLIT = '-'
 
-@cache
-def in_bounds(position: (int, int), col_length: int, row_length: int) -> bool:
-    x, y = position
-    ok_top_and_bottom = 0 <= x < col_length
-    ok_left_and_right = 0 <= y < row_length
-    return ok_top_and_bottom and ok_left_and_right
-
-@cache
-def move(position: (int, int), direction: Heading) -> ((int, int), Heading):
-    x, y = position
-    match direction:
-        case Heading.RIGHT:
-            return (x, y + 1), direction
-        case Heading.LEFT:
-            return  (x, y - 1), direction
-        case Heading.DOWN:
-            return (x + 1, y), direction
-        case Heading.UP:
-            return (x - 1, y), direction
-    raise ValueError(f'unexpected heading: {direction}')
-
-@cache
-def calc_new_positions(
-        str_lines, row_length, col_length, start_pos: (int, int), direction: Heading
-) -> list[((int, int), Heading)]:
-    x, y = start_pos
-    current_char = str_lines[x * (row_length + 1) + y]
-    match current_char:
+@memo.memoised('process')  # 5 tiles by 4 headings
+def new_headings(tile: str, direction: Heading) -> tuple[Heading, ...]:
+    match tile:
         case Tile.EMPTY:
-            return [move(start_pos, direction)]
+            return (direction,)
         case Tile.MIRROR_RIGHT_UP:
             match direction:
                 case Heading.RIGHT:
-                    return [move(start_pos, Heading.UP)]
+                    return (Heading.UP,)
                 case Heading.LEFT:
-                    return [move(start_pos, Heading.DOWN)]
+                    return (Heading.DOWN,)
                 case Heading.DOWN:
-                    return [move(start_pos, Heading.LEFT)]
+                    return (Heading.LEFT,)
                 case Heading.UP:
-                    return [move(start_pos, Heading.RIGHT)]
+                    return (Heading.RIGHT,)
         case Tile.MIRROR_RIGHT_DOWN:
             match direction:
                 case Heading.RIGHT:
-                    return [move(start_pos, Heading.DOWN)]
+                    return (Heading.DOWN,)
                 case Heading.LEFT:
-                    return [move(start_pos, Heading.UP)]
+                    return (Heading.UP,)
                 case Heading.DOWN:
-                    return [move(start_pos, Heading.RIGHT)]
+                    return (Heading.RIGHT,)
                 case Heading.UP:
-                    return [move(start_pos, Heading.LEFT)]
+                    return (Heading.LEFT,)
         case Tile.VERT_SPLIT:
             match direction:
                 case (Heading.RIGHT | Heading.LEFT):
-                    return [ move(start_pos, Heading.DOWN),
-                             move(start_pos, Heading.UP)]
+                    return (Heading.DOWN, Heading.UP)
                 case (Heading.UP | Heading.DOWN):
-                    return [move(start_pos, direction)]
+                    return (direction,)
         case Tile.HORIZ_SPLIT:
             match direction:
                 case (Heading.RIGHT | Heading.LEFT):
-                    return [move(start_pos, direction)]
+                    return (direction,)
                 case (Heading.UP | Heading.DOWN):
-                    return [move(start_pos, Heading.RIGHT),
-                            move(start_pos, Heading.LEFT)]
-
-def traverse(
-        str_lines: str, row_length: int, col_length: int, current_pos: (int, int), direction: Heading, visited: set[((int, int), Heading)]
-) -> set[((int, int), Heading)]:
-    new_positions = calc_new_positions(str_lines, row_length, col_length, current_pos, direction)
-    visited.add((current_pos, direction))
-    while len(new_positions) == 1:
-        new_position, new_heading = new_positions[0]
-        if in_bounds(new_position, col_length, row_length):
-            if (new_position, new_heading) not in visited:
-                visited.add((new_position, new_heading))
-                new_positions = calc_new_positions(str_lines, row_length, col_length, new_position, new_heading)
-            else:
-                new_positions = []
-        else:
-            new_positions = []
-    for new_position, new_heading in new_positions:
-        if in_bounds(new_position, col_length, row_length):
-            if (new_position, new_heading) not in visited:
-                visited.update(traverse(str_lines, row_length, col_length, new_position, new_heading, visited))
+                    return (Heading.RIGHT, Heading.LEFT)
+    raise ValueError(f'unexpected tile: {tile}')
+
+@parametrize('tile, direction, expected', [
+    ('.', Heading.UP, (Heading.UP,)),
+    ('/', Heading.RIGHT, (Heading.UP,)),
+    ('\\', Heading.UP, (Heading.LEFT,)),
+    ('|', Heading.LEFT, (Heading.DOWN, Heading.UP)),
+    ('-', Heading.LEFT, (Heading.LEFT,)),
+])
+def test_new_headings(tile, direction, expected):
+    assert new_headings(tile, direction) == expected
+
+def traverse(grid: Grid, index: int, direction: Heading, visited: set[(int, Heading)]) -> set[(int, Heading)]:
+    # the beam moves over flat indices into the grid's cells, falling off it onto a row separator
+    # or out of the buffer, so grid must be in reading order (not a transposed or rotated view)
+    steps = {Heading.RIGHT: 1, Heading.LEFT: -1, Heading.DOWN: grid.row_step, Heading.UP: -grid.row_step}
+    cells = grid.cells
+    beams = [(index, direction)]
+    while beams:
+        index, direction = beams.pop()
+        while (index, direction) not in visited:
+            visited.add((index, direction))
+            headings = new_headings(CHARS[cells[index]], direction)
+            for heading in headings[1:]:
+                if grid.contains_index(index + steps[heading]):
+                    beams.append((index + steps[heading], heading))
+            direction = headings[0]
+            index += steps[direction]
+            if not grid.contains_index(index):
+                break
     return visited
 
 def test_traverse():
-    str_lines, row_length, col_length = get_test_data()
-    visited = traverse(str_lines, row_length, col_length, (0,0), Heading.RIGHT, set([]))
-    actual = { position for position, heading in visited }
+    grid = get_test_data()
+    visited = traverse(grid, grid.index(0, 0), Heading.RIGHT, set([]))
+    actual = { grid.position(index) for index, heading in visited }
     assert (0, 0) in actual
     assert (0, 1) in actual
     assert (0, 2) in actual
@@ -135,18 +131,14 @@ def test_traverse():
     assert (2, 2) not in actual
     assert (2, 3) not in actual
 
-def count_energised_tiles(str_lines: str, row_length: int, col_length: int, position: (int, int), heading: Heading) -> int:
-    visited = traverse(str_lines, row_length, col_length, position, heading, set([]))
-    energised = {position for position, heading in visited}
+def count_energised_tiles(grid: Grid, position: (int, int), heading: Heading) -> int:
+    visited = traverse(grid, grid.index(*position), heading, set([]))
+    energised = {index for index, heading in visited}
     return len(energised)
 
-def get_test_data() -> (str, int, int):
+def get_test_data() -> Grid:
     with open(Path(__file__).parent / 'test_input.txt') as f:
-        str_lines = f.read()
-        lines = str_lines.split('\n')
-        row_length = len(lines[0])
-        col_length = len(lines)
-    return str_lines, row_length, col_length
+        return parse(f.read())
 
 def test_get_test_data():
     expected = [
@@ -161,35 +153,33 @@ def test_get_test_data():
         '.|....-|.\\',
         r'..//.|....',
     ]
-    actual = get_test_data()[0].split('\n')
+    actual = get_test_data().rows()
     assert actual == expected
 
 def test_count_energised_tiles():
     expected = 46
-    str_lines, row_length, col_length = get_test_data()
-    actual = count_energised_tiles(str_lines, row_length, col_length, (0,0), Heading.RIGHT)
+    actual = count_energised_tiles(get_test_data(), (0,0), Heading.RIGHT)
     assert actual == expected
 
-def get_max_energised_tiles(str_lines: str, row_length: int, col_length: int) -> int:
+def get_max_energised_tiles(grid: Grid) -> int:
     current_max = 0
-    last_row_index = col_length - 1
-    last_column_index = row_length -1
-    for i in range(col_length):
+    last_row_index = grid.height - 1
+    last_column_index = grid.width - 1
+    for i in range(grid.height):
         # down the left side
-        current_max = max(current_max, count_energised_tiles(str_lines, row_length, col_length, (i, 0), Heading.RIGHT))
+        current_max = max(current_max, count_energised_tiles(grid, (i, 0), Heading.RIGHT))
         # down the right side
-        current_max = max(current_max, count_energised_tiles(str_lines, row_length, col_length, (i, last_column_index), Heading.LEFT))
-    for j in range(row_length):
+        current_max = max(current_max, count_energised_tiles(grid, (i, last_column_index), Heading.LEFT))
+    for j in range(grid.width):
         # across the top
-        current_max = max(current_max, count_energised_tiles(str_lines, row_length, col_length, (0, j), Heading.DOWN))
+        current_max = max(current_max, count_energised_tiles(grid, (0, j), Heading.DOWN))
         # across the bottom
-        current_max = max(current_max, count_energised_tiles(str_lines, row_length, col_length, (last_row_index, j), Heading.UP))
+        current_max = max(current_max, count_energised_tiles(grid, (last_row_index, j), Heading.UP))
     return current_max
 
 def test_get_max_energised_tiles():
     expected = 51
-    str_lines, row_length, col_length = get_test_data()
-    actual = get_max_energised_tiles(str_lines, row_length, col_length)
+    actual = get_max_energised_tiles(get_test_data())
     assert actual == expected
 
 if __name__ == '__main__':
@@ -1,22 +1,31 @@
 import time
-from copy import deepcopy
 from enum import Enum, StrEnum
 from pathlib import Path
 
-from day05.mappers import combine_ranges
+from aoc.intervals import IntervalSet
+from aoc.testing import parametrize
 
 
 def run():
     with open(Path(__file__).parent / 'Input.txt') as f:
-        lines = f.read().split('\n')
+        lines = parse(f.read())
 
-    start_time = time.time()
-    result = calc_pit_capacity(lines)
-    print(f'Day18 part 1: {result} (in {(time.time() - start_time):.2f}s)')
+    start_time = time.perf_counter()
+    result = solve_part1(lines)
+    print(f'Day18 part 1: {result} (in {(time.perf_counter() - start_time):.2f}s)')
 
-    start_time = time.time()
-    result2 = calc_pit_capacity2(lines)
-    print(f'Day18 part 2: {result2} (in {(time.time() - start_time):.2f}s)')
+    start_time = time.perf_counter()
+    result2 = solve_part2(lines)
+    print(f'Day18 part 2: {result2} (in {(time.perf_counter() - start_time):.2f}s)')
+
+def parse(source: str) -> list[str]:
+    return source.split('\n')
+
+def solve_part1(lines: list[str]) -> int:
+    return calc_pit_capacity(lines)
+
+def solve_part2(lines: list[str]) -> int:
+    return calc_pit_capacity2(lines)
 
 class Heading(Enum):
     RIGHT = 0
@@ -133,16 +142,14 @@ def calc_pit_capacity_given_nodes(nodes: dict[int, list[int]]) -> int:
     prev_row = None
     for row, node_list in nodes.items():
         area += calc_rect_area(slices, prev_row, row)
-        old_slices = deepcopy(slices)
-        update_slices(slices, node_list)
+        old_slices = slices
+        slices = update_slices(slices, node_list)
         area += calc_slice_area(slices, old_slices)
         prev_row = row
     return area
 
 def calc_slice_area(slices, old_slices) -> int:
-    combined = combine_ranges(slices, old_slices)
-    areas = [ b + 1 - a for a, b in combined ]
-    return sum(areas)
+    return IntervalSet(slices).union(IntervalSet(old_slices)).total_length()
 
 def test_calc_slice_area():
     expected = 7
@@ -159,75 +166,24 @@ def calc_rect_area(slices, prev_row, row) -> int:
         area += width * height
     return area
 
-def update_slices(slices, node_list) -> None:
-    for i in range(0, len(node_list), 2):
-        c, d = node_list[i], node_list[i + 1]
-        if not slices:
-            slices.append((c, d))
-            continue
-        interacting_slices = get_interacting_slices(slices, c, d)
-
-        if not interacting_slices:  # if it's not touching an existing slice, add it
-            slices.append((c, d))
-        elif len(interacting_slices) == 2:
-            a, b = interacting_slices[0]
-            e, f = interacting_slices[1]
-            if slices_all_touch(a, b, c, d, e, f):  # if it joins two existing slices, merge them
-                slices.remove((a, b))
-                slices.remove((e, f))
-                slices.append((a, f))
-                slices.sort()
-            else:
-                raise NotImplementedError(f'Unexpected combo of 3 touching slices: {[(a, b), (c, d), (e, f)]}')
-        elif len(interacting_slices) == 1:
-            a, b = interacting_slices[0]
-            if slices_are_identical(a, b, c, d):  # if it's equal to an existing slice, remove it
-                slices.remove((a, b))
-            elif slice_2_is_within_slice_1(a, b, c, d):  # if it's within existing slice, split it
-                slices.remove((a, b))
-                slices.append((a, c))
-                slices.append((d, b))
-                slices.sort()
-            elif slices_touch_outside(a, b, c, d):  # if it's adjacent (out) to existing slice, expand it
-                slices.remove((a, b))
-                slices.append((min(a, c), max(b, d)))
-                slices.sort()
-            elif slices_touch_inside_left(a, b, c, d):  # if it's adjacent (in) to existing slice, shrink it
-                slices.remove((a, b))
-                slices.append((d, b))
-                slices.sort()
-            elif slices_touch_inside_right(a, b, c, d):
-                slices.remove((a, b))
-                slices.append((a, c))
-                slices.sort()
-            else:
-                raise ValueError(f'unexpected combination: {[(a, b), (c, d)]}')
-        else:
-            raise NotImplementedError(f'Unexpected number of interacting slices: {len(interacting_slices)}')
-
-def slices_all_touch(a, b, x, y, c, d) -> bool:
-    return b == x and y == c
-
-def slices_are_distinct(a, b, x, y) -> bool:
-    return a > y or x > b
-
-def slices_are_identical(a, b, x, y) -> bool:
-    return a == x and b == y
-
-def slice_2_is_within_slice_1(a, b, x, y) -> bool:
-    return a < x and b > y
-
-def slices_touch_outside(a, b, x, y) -> bool:
-    return a == y or b == x
-
-def slices_touch_inside_left(a, b, x, y) -> bool:
-    return a == x and b > y
-
-def slices_touch_inside_right(a, b, x, y) -> bool:
-    return a < x and b == y
-
-def get_interacting_slices(slices: list[(int, int)], x, y) -> list[(int, int)]:
-    return [ (a, b) for a, b in slices if not slices_are_distinct(a, b, x, y) ]
+def update_slices(slices: list[(int, int)], node_list: list[int]) -> list[(int, int)]:
+    # a slice (a, b) spans the gaps between the vertical edges at a and b, gaps a to b - 1. Each horizontal
+    # edge (c, d) on this row flips the gaps it spans, which opens, closes, widens, narrows, splits or joins
+    # slices as the edge meets them
+    gaps = IntervalSet((a, b - 1) for a, b in slices)
+    edges = IntervalSet((node_list[i], node_list[i + 1] - 1) for i in range(0, len(node_list), 2))
+    return [ (a, b + 1) for a, b in gaps.symmetric_difference(edges) ]
+
+@parametrize('slices, node_list, expected', [
+    ([], [2, 6], [(2, 6)]),  # opens
+    ([(2, 6)], [2, 6], []),  # closes
+    ([(2, 6)], [3, 5], [(2, 3), (5, 6)]),  # splits
+    ([(2, 6)], [6, 9], [(2, 9)]),  # widens
+    ([(2, 6)], [2, 4], [(4, 6)]),  # narrows
+    ([(0, 2), (5, 8)], [2, 5], [(0, 8)]),  # joins
+])
+def test_update_slices(slices, node_list, expected):
+    assert update_slices(slices, node_list) == expected
 
 def test_calc_pit_capacity2():
     expected = 952408144115
@@ -1,16 +1,29 @@
 import time
 from enum import StrEnum
+from typing import Sequence
 from pathlib import Path
 
+from aoc.ints import ints
+
+
 def run():
-    with open(Path(__file__).parent / 'Input1.txt') as f:
-        workflows = f.read().split('\n')
-    with open(Path(__file__).parent / 'Input2.txt') as f:
-        parts = f.read().split('\n')
+    with open(Path(__file__).parent / 'Input.txt') as f:
+        system = parse(f.read())
+
+    start_time = time.perf_counter()
+    result = solve_part1(system)
+    print(f'Day19 part 1: {result} (in {(time.perf_counter() - start_time):.2f}s)')
 
-    start_time = time.time()
-    result = sum_ratings_of_accepted_parts(workflows, parts)
-    print(f'Day19 part 1: {result} (in {(time.time() - start_time):.2f}s)')
+def parse(source: str) -> (dict[str, list[(str, str)]], list[dict[str, int]]):
+    workflows, parts = source.split('\n\n')
+    return (
+        parse_workflows([line for line in workflows.split('\n') if line]),
+        parts_from_ratings(ints(parts)),
+    )
+
+def solve_part1(system: (dict[str, list[(str, str)]], list[dict[str, int]])) -> int:
+    workflows, parts = system
+    return sum_accepted_ratings(workflows, parts)
 
 test_workflows = [
     'px{a<2006:qkq,m>2090:A,rfg}',
@@ -54,17 +67,17 @@ def parse_workflows(lines: list[str]) -> dict[str, list[(str, str)]]:
     return workflows
 
 def parse_parts(lines: list[str]) -> list[dict[str, int]]:
-    parts: list[(int, int, int, int)] = []
-    for line in lines:
-        attributes = line[1:-1].split(',')
-        part = {
-            'x': int(attributes[0][2:]),
-            'm': int(attributes[1][2:]),
-            'a': int(attributes[2][2:]),
-            's': int(attributes[3][2:]),
-        }
-        parts.append(part)
-    return parts
+    return parts_from_ratings(ints('\n'.join(lines)))
+
+def parts_from_ratings(ratings: Sequence[int]) -> list[dict[str, int]]:
+    # every part lists its x, m, a and s ratings in that order
+    return [ dict(zip('xmas', ratings[i:i + 4])) for i in range(0, len(ratings), 4) ]
+
+def test_parse_parts():
+    assert parse_parts(test_parts[:2]) == [
+        {'x': 787, 'm': 2655, 'a': 1222, 's': 2876},
+        {'x': 1679, 'm': 44, 'a': 2067, 's': 496},
+    ]
 
 class Comparison(StrEnum):
     GT = '>'
@@ -93,8 +106,9 @@ def apply_workflows_to_part(workflows: dict[str, list[(str, str)]], part: dict[s
 
 
 def sum_ratings_of_accepted_parts(workflows: list[str], parts: list[str]) -> int:
-    workflows = parse_workflows(workflows)
-    parts = parse_parts(parts)
+    return sum_accepted_ratings(parse_workflows(workflows), parse_parts(parts))
+
+def sum_accepted_ratings(workflows: dict[str, list[(str, str)]], parts: list[dict[str, int]]) -> int:
     accepted_parts = [ part for part in parts if apply_workflows_to_part(workflows, part) == 'A' ]
     result = sum([ sum(list(part.values())) for part in accepted_parts ])
     return result
@@ -106,5 +120,9 @@ def test_sum_ratings_of_accepted_parts():
     actual = sum_ratings_of_accepted_parts(workflows, parts)
     assert actual == expected
 
+def test_solve_part1():
+    source = '\n'.join(test_workflows) + '\n\n' + '\n'.join(test_parts)
+    assert solve_part1(parse(source)) == 19114
+
 if __name__ == '__main__':
     run()
@@ -2,18 +2,22 @@ import copy
 import time
 from pathlib import Path
 
-import pytest
-
-from day19.day19part1 import Comparison, parse_workflows
+from day19.day19part1 import Comparison, parse_workflows, parse
+from aoc.graph import Graph
+from aoc.testing import parametrize
 
 
 def run():
-    with open(Path(__file__).parent / 'Input1.txt') as f:
-        lines = f.read().split('\n')
+    with open(Path(__file__).parent / 'Input.txt') as f:
+        system = parse(f.read())
+
+    start_time = time.perf_counter()
+    result = solve_part2(system)
+    print(f'Day19 part 2: {result} (in {(time.perf_counter() - start_time):.2f}s)')
 
-    start_time = time.time()
-    result = count_acceptable_combinations(lines)
-    print(f'Day19 part 2: {result} (in {(time.time() - start_time):.2f}s)')
+def solve_part2(system: (dict[str, list[(str, str)]], list[dict[str, int]])) -> int:
+    workflows, _ = system
+    return walk_all_paths(create_graph(workflows))
 
 class Rule:
     def __init__(self, condition: str):
@@ -27,29 +31,16 @@ class Rule:
     def __str__(self):
         return self.condition
 
-class Node:
-    def __init__(self, label: str):
-        self.label = label
-        self.destinations: list[(Node, Rule)] = []
-
-    def __str__(self):
-        return self.label
-
-    def add_destination(self, destination, condition: str):
-        rule = None if condition is None else Rule(condition)
-        self.destinations.append((destination, rule))
-
-def create_nodes(lines: list) -> dict[str, Node]:
-    workflows: dict[str, list[(str, str)]] = parse_workflows(lines)
-    nodes = {label: Node(label) for label in workflows.keys()}
-    nodes['A'] = Node('A')
-    nodes['R'] = Node('R')
-    for label, rules in workflows.items():
-        node = nodes[label]
-        for condition, destination in rules:
-            dest_node = nodes[destination]
-            node.add_destination(dest_node, condition)
-    return nodes
+def create_graph(workflows: dict[str, list[(str, str)]]) -> (Graph, list[Rule]):
+    # an edge per rule, from a workflow to where the rule sends a part, with each edge's rule (None for the
+    # fallback) at the edge's id
+    graph = Graph.from_adjacency({label: [destination for _, destination in rules] for label, rules in workflows.items()})
+    rules_by_node = {graph.id(label): rules for label, rules in workflows.items()}
+    edge_rules = [None] * len(graph.targets)
+    for node, rules in rules_by_node.items():
+        for edge, (condition, _) in zip(graph.edges(node), rules):
+            edge_rules[edge] = None if condition is None else Rule(condition)
+    return graph, edge_rules
 
 class PartRange:
     def __init__(self, x_range: (int, int), m_range: (int, int), a_range: (int, int), s_range: (int, int)):
@@ -73,7 +64,7 @@ class PartRange:
         s_count = max(0, self.upper_limit['s'] + 1 - self.lower_limit['s'])
         return x_count * m_count * a_count * s_count
 
-@pytest.mark.parametrize('x_range, m_range, a_range, s_range, expected', [
+@parametrize('x_range, m_range, a_range, s_range, expected', [
     ((1, 1), (1, 1), (1, 1), (1, 1), 1),
     ((2, 1), (1, 1), (1, 1), (1, 1), 0),
     ((1, 2), (1, 1), (1, 1), (1, 1), 2),
@@ -110,30 +101,29 @@ def test_split_part_range2():
     assert passing.upper_limit['x'] == 5
     assert failing.lower_limit['x'] == 6
 
-def walk_all_paths(nodes: dict[str, Node]):
-    node = nodes['in']
+def walk_all_paths(workflows: (Graph, list[Rule])):
+    graph, rules = workflows
     part_range = PartRange((1,4000), (1,4000), (1,4000), (1,4000))
-    acceptable_ranges = find_acceptable_part_ranges(node, part_range)
+    acceptable_ranges = find_acceptable_part_ranges(graph, rules, graph.id('in'), part_range)
     value_count = sum([ a_range.count_values() for a_range in acceptable_ranges ])
     return value_count
 
-def find_acceptable_part_ranges(node: Node, part_range: PartRange) -> list[PartRange]:
+def find_acceptable_part_ranges(graph: Graph, rules: list[Rule], node: int, part_range: PartRange) -> list[PartRange]:
     result = []
-    if node.label == 'A':
-        return [part_range]
-    if node.label == 'R':
-        return []
-    for destination, rule in node.destinations:
+    if not graph.edges(node):  # only A and R have no workflow
+        return [part_range] if graph.names[node] == 'A' else []
+    for edge in graph.edges(node):
+        destination, rule = graph.targets[edge], rules[edge]
         if rule is None:
-            return result + find_acceptable_part_ranges(destination, part_range)
+            return result + find_acceptable_part_ranges(graph, rules, destination, part_range)
         else:
             passing, part_range = split_part_range(part_range, rule)
-            result += find_acceptable_part_ranges(destination, passing)
-    raise Exception(f'Not all paths lead to A or R at node: {node}')
+            result += find_acceptable_part_ranges(graph, rules, destination, passing)
+    raise Exception(f'Not all paths lead to A or R at node: {graph.names[node]}')
 
 def count_acceptable_combinations(lines: list) -> int:
-    nodes = create_nodes(lines)
-    result = walk_all_paths(nodes)
+    workflows = create_graph(parse_workflows(lines))
+    result = walk_all_paths(workflows)
     return result
 
 
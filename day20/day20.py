@@ -1,186 +1,134 @@
 import math
 import time
+from collections import deque
 from pathlib import Path
-from queue import SimpleQueue
 
-import pytest
+from aoc.graph import Graph
+from aoc.testing import parametrize
 
 
 def run():
     with open(Path(__file__).parent / 'Input.txt') as f:
-        lines = f.read().split('\n')
-
-    start_time = time.time()
-    result = run_state_machine_fixed_times(lines, 1000)
-    print(f'Day20 part 1: {result} (in {(time.time() - start_time):.2f}s)')
-
-    start_time = time.time()
-    result2 = calc_state_machine_presses_til_on(lines)
-    print(f'Day20 part 2: {result2} (in {(time.time() - start_time):.2f}s)')
-
-class Message:
-    def __init__(self, sender: 'Node', recipient: 'Node', pulse: bool):
-        self.sender = sender
-        self.recipient = recipient
-        self.pulse = pulse
-        pulse_str = 'high' if self.pulse else 'low'
-        message_str = f'{self.sender.name} -{pulse_str}> {self.recipient.name}'
-        self.message_str = message_str
-
-    def __str__(self):
-        return self.message_str
-
-class Node:
-    def __init__(self, name, dest_str: str):
-        self.name = name
-        self.dest_str = dest_str.replace(' ', '')
-        self.destinations: list[Node] = []
-        self.sources: list[Node] = []
-
-    def __str__(self):
-        return f'{self.name} ({[x.name for x in self.sources]} -> {[x.name for x in self.destinations]})'
-
-    def hook_up_destinations(self, nodes: dict[str, 'Node']):
-        if self.dest_str == '':
-            return
-        for dest_name in self.dest_str.replace(' ', '').split(','):
-            if dest_name in nodes:
-                destination_node = nodes[dest_name]
-            else:
-                destination_node = Node(dest_name, '')
-                nodes[dest_name] = destination_node
-
-            self.destinations.append(destination_node)
-            destination_node.add_source(self)
-
-    def add_source(self, node: 'Node'):
-        self.sources.append(node)
-
-    def trigger(self, sender,  pulse: bool) -> list[Message]:
-        return [ Message(self, dest, pulse) for  dest in self.destinations ]
-
-
-class FlipFlop(Node):
-    def __init__(self, name, dest_str: str):
-        super().__init__(name, dest_str)
-        self.state = False
-
-    def __str__(self):
-        return f'FF: {super().__str__()}'
+        lines = parse(f.read())
 
-    def trigger(self, sender,  pulse: bool) -> list[Message]:
-        if pulse:
-            return []
-        self.state = not self.state
-        return super().trigger(sender, self.state)
+    start_time = time.perf_counter()
+    result = solve_part1(lines)
+    print(f'Day20 part 1: {result} (in {(time.perf_counter() - start_time):.2f}s)')
 
+    start_time = time.perf_counter()
+    result2 = solve_part2(lines)
+    print(f'Day20 part 2: {result2} (in {(time.perf_counter() - start_time):.2f}s)')
 
-class Conjunction(Node):
-    def __init__(self, name, dest_str: str):
-        super().__init__(name, dest_str)
-        self.state: dict[Node, bool] = {}
+def parse(source: str) -> list[str]:
+    # the modules hold state, so each part builds its own from the lines
+    return source.split('\n')
 
-    def __str__(self):
-        return f'Con: {super().__str__()}'
+def solve_part1(lines: list[str]) -> int:
+    return run_state_machine_fixed_times(lines, 1000)
 
-    def add_source(self, node: 'Node'):
-        super().add_source(node)
-        self.state[node] = False
+def solve_part2(lines: list[str]) -> int:
+    return calc_state_machine_presses_til_on(lines)
 
-    def trigger(self, sender,  pulse: bool) -> list[Message]:
-        self.state[sender] = pulse
-        if all(self.state.values()):
-            return super().trigger(sender, False)
-        else:
-            return super().trigger(sender, True)
+# what a module does with a pulse, by node id
+BROADCAST = 0  # the broadcaster, the button and untyped outputs send on whatever they get
+FLIP_FLOP = 1
+CONJUNCTION = 2
 
 class StateMachine:
-    def __init__(self, nodes: dict[str, Node]):
-        self.nodes = nodes
-        self.message_queue = SimpleQueue[Message]()
-        self.button = nodes['button']
+    def __init__(self, graph: Graph, kinds: list[int]):
+        self.graph = graph
+        self.kinds = kinds
+        self.edge_sources = graph.sources()
+        self.flip_flop_on = [False] * len(graph)
+        # a conjunction remembers the last pulse along each edge into it, and counts how many were high
+        self.last_pulse = [False] * len(graph.targets)
+        self.high_inputs = [0] * len(graph)
+        self.in_degrees = graph.in_degrees()
+        self.button = graph.id('button')
         self.high_pulse_count = 0
         self.low_pulse_count = 0
+        # rx is fed by one conjunction, which sends it a low pulse once all of its inputs have last sent high
+        rx = graph.ids.get('rx')
+        self.rx_feeder = graph.predecessors(rx)[0] if rx is not None else None
+        self.rx_feeder_inputs = set(graph.predecessors(self.rx_feeder)) if rx is not None else set()
         self.periodicity = {}
         self.presses_until_on = 0
         self.presses = 0
 
-    def put(self, messages: list[Message]):
-        for message in messages:
-            self.message_queue.put(message)
-
-
     def press_button(self) -> (int, int):
         self.presses += 1
-        messages = self.button.trigger(None, False)
-        self.put(messages)
-        self.process_messages_on_queue()
+        offsets, targets, kinds = self.graph.offsets, self.graph.targets, self.kinds
+        flip_flop_on, last_pulse, high_inputs, in_degrees = self.flip_flop_on, self.last_pulse, self.high_inputs, self.in_degrees
+        # pulses in flight, as the edge each is on and whether it's high
+        pulses = deque((edge, False) for edge in self.graph.edges(self.button))
+        while pulses:
+            edge, pulse = pulses.popleft()
+            if pulse:
+                self.high_pulse_count += 1
+            else:
+                self.low_pulse_count += 1
+            node = targets[edge]
+            kind = kinds[node]
+            if kind == FLIP_FLOP:
+                if pulse:
+                    continue
+                pulse = flip_flop_on[node] = not flip_flop_on[node]
+            elif kind == CONJUNCTION:
+                if pulse != last_pulse[edge]:
+                    last_pulse[edge] = pulse
+                    high_inputs[node] += 1 if pulse else -1
+                if node == self.rx_feeder and pulse:
+                    self.record_period(self.edge_sources[edge])
+                pulse = high_inputs[node] != in_degrees[node]
+            pulses.extend((out_edge, pulse) for out_edge in range(offsets[node], offsets[node + 1]))
         return self.high_pulse_count, self.low_pulse_count
 
-    def process_messages_on_queue(self):
-        while not self.message_queue.empty():
-            message = self.message_queue.get()
-            new_messages = self.process(message)
-            self.put(new_messages)
-
-    def process(self, message: Message) -> list[Message]:
-        source = message.sender
-        destination = message.recipient
-        pulse = message.pulse
-        if pulse:
-            self.high_pulse_count += 1
-        else:
-            self.low_pulse_count += 1
-        messages = destination.trigger(source, pulse)
-        if destination.name == 'ql' and pulse and any(destination.state.values()):  # ql is the input to rx
-            self.periodicity[source.name] = self.presses
-            if set(self.periodicity.keys()) == {'mf', 'fz', 'fh', 'ss'}:  # these are the inputs to ql
-                self.presses_until_on = math.prod(self.periodicity.values())
-        return messages
+    def record_period(self, source: int) -> None:
+        self.periodicity[source] = self.presses
+        if set(self.periodicity.keys()) == self.rx_feeder_inputs:
+            self.presses_until_on = math.prod(self.periodicity.values())
 
     def reset_counts(self) -> None:
         self.high_pulse_count = 0
         self.low_pulse_count = 0
 
-def create_node(line: str) -> (Node, str):
-    name = line.split(' ')[0]
-    first_char = name[0]
-    node_type = None
-    if first_char == '%' or first_char == '&':
-        node_type = first_char
+def parse_module(line: str) -> (str, int, list[str]):
+    name, destinations = line.split(' -> ')
+    kind = BROADCAST
+    if name[0] == '%':
+        kind = FLIP_FLOP
         name = name[1:]
-    dest_str = line.split('>')[1][1:]
-    if not node_type:
-        return Node(name, dest_str), name
-    elif node_type == '%':
-        return FlipFlop(name, dest_str), name
-    elif node_type == '&':
-        return Conjunction(name, dest_str), name
-    else:
-        raise ValueError(f'Unexpected node type: {node_type}')
-
-def parse_inputs(lines: list[str]):
-    nodes = {}
-    for line in lines:
-        node, name = create_node(line)
-        nodes[name] = node
-    nodes['button'] = Node('button', 'broadcaster')
-
-    for node in list(nodes.values()):
-        node.hook_up_destinations(nodes)
-
-    return nodes
+    elif name[0] == '&':
+        kind = CONJUNCTION
+        name = name[1:]
+    return name, kind, destinations.replace(' ', '').split(',')
+
+@parametrize('line, expected', [
+    ('broadcaster -> a, b, c', ('broadcaster', BROADCAST, ['a', 'b', 'c'])),
+    ('%a -> b', ('a', FLIP_FLOP, ['b'])),
+    ('&inv -> a, rx', ('inv', CONJUNCTION, ['a', 'rx'])),
+])
+def test_parse_module(line, expected):
+    assert parse_module(line) == expected
+
+def parse_inputs(lines: list[str]) -> (Graph, list[int]):
+    modules = [parse_module(line) for line in lines if line]
+    adjacency = {name: destinations for name, _, destinations in modules}
+    adjacency['button'] = ['broadcaster']
+    graph = Graph.from_adjacency(adjacency)
+    kinds = [BROADCAST] * len(graph)
+    for name, kind, _ in modules:
+        kinds[graph.id(name)] = kind
+    return graph, kinds
 
 def run_state_machine_fixed_times(data: list[str], presses: int = 1000) -> int:
-    nodes = parse_inputs(data)
-    state_machine = StateMachine(nodes)
+    state_machine = StateMachine(*parse_inputs(data))
     for i in range(presses):
         state_machine.press_button()
     return state_machine.high_pulse_count * state_machine.low_pulse_count
 
 def calc_state_machine_presses_til_on(data: list[str]) -> int:
-    nodes = parse_inputs(data)
-    state_machine = StateMachine(nodes)
+    state_machine = StateMachine(*parse_inputs(data))
     while not state_machine.presses_until_on:
         state_machine.press_button()
     return state_machine.presses_until_on
@@ -201,7 +149,7 @@ test_input2 = [
     '&con -> output',
 ]
 
-@pytest.mark.parametrize('data, presses, expected', [
+@parametrize('data, presses, expected', [
     (test_input1, 1000, 32000000),
     (test_input2, 1000, 11687500),
 ])
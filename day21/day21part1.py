@@ -1,61 +1,64 @@
 import time
 from pathlib import Path
 
-import pytest
+from aoc.grid import Grid
+from aoc.gridfile import GridBuffer
+from aoc.testing import parametrize
 
 
 def run():
     with open(Path(__file__).parent / 'Input.txt') as f:
-        lines = f.read().split('\n')
+        lines = parse(f.read())
 
-    start_time = time.time()
-    result = take_steps_and_count(lines, 64)
-    print(f'Day21 part 1: {result} (in {(time.time() - start_time):.2f}s)')
+    start_time = time.perf_counter()
+    result = solve_part1(lines)
+    print(f'Day21 part 1: {result} (in {(time.perf_counter() - start_time):.2f}s)')
 
-def take_steps_and_count(grid: list[str], steps: int) -> int:
+def parse(source: str) -> Grid:
+    return Grid.from_text(source)
+
+def parse_grids(grids: list[GridBuffer]) -> Grid:
+    return Grid.from_buffer(grids[0])
+
+def solve_part1(grid: Grid) -> int:
+    return take_steps_and_count(grid, 64)
+
+def take_steps_and_count(grid: Grid, steps: int) -> int:
+    reachable = occupied_indices(grid)
     for _ in range(steps):
-        grid = take_step(grid)
-    result = count_o_positions(grid)
-    return result
-
-def count_o_positions(grid: list[str]) -> int:
-    return sum([ 1 if char == 'O' else 0 for row in grid for char in row ])
-
-def take_step(grid: list[str]) -> list[str]:
-    # print()
-    # print('Before:')
-    # for row in grid:
-    #     print(row)
-    grid_height = len(grid)
-    grid_width = len(grid[0])
-    next_step: list[list[str]] = [[''] * grid_width for _ in range(grid_height)]
-    for i, row in enumerate(grid):
-        for j, char in enumerate(row):
+        reachable = step_from(grid, reachable)
+    return len(reachable)
+
+OCCUPIED = frozenset(b'SO')
+ROCK = ord('#')
+CLEARED = bytes.maketrans(b'SO', b'..')
+
+def occupied_indices(grid: Grid) -> set[int]:
+    return {index for index, cell in enumerate(grid.cells) if cell in OCCUPIED}
+
+def step_from(grid: Grid, reachable: set[int]) -> set[int]:
+    # flat indices of the garden plots next to any of the reachable ones, so a step only visits the cells
+    # around the elf rather than every cell of the grid
+    cells, offsets = grid.cells, grid.offsets()
+    return {index + offset for index in reachable for offset in offsets
+            if grid.contains_index(index + offset) and cells[index + offset] != ROCK}
+
+def take_step_from_frontier(grid: Grid) -> Grid:
+    # take_step (kept as the reference for aoc.differential) by way of step_from
+    next_step = Grid(bytearray(grid.cells).translate(CLEARED), grid.width, grid.height, row_step=grid.row_step)
+    for index in step_from(grid, occupied_indices(grid)):
+        next_step.cells[index] = ord('O')
+    return next_step
+
+def take_step(grid: Grid) -> Grid:
+    next_step = Grid.filled(grid.width, grid.height, '.')
+    for i in range(grid.height):
+        for j, char in enumerate(grid.row(i)):
             if char == '#':
-                next_step[i][j] = '#'
-            elif any([n in ['S', 'O'] for n in get_neighbours(i, j, grid)]):
-                next_step[i][j] = 'O'
-            else:
-                next_step[i][j] = '.'
-    grid = [ ''.join(row) for row in next_step ]
-    # print()
-    # print('After:')
-    # for row in grid:
-    #     print(row)
-    return grid
-
-def get_neighbours(i, j, grid) -> list[str]:
-    return [grid[x][y] for x, y in get_neighbouring_positions(i, j, len(grid), len(grid[0])) ]
-
-def get_neighbouring_positions(i, j, grid_height, grid_width) -> list[(int, int)]:
-    potential_neighbours = [
-        (i - 1, j),
-        (i, j - 1),
-        (i, j + 1),
-        (i + 1, j),
-    ]
-    results = [(x, y) for x, y in potential_neighbours if 0 <= x < grid_height and 0 <= y < grid_width]
-    return results
+                next_step[i, j] = '#'
+            elif any(grid[n] in 'SO' for n in grid.neighbours(i, j)):
+                next_step[i, j] = 'O'
+    return next_step
 
 test_data = [
     '...........',
@@ -71,15 +74,21 @@ test_data = [
     '...........',
 ]
 
-@pytest.mark.parametrize('grid, steps, expected', [
+@parametrize('grid, steps, expected', [
     (test_data, 1, 2),
     (test_data, 2, 4),
     (test_data, 3, 6),
     (test_data, 6, 16),
 ])
 def test_take_steps_and_count(grid, steps, expected):
-    actual = take_steps_and_count(test_data, steps)
+    actual = take_steps_and_count(Grid.from_rows(grid), steps)
     assert actual == expected
 
+def test_take_step_from_frontier():
+    grid = Grid.from_rows(test_data)
+    for _ in range(3):
+        assert take_step_from_frontier(grid) == take_step(grid)
+        grid = take_step(grid)
+
 if __name__ == '__main__':
     run()
@@ -1,56 +1,55 @@
-from day01 import day01part1, day01part2
-from day02 import day02part1, day02part2
-from day03 import day03part1, day03part2
-from day04 import day04part1, day04part2
-from day05 import day05part1, day05part2
-from day06 import day06
-from day07 import day07part1, day07part2
-from day08 import day08part1, day08part2
-from day09 import day09part1, day09part2
-from day10 import day10part1, day10part2
-from day11 import day11
-from day12 import day12
-from day13 import day13
-from day14 import day14
-from day15 import day15
-from day16 import day16
-from day18 import day18
-from day19 import day19part1, day19part2
-from day20 import day20
-from day21 import day21part1
+import argparse
+import sys
+from contextlib import nullcontext, redirect_stdout
+from datetime import datetime, timezone
+from pathlib import Path
 
+from aoc.days import DAYS, parse_day_selector
+from aoc.runner import find_over_budget, run_days, write_records
 
-def main():
-    day01part1.run()
-    day01part2.run()
-    day02part1.run()
-    day02part2.run()
-    day03part1.run()
-    day03part2.run()
-    day04part1.run()
-    day04part2.run()
-    day05part1.run()
-    day05part2.run()
-    day06.run()
-    day07part1.run()
-    day07part2.run()
-    day08part1.run()
-    day08part2.run()
-    day09part1.run()
-    day09part2.run()
-    day10part1.run()
-    day10part2.run()
-    day11.run()
-    day12.run()
-    day13.run()
-    day14.run()
-    day15.run()
-    day16.run()
-    day18.run()
-    day19part1.run()
-    day19part2.run()
-    day20.run()
-    day21part1.run()
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description='Advent of Code 2023 solutions')
+    parser.add_argument('--days', help='days to run, e.g. 12,14,16-21 (default: all)')
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help='worker processes to use (default: one per core, 1 runs in-process)')
+    parser.add_argument('--profile', nargs='?', const='profiles', type=Path, metavar='DIR',
+                        help='profile each day, writing DIR/dayNN.pstats and DIR/dayNN.collapsed (default: profiles)')
+    parser.add_argument('--memory', action='store_true',
+                        help='report the tracemalloc peak and RSS high-water mark of each parse and solve')
+    parser.add_argument('--memory-budget', action='append', default=[], metavar='DAY=MiB',
+                        help='fail if a day\'s tracemalloc peak exceeds this, overriding its default budget '
+                             '(implies --memory, repeatable)')
+    parser.add_argument('--jsonl', metavar='PATH',
+                        help='append one JSON object per day and part (answer, parse_ns, solve_ns, peak memory, '
+                             'host) to PATH, or write them to stdout with - (the usual report goes to stderr)')
+    parser.add_argument('--no-cache', action='store_true', help='neither read nor write cached answers')
+    parser.add_argument('--refresh', action='store_true', help='solve every day again, replacing cached answers')
+    args = parser.parse_args(argv)
+
+    days = parse_day_selector(args.days)
+    track_memory = args.memory or bool(args.memory_budget)
+    cache = None
+    if not args.no_cache:
+        from aoc.cache import ResultCache
+        cache = ResultCache()
+    started_at = datetime.now(timezone.utc).isoformat(timespec='seconds')
+    with redirect_stdout(sys.stderr) if args.jsonl == '-' else nullcontext():
+        results = run_days(days, args.jobs, args.profile, track_memory, cache, args.refresh)
+    if args.jsonl == '-':
+        write_records(results, sys.stdout, started_at)
+    elif args.jsonl:
+        with open(args.jsonl, 'a') as out:
+            write_records(results, out, started_at)
+    if track_memory:
+        from aoc.memory import parse_budgets
+        budgets = {day.number: day.memory_budget for day in DAYS.values() if day.memory_budget is not None}
+        budgets.update(parse_budgets(args.memory_budget))
+        failures = find_over_budget(results, budgets)
+        for failure in failures:
+            print(failure)
+        if failures:
+            sys.exit(1)
 
 if __name__ == '__main__':
     main()